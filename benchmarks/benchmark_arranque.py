@@ -0,0 +1,151 @@
+"""
+Benchmark del tiempo de arranque de la aplicación.
+
+Mide, en procesos nuevos (arranque en frío del intérprete cada vez):
+    - importaciones: tiempo de importar main.py (la interfaz sin crear la
+      ventana) y src.simulador.cli (la línea de comandos), y qué módulos
+      pesados (reportlab, matplotlib, numpy, screeninfo) quedaron cargados
+    - primera_ventana: tiempo desde que se lanza el proceso hasta que la
+      ventana principal terminó de dibujarse, ejecutando desde el código
+      fuente o el ejecutable generado con simulador.spec (--ejecutable).
+      Necesita una pantalla (sin ella se informa el error)
+
+La aplicación se cierra sola al mostrar la ventana cuando la variable de
+entorno SIMULADOR_ARRANQUE tiene la ruta de un archivo: ahí escribe el
+instante en que terminó de dibujarla (ver main.py).
+
+Uso (desde la raíz del proyecto):
+    python -m benchmarks.benchmark_arranque
+    python -m benchmarks.benchmark_arranque --ejecutable dist/linux/Simulador_Planificacion --repeticiones 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Módulos pesados cuya carga se informa: la interfaz necesita customtkinter y
+# tkinter, el resto se tiene que cargar recién al usarse
+MODULOS_PESADOS = ('reportlab', 'matplotlib', 'numpy', 'screeninfo', 'customtkinter', 'tkinter')
+
+# Importa el módulo en un intérprete nuevo y reporta el tiempo y los módulos pesados cargados
+CODIGO_IMPORTACION = """
+import json, sys, time
+inicio = time.perf_counter()
+import {modulo}
+tiempo = time.perf_counter() - inicio
+pesados = sorted(m for m in {pesados!r} if m in sys.modules)
+print(json.dumps({{'tiempo': tiempo, 'modulos_cargados': len(sys.modules), 'pesados': pesados}}))
+"""
+
+
+def medir_importacion(modulo, repeticiones):
+    """
+    Mide el tiempo de importar un módulo en un intérprete nuevo.
+
+    Returns:
+        Diccionario con los tiempos de cada repetición, la mediana, la
+        cantidad de módulos cargados y los módulos pesados importados
+    """
+    codigo = CODIGO_IMPORTACION.format(modulo=modulo, pesados=MODULOS_PESADOS)
+    tiempos = []
+    for _ in range(repeticiones):
+        salida = subprocess.run([sys.executable, '-c', codigo], cwd=RAIZ, capture_output=True, text=True)
+        if salida.returncode != 0:
+            return {'error': salida.stderr.strip().splitlines()[-1] if salida.stderr else 'error'}
+        datos = json.loads(salida.stdout)
+        tiempos.append(datos['tiempo'])
+    return {
+        'tiempos': tiempos,
+        'mediana': statistics.median(tiempos),
+        'modulos_cargados': datos['modulos_cargados'],
+        'pesados': datos['pesados']
+    }
+
+
+def medir_primera_ventana(comando, repeticiones, limite=120):
+    """
+    Mide el tiempo hasta que la ventana principal se muestra.
+
+    Args:
+        comando: Lista con el comando que lanza la aplicación
+        repeticiones: Cantidad de arranques
+        limite: Segundos máximos de espera por arranque
+
+    Returns:
+        Diccionario con los tiempos de cada arranque y la mediana
+    """
+    tiempos = []
+    for _ in range(repeticiones):
+        with tempfile.TemporaryDirectory() as directorio:
+            ruta = os.path.join(directorio, 'arranque.txt')
+            entorno = dict(os.environ, SIMULADOR_ARRANQUE=ruta)
+
+            inicio = time.time()
+            try:
+                salida = subprocess.run(comando, cwd=RAIZ, env=entorno, capture_output=True, text=True,
+                                        timeout=limite)
+            except subprocess.TimeoutExpired:
+                return {'error': f"la ventana no se mostró en {limite} segundos"}
+            if not os.path.exists(ruta):
+                error = salida.stderr.strip().splitlines()[-1] if salida.stderr.strip() else 'sin ventana'
+                return {'error': error}
+            with open(ruta, encoding='utf-8') as archivo:
+                tiempos.append(float(archivo.read()) - inicio)
+    return {
+        'tiempos': tiempos,
+        'mediana': statistics.median(tiempos)
+    }
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Benchmark del tiempo de arranque de la aplicación")
+    parser.add_argument('--repeticiones', type=int, default=3)
+    parser.add_argument('--ejecutable', help="Ejecutable generado con simulador.spec para medir también su arranque")
+    parser.add_argument('--sin-ventana', action='store_true', help="Medir solo las importaciones")
+    parser.add_argument('--salida', help="Ruta del reporte JSON (por defecto solo se muestra)")
+    args = parser.parse_args(argumentos)
+    repeticiones = max(1, args.repeticiones)
+
+    reporte = {
+        'python': sys.version.split()[0],
+        'importaciones': {
+            'main': medir_importacion('main', repeticiones),
+            'src.simulador.cli': medir_importacion('src.simulador.cli', repeticiones)
+        },
+        'primera_ventana': {}
+    }
+    if not args.sin_ventana:
+        reporte['primera_ventana']['fuente'] = medir_primera_ventana([sys.executable, 'main.py'], repeticiones)
+        if args.ejecutable:
+            reporte['primera_ventana']['ejecutable'] = medir_primera_ventana(
+                [os.path.abspath(args.ejecutable)], repeticiones)
+
+    for nombre, medicion in reporte['importaciones'].items():
+        if 'error' in medicion:
+            print(f"importar {nombre:<20} error: {medicion['error']}")
+        else:
+            pesados = ', '.join(medicion['pesados']) or 'ninguno'
+            print(f"importar {nombre:<20} {medicion['mediana']:7.3f}s  "
+                  f"{medicion['modulos_cargados']} módulos  pesados: {pesados}")
+    for nombre, medicion in reporte['primera_ventana'].items():
+        if 'error' in medicion:
+            print(f"primera ventana ({nombre})  error: {medicion['error']}")
+        else:
+            print(f"primera ventana ({nombre})  {medicion['mediana']:7.3f}s")
+
+    if args.salida:
+        with open(args.salida, 'w', encoding='utf-8') as archivo:
+            json.dump(reporte, archivo, ensure_ascii=False, indent=2)
+        print(f"Reporte escrito en: {args.salida}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
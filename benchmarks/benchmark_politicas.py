@@ -0,0 +1,276 @@
+"""
+Benchmark de las políticas de planificación.
+
+Mide, para cada política (FCFS, SPN, SRTN, RR, PE), tamaño de tanda y perfil
+de ráfagas:
+    - ejecución: algoritmo.ejecutar()
+    - procesamiento: armado de los resultados para la interfaz
+    - pdf: exportación del reporte (solo hasta --pdf-hasta procesos)
+además de eventos por segundo y el pico de memoria de la simulación, y
+escribe un reporte JSON. Con --instrumentar agrega el tiempo por fase del
+bucle y los eventos por tipo (ver algoritmos.instrumentacion).
+
+Las tandas se generan con generador_tandas y una semilla fija, así que dos
+corridas del benchmark miden exactamente las mismas simulaciones.
+
+Uso (desde la raíz del proyecto):
+    python -m benchmarks.benchmark_politicas
+    python -m benchmarks.benchmark_politicas --tamanos 5 1000 --politicas RR SRTN
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from src.simulador.generador_tandas import generar_tanda
+from src.simulador.simulador import Simulador
+from src.simulador.algoritmos.FCFS import FCFS
+from src.simulador.algoritmos.SPN import SPN
+from src.simulador.algoritmos.SRTN import SRTN
+from src.simulador.algoritmos.RR import RR
+from src.simulador.algoritmos.PE import PE
+from src.simulador.algoritmos.instrumentacion import formatear_instrumentacion
+
+POLITICAS = ('FCFS', 'SPN', 'SRTN', 'RR', 'PE')
+TAMANOS = (5, 100, 1000, 10000, 100000)
+
+# Perfiles de ráfagas. La tasa de llegada mantiene la CPU ocupada cerca del
+# 80% (ráfagas medias * duración media de CPU más las demoras del SO), así la
+# cola de listos no crece sin límite con el tamaño de la tanda
+PERFILES = {
+    'cortas': {
+        'duracion_cpu': 'exponencial',
+        'media_cpu': 3,
+        'rafagas_cpu': (1, 3),
+        'tasa_llegada': 0.08
+    },
+    'largas': {
+        'duracion_cpu': 'lognormal',
+        'media_cpu': 50,
+        'rafagas_cpu': (2, 8),
+        'tasa_llegada': 0.0035
+    }
+}
+
+# Parámetros del sistema usados en todas las corridas
+TIP, TCP, TFP, QUANTUM = 1, 1, 1, 4
+SEMILLA = 1
+
+
+def crear_algoritmo(politica, procesos):
+    """Crea el planificador de la política con los parámetros del benchmark."""
+    if politica == 'FCFS':
+        return FCFS(procesos, TIP, TCP, TFP)
+    elif politica == 'SPN':
+        return SPN(procesos, TIP, TCP, TFP)
+    elif politica == 'SRTN':
+        return SRTN(procesos, TIP, TCP, TFP)
+    elif politica == 'RR':
+        return RR(procesos, TIP, TCP, TFP, QUANTUM)
+    else:
+        return PE(procesos, TIP, TCP, TFP)
+
+
+def procesar_resultados(simulador, politica):
+    """Arma los resultados para la interfaz, como al final de ejecutar_*."""
+    procesadores = {
+        'FCFS': simulador._procesar_resultados_fcfs,
+        'SPN': simulador._procesar_resultados_spn,
+        'SRTN': simulador._procesar_resultados_srtn,
+        'RR': simulador._procesar_resultados_rr,
+        'PE': simulador._procesar_resultados_pe
+    }
+    return procesadores[politica]()
+
+
+def medir_caso(politica, procesos_datos, repeticiones=1, con_pdf=False, con_memoria=True,
+               con_instrumentacion=False):
+    """
+    Mide una simulación.
+
+    Args:
+        politica: Nombre de la política
+        procesos_datos: Lista de diccionarios con datos de procesos
+        repeticiones: Veces que se repite la medición (se toma el mínimo)
+        con_pdf: Si es True, también mide la exportación del PDF
+        con_memoria: Si es True, repite la simulación con tracemalloc para
+                     medir el pico de memoria (no se hace durante la medición
+                     de tiempos porque la vuelve varias veces más lenta)
+        con_instrumentacion: Si es True, repite la simulación instrumentada
+                             para medir el tiempo por fase (tampoco se hace
+                             durante la medición de tiempos)
+
+    Returns:
+        Diccionario con las mediciones
+    """
+    simulador = Simulador(generar_pdf=False, cache=False)
+    tiempo_ejecucion = tiempo_procesamiento = float('inf')
+
+    for _ in range(repeticiones):
+        procesos = simulador.crear_procesos_desde_datos(procesos_datos)
+        algoritmo = crear_algoritmo(politica, procesos)
+
+        inicio = time.perf_counter()
+        algoritmo.ejecutar()
+        tiempo_ejecucion = min(tiempo_ejecucion, time.perf_counter() - inicio)
+
+        simulador.procesos = procesos
+        simulador.algoritmo_actual = algoritmo
+        inicio = time.perf_counter()
+        resultados = procesar_resultados(simulador, politica)
+        tiempo_procesamiento = min(tiempo_procesamiento, time.perf_counter() - inicio)
+
+    eventos = len(algoritmo.resultados)
+    medicion = {
+        'politica': politica,
+        'procesos': len(procesos_datos),
+        'eventos': eventos,
+        'tiempo_simulado': resultados['tiempo_total'],
+        'tiempo_ejecucion': tiempo_ejecucion,
+        'tiempo_procesamiento': tiempo_procesamiento,
+        'eventos_por_segundo': eventos / tiempo_ejecucion if tiempo_ejecucion > 0 else None,
+        'tiempo_pdf': None,
+        'memoria_pico': None,
+        'instrumentacion': None
+    }
+
+    if con_pdf:
+        inicio = time.perf_counter()
+        ruta_pdf = simulador.exportar_pdf()
+        medicion['tiempo_pdf'] = time.perf_counter() - inicio
+        # No acumular reportes en el directorio de salida
+        if ruta_pdf and os.path.exists(ruta_pdf):
+            os.remove(ruta_pdf)
+
+    if con_memoria:
+        # Liberar la corrida anterior antes de medir
+        del algoritmo, resultados
+        simulador.algoritmo_actual = simulador.procesos = None
+
+        tracemalloc.start()
+        try:
+            procesos = simulador.crear_procesos_desde_datos(procesos_datos)
+            crear_algoritmo(politica, procesos).ejecutar()
+            medicion['memoria_pico'] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    if con_instrumentacion:
+        procesos = simulador.crear_procesos_desde_datos(procesos_datos)
+        algoritmo = crear_algoritmo(politica, procesos)
+        instrumentacion = algoritmo.instrumentar()
+        algoritmo.ejecutar()
+        medicion['instrumentacion'] = instrumentacion.resumen()
+
+    return medicion
+
+
+def ejecutar_benchmark(politicas=POLITICAS, tamanos=TAMANOS, perfiles=tuple(PERFILES), repeticiones=1,
+                       pdf_hasta=1000, con_memoria=True, con_instrumentacion=False, mostrar=print):
+    """
+    Ejecuta el benchmark completo.
+
+    Args:
+        politicas: Políticas a medir
+        tamanos: Cantidades de procesos de las tandas
+        perfiles: Nombres de perfiles de PERFILES
+        repeticiones: Repeticiones de cada medición de tiempo
+        pdf_hasta: Tamaño máximo de tanda con el que se mide el PDF (0 = nunca)
+        con_memoria: Si es True, mide el pico de memoria
+        con_instrumentacion: Si es True, mide el tiempo por fase del bucle
+        mostrar: Función que recibe una línea de progreso (None = silencio)
+
+    Returns:
+        Diccionario del reporte (ver escribir_reporte)
+    """
+    mediciones = []
+    for perfil in perfiles:
+        for tamano in tamanos:
+            # Una sola tanda por perfil y tamaño para todas las políticas
+            procesos_datos = list(generar_tanda(tamano, semilla=SEMILLA, **PERFILES[perfil]))
+            for politica in politicas:
+                medicion = medir_caso(politica, procesos_datos, repeticiones,
+                                      con_pdf=tamano <= pdf_hasta, con_memoria=con_memoria,
+                                      con_instrumentacion=con_instrumentacion)
+                medicion['perfil'] = perfil
+                mediciones.append(medicion)
+                if mostrar:
+                    mostrar(formatear_medicion(medicion))
+                    if medicion['instrumentacion'] is not None:
+                        mostrar(formatear_instrumentacion(medicion['instrumentacion']) + "\n")
+
+    return {
+        'fecha': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'parametros': {
+            'tip': TIP,
+            'tcp': TCP,
+            'tfp': TFP,
+            'quantum': QUANTUM,
+            'semilla': SEMILLA,
+            'repeticiones': repeticiones,
+            'perfiles': {perfil: PERFILES[perfil] for perfil in perfiles}
+        },
+        'mediciones': mediciones
+    }
+
+
+def formatear_medicion(medicion):
+    """Retorna una línea legible con una medición."""
+    linea = (f"{medicion['perfil']:>7} {medicion['politica']:>5} {medicion['procesos']:>7} proc  "
+             f"{medicion['eventos']:>9} ev  ejecución {medicion['tiempo_ejecucion']:8.3f}s  "
+             f"procesamiento {medicion['tiempo_procesamiento']:7.3f}s  "
+             f"{medicion['eventos_por_segundo'] or 0:>10,.0f} ev/s")
+    if medicion['tiempo_pdf'] is not None:
+        linea += f"  pdf {medicion['tiempo_pdf']:7.3f}s"
+    if medicion['memoria_pico'] is not None:
+        linea += f"  pico {medicion['memoria_pico'] / (1024 * 1024):7.1f} MB"
+    return linea
+
+
+def escribir_reporte(reporte, ruta):
+    """Escribe el reporte como JSON."""
+    directorio = os.path.dirname(ruta)
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        json.dump(reporte, archivo, ensure_ascii=False, indent=2)
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description="Benchmark de las políticas de planificación")
+    parser.add_argument('--politicas', nargs='+', choices=POLITICAS, default=list(POLITICAS))
+    parser.add_argument('--tamanos', nargs='+', type=int, default=list(TAMANOS),
+                        help="Cantidades de procesos (por defecto: %(default)s)")
+    parser.add_argument('--perfiles', nargs='+', choices=list(PERFILES), default=list(PERFILES))
+    parser.add_argument('--repeticiones', type=int, default=1,
+                        help="Repeticiones de cada medición de tiempo; se toma el mínimo")
+    parser.add_argument('--pdf-hasta', type=int, default=1000,
+                        help="Medir el PDF solo con tandas de hasta N procesos (0 = nunca)")
+    parser.add_argument('--sin-memoria', action='store_true',
+                        help="No medir el pico de memoria (evita repetir cada simulación)")
+    parser.add_argument('--instrumentar', action='store_true',
+                        help="Medir también el tiempo por fase del bucle y los eventos por tipo")
+    parser.add_argument('--salida', help="Ruta del reporte JSON (por defecto en data/output)")
+    args = parser.parse_args(argumentos)
+
+    reporte = ejecutar_benchmark(args.politicas, args.tamanos, args.perfiles, max(1, args.repeticiones),
+                                 args.pdf_hasta, not args.sin_memoria, args.instrumentar)
+
+    ruta = args.salida
+    if ruta is None:
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        ruta = os.path.join(Simulador(generar_pdf=False, cache=False)._directorio_salida(), f"benchmark_{timestamp}.json")
+    escribir_reporte(reporte, ruta)
+    print(f"Reporte escrito en: {ruta}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
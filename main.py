@@ -1,15 +1,39 @@
+import multiprocessing
+import os
+import time
+
 import customtkinter as ctk
 from src.ui.main_window import VentanaPrincipal
 
+def _registrar_arranque(app, ruta):
+    """
+    Escribe en `ruta` el instante (time.time()) en que la primera ventana
+    terminó de dibujarse y cierra la aplicación. Lo usa
+    benchmarks/benchmark_arranque.py para medir el tiempo de arranque.
+    """
+    app.update()
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        archivo.write(repr(time.time()))
+    app.destroy()
+
 def main():
     """Función principal de la aplicación."""
     # Configuración inicial de CustomTkinter
     ctk.set_appearance_mode("dark")
     ctk.set_default_color_theme("blue")
-    
+
     # Crear y ejecutar la ventana principal
     app = VentanaPrincipal()
+
+    # Medición de arranque: cerrar apenas se muestra la ventana
+    ruta_arranque = os.environ.get('SIMULADOR_ARRANQUE')
+    if ruta_arranque:
+        app.after_idle(_registrar_arranque, app, ruta_arranque)
+
     app.mainloop()
 
 if __name__ == "__main__":
+    # Necesario para los procesos del pool (comparar_politicas, ejecutar_lote)
+    # cuando la aplicación se empaqueta como ejecutable en Windows
+    multiprocessing.freeze_support()
     main()
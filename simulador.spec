@@ -28,8 +28,6 @@ a = Analysis(
         'src.simulador.algoritmos.SPN',
         'src.simulador.algoritmos.SRTN',
         'customtkinter',
-        'matplotlib',
-        'numpy',
         'screeninfo',
         'reportlab',
         'reportlab.pdfgen',
@@ -69,7 +67,9 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # No se usan: incluirlos solo agranda el ejecutable, que se descomprime
+    # completo en cada arranque
+    excludes=['matplotlib', 'numpy'],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
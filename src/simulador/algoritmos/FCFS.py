@@ -1,22 +1,40 @@
+from collections import deque
 
-class FCFS:
-    def __init__(self, procesos, tiempo_tip, tiempo_tcp, tiempo_tfp):
+from .cola_bloqueados import ColaBloqueados
+from .cola_listos import ColaFIFO
+from .planificador import Planificador
+from .registro_eventos import crear_destino_eventos
+
+
+class FCFS(Planificador):
+    def __init__(self, procesos, tiempo_tip, tiempo_tcp, tiempo_tfp, tiempo_maximo=None, max_eventos=None,
+                 destino_eventos=None):
         self.procesos = procesos
+        # Índice de llegadas ordenado por tiempo de arribo
+        self.preparar_llegadas()
         # Instante de tiempo actual del puntero
         self.tiempo_actual = 0
         # No hay procesos ejecutandose en la primera instancia de tiempo
         self.proceso_actual = None
         # Colas vacias
-        self.cola_listos = []
-        self.procesos_bloqueados = []
+        self.cola_listos = ColaFIFO()
+        self.procesos_bloqueados = ColaBloqueados()
         self.procesos_terminados = []
-        # Lista para guardar los eventos que fueron sucediendo
-        self.resultados = []
+        # Procesos cumpliendo su TFP, en el orden en que terminaron
+        self.procesos_terminando = deque()
+        # Destino de los eventos que van sucediendo (por defecto se guardan todos)
+        self.resultados = crear_destino_eventos(destino_eventos)
 
         self.tiempo_tip = tiempo_tip
         self.tiempo_tcp = tiempo_tcp
         self.tiempo_tfp = tiempo_tfp
 
+        # Horizonte de la simulación (None = sin límite)
+        self.tiempo_maximo = tiempo_maximo
+        self.max_eventos = max_eventos
+        # Indica si la simulación se cortó antes de terminar todos los procesos
+        self.truncado = False
+
         self.tiempo_restante_bloqueo = 0
         self.tipo_bloqueo = None
         
@@ -24,105 +42,59 @@ class FCFS:
         self.cpu_proc = 0  # Tiempo real de CPU ejecutando procesos
         self.cpu_so = 0    # Tiempo real de CPU en labores del SO
         self.cpu_idle = 0  # Tiempo real de CPU desocupada
+        self.cambios_contexto = 0  # Cantidad de cambios de contexto (TCP aplicados)
         
         # Tiempos de referencia para cálculos
         self.t_primer_arribo = None
         self.t_ultimo_tfp = None
         
-        # Contadores por proceso
-        self.cpu_proc_por_proceso = {}
-        self.t_arribo_por_proceso = {}
-        self.t_fin_por_proceso = {}
-        self.t_listo_por_proceso = {}
-
-    def procesar_llegadas(self):
-        for proceso in self.procesos:
-            if proceso.tiempo_arrivo == self.tiempo_actual:
-                self.insertar_ordenado(proceso)
-                proceso.estado = "listo"
-                
-                # Registrar primer arribo
-                if self.t_primer_arribo is None:
-                    self.t_primer_arribo = self.tiempo_actual
-                
-                # Registrar tiempo de arribo del proceso
-                self.t_arribo_por_proceso[proceso.nombre] = self.tiempo_actual
-                self.cpu_proc_por_proceso[proceso.nombre] = 0
-                self.t_listo_por_proceso[proceso.nombre] = 0
-
-                # Registrar eventos
-                self.resultados.append({
-                    'tiempo': self.tiempo_actual,
-                    'proceso': proceso.nombre,
-                    'evento': 'llegada',
-                    'estado': 'arrivo'
-                })
+        # Contadores por proceso, indexados por pid
+        self.preparar_contadores()
 
     def insertar_ordenado(self, proceso):
         """
         Inserta el proceso en la cola de listos, manteniendo el orden
-        de arrivo de FCFS
+        de arrivo de FCFS.
+        Los procesos llegan en orden de tiempo, por lo que ninguno de los
+        que ya estan en la cola arribo despues: alcanza con encolar al final.
         """
-        if len(self.cola_listos) == 0:
-            self.cola_listos.append(proceso)
-            return
-
-        for i, proceso_en_cola in enumerate(self.cola_listos):
-            if proceso.tiempo_arrivo < proceso_en_cola.tiempo_arrivo:
-                # Insertar antes del proceso actual
-                self.cola_listos.insert(i, proceso)
-                return
-
-        self.cola_listos.append(proceso)
-
-
-    def ejecutar(self):
-        # Límite de seguridad para evitar bucles infinitos
-        tiempo_maximo = 1000
-        iteraciones = 0
+        self.cola_listos.insertar(proceso)
 
-        while self.hay_procesos_pendientes() and iteraciones < tiempo_maximo:
-            iteraciones += 1
 
-            self.procesar_llegadas()
+    def procesar_tick(self):
+        """Procesa un tick de simulación en el que ocurre algún evento."""
+        self.procesar_llegadas()
 
-            # Procesar tiempo de TIP/TCP/TFP
-            if self.procesar_tiempo_bloqueo():
-                # Procesar procesos bloqueados incluso si hay TIP/TCP/TFP activo
-                self.procesar_procesos_bloqueados()
-                self.tiempo_actual += 1
-                continue
+        # Procesar tiempo de TIP/TCP/TFP
+        if self.procesar_tiempo_bloqueo():
+            # Procesar procesos bloqueados incluso si hay TIP/TCP/TFP activo
+            self.procesar_procesos_bloqueados()
+            self.tiempo_actual += 1
+            return
 
-            # Incrementar tiempo de espera para procesos en cola de listos
-            for proceso in self.cola_listos:
-                proceso.tiempo_en_listo += 1
-                # Acumular tiempo en estado listo (solo después de pagar TIP)
-                if proceso.nombre in self.t_listo_por_proceso:
-                    self.t_listo_por_proceso[proceso.nombre] += 1
+        # Los procesos en cola de listos acumulan un tick de espera
+        # (se les suma a su tiempo en listo cuando salen de la cola)
+        self.cola_listos.acumular_espera(1)
 
-            # Si no hay proceso ejecutandose, selecciona uno
-            if self.proceso_actual is None:
-                self.seleccionar_siguiente_proceso()
+        # Si no hay proceso ejecutandose, selecciona uno
+        if self.proceso_actual is None:
+            self.seleccionar_siguiente_proceso()
 
-            # Si hay proceso ejecutandose, ejecutarlo
-            if self.proceso_actual is not None:
-                self.ejecutar_proceso_actual()
+        # Si hay proceso ejecutandose, ejecutarlo
+        if self.proceso_actual is not None:
+            self.ejecutar_proceso_actual()
 
-            # Procesar procesos bloqueados
-            self.procesar_procesos_bloqueados()
+        # Procesar procesos bloqueados
+        self.procesar_procesos_bloqueados()
 
-            # Calcular CPU_idle: si no hay proceso ejecutándose ni labores del SO
-            if (self.proceso_actual is None and 
-                self.tiempo_restante_bloqueo == 0 and 
-                len(self.cola_listos) == 0):
-                self.cpu_idle += 1
+        # Calcular CPU_idle: si no hay proceso ejecutándose ni labores del SO
+        if (self.proceso_actual is None and 
+            self.tiempo_restante_bloqueo == 0 and 
+            len(self.cola_listos) == 0):
+            self.cpu_idle += 1
 
-            # Avanzar una unidad de tiempo
-            self.tiempo_actual += 1
-        
-        if iteraciones >= tiempo_maximo:
-            print(f"⚠️ Advertencia: Simulación terminada por límite de tiempo ({tiempo_maximo} iteraciones)")
-            print(f"Estado final - Tiempo: {self.tiempo_actual}, Iteraciones: {iteraciones}")
+        # Avanzar una unidad de tiempo
+        self.tiempo_actual += 1
     
     def obtener_estadisticas_cpu(self):
         """Retorna las estadísticas de CPU calculadas correctamente."""
@@ -149,10 +121,10 @@ class FCFS:
             't_total': t_total,
             't_primer_arribo': self.t_primer_arribo,
             't_ultimo_tfp': self.t_ultimo_tfp,
-            'cpu_proc_por_proceso': self.cpu_proc_por_proceso,
-            't_arribo_por_proceso': self.t_arribo_por_proceso,
-            't_fin_por_proceso': self.t_fin_por_proceso,
-            't_listo_por_proceso': self.t_listo_por_proceso
+            'cpu_proc_por_proceso': self.contadores_por_nombre(self.cpu_proc_por_proceso),
+            't_arribo_por_proceso': self.contadores_por_nombre(self.t_arribo_por_proceso),
+            't_fin_por_proceso': self.contadores_por_nombre(self.t_fin_por_proceso),
+            't_listo_por_proceso': self.contadores_por_nombre(self.t_listo_por_proceso)
         }
 
 
@@ -163,7 +135,7 @@ class FCFS:
         # Se consume una unidad de tiempo de CPU ejecutando proceso
         self.proceso_actual.duracion_rafagas_cpu -= 1
         self.cpu_proc += 1  # Acumular tiempo real de CPU ejecutando procesos
-        self.cpu_proc_por_proceso[self.proceso_actual.nombre] += 1  # Acumular por proceso
+        self.cpu_proc_por_proceso[self.proceso_actual.pid] += 1  # Acumular por proceso
 
         if self.proceso_actual.duracion_rafagas_cpu == 0:
             self.proceso_actual.cantidad_rafagas_cpu -= 1
@@ -176,7 +148,7 @@ class FCFS:
     def seleccionar_siguiente_proceso(self):
         if len(self.cola_listos) > 0:
             # Agarrar el primer proceso de la cola
-            self.proceso_actual = self.cola_listos.pop(0)
+            self.proceso_actual = self.cola_listos.extraer()
             # Aplicar TIP o TCP segun corresponda
             if self.proceso_actual.proceso_nuevo:
                 self.aplicar_tip()
@@ -188,24 +160,6 @@ class FCFS:
             # El proceso solo empezará a ejecutarse después de que termine TIP/TCP
 
     
-    def hay_procesos_pendientes(self):
-        """
-        Verifica si quedan trabajos por hacer:
-            - hay procesos en cola de listos
-            - hay procesos bloqueados
-            - hay procesos ejecutandose
-            - hay procesos que aun no llegaron a su tiempo total
-            de ejecucion
-        """
-        resultado = (len(self.cola_listos) > 0 or 
-        len(self.procesos_bloqueados) > 0 or (self.proceso_actual is not None) or
-        (any(p.tiempo_arrivo > self.tiempo_actual for p in self.procesos)) or
-        (any(p.estado == "terminando" for p in self.procesos)))
-        
-        
-        return resultado
-
-
     def bloquear_proceso(self):
         # Guardar tiempo de bloqueo y duración original de I/O
         self.proceso_actual.tiempo_bloqueo = self.tiempo_actual
@@ -217,7 +171,8 @@ class FCFS:
         
         self.proceso_actual.estado = "bloqueado"
 
-        self.procesos_bloqueados.append(self.proceso_actual)
+        self.procesos_bloqueados.insertar(self.proceso_actual, self.tiempo_actual,
+                                         self.proceso_actual.duracion_rafagas_io)
 
         # Registrar evento de fin de ejecución
         self.resultados.append({
@@ -259,9 +214,10 @@ class FCFS:
             self.aplicar_tfp()
             self.proceso_actual.estado = "terminando"
             self.procesos_terminados.append(self.proceso_actual)
+            self.procesos_terminando.append(self.proceso_actual)
         else: 
             # Registrar tiempo de finalización (sin TFP)
-            self.t_fin_por_proceso[self.proceso_actual.nombre] = self.tiempo_actual
+            self.t_fin_por_proceso[self.proceso_actual.pid] = self.tiempo_actual
             # Para TFP = 0, no hay TFP real, por lo que no registramos t_ultimo_tfp
             # El T_total se calculará usando tiempo_actual - 1
             
@@ -284,33 +240,25 @@ class FCFS:
         a la cola de listos
         """
         
-        procesos_que_terminaron_io = []
-
-        for proceso in self.procesos_bloqueados:
-            # Solo procesar procesos que no se bloquearon en este tiempo
-            if proceso.tiempo_bloqueo < self.tiempo_actual:
-                # Decrementar la duración de I/O
-                proceso.duracion_rafagas_io -= 1
-                
-                if proceso.duracion_rafagas_io == 0:
-                    procesos_que_terminaron_io.append(proceso)
-                    proceso.estado = "listo"
-                    
-                    # Reiniciar duracion de CPU para la siguiente ejecución
-                    proceso.duracion_rafagas_cpu = proceso.get_duracion_rafagas_cpu()
+        # Solo se recorren los que terminan su I/O en este tiempo (un proceso
+        # bloqueado en el tiempo actual termina recien en un tiempo posterior)
+        for proceso in self.procesos_bloqueados.extraer_terminados(self.tiempo_actual):
+            proceso.duracion_rafagas_io = 0
+            proceso.estado = "listo"
+            
+            # Reiniciar duracion de CPU para la siguiente ejecución
+            proceso.duracion_rafagas_cpu = proceso.get_duracion_rafagas_cpu()
 
-                    # IMPORTANTE: Los procesos que vuelven de I/O van al FINAL de la cola
-                    self.cola_listos.append(proceso)
+            # IMPORTANTE: Los procesos que vuelven de I/O van al FINAL de la cola
+            self.cola_listos.insertar(proceso)
 
-                    # Registrar evento de fin de I/O en el tiempo actual del simulador
-                    self.resultados.append({
-                        'tiempo': self.tiempo_actual,
-                        'proceso': proceso.nombre,
-                        'evento': 'fin_io',
-                        'estado': 'listo'
-                    })
-        for proceso in procesos_que_terminaron_io:
-            self.procesos_bloqueados.remove(proceso)
+            # Registrar evento de fin de I/O en el tiempo actual del simulador
+            self.resultados.append({
+                'tiempo': self.tiempo_actual,
+                'proceso': proceso.nombre,
+                'evento': 'fin_io',
+                'estado': 'listo'
+            })
 
     def aplicar_tip(self):
         if self.tiempo_tip > 0:
@@ -336,6 +284,7 @@ class FCFS:
             })
 
     def aplicar_tcp(self):
+        self.cambios_contexto += 1
         if self.tiempo_tcp > 0:
             self.tiempo_restante_bloqueo = self.tiempo_tcp
             self.tipo_bloqueo = "tcp"
@@ -376,7 +325,7 @@ class FCFS:
             self.proceso_actual.calcular_tiempo_retorno(self.tiempo_actual)
             self.proceso_actual.estado = "terminado"
             self.procesos_terminados.append(self.proceso_actual)
-            self.t_fin_por_proceso[self.proceso_actual.nombre] = self.tiempo_actual
+            self.t_fin_por_proceso[self.proceso_actual.pid] = self.tiempo_actual
             self.t_ultimo_tfp = self.tiempo_actual
             
             self.resultados.append({
@@ -398,10 +347,8 @@ class FCFS:
                 nombre_proceso = None
                 if self.tipo_bloqueo == 'tfp':
                     # Para TFP, buscar el proceso que está terminando
-                    for proceso in self.procesos_terminados:
-                        if proceso.estado == "terminando":
-                            nombre_proceso = proceso.nombre
-                            break
+                    if self.procesos_terminando:
+                        nombre_proceso = self.procesos_terminando[0].nombre
                     self.finalizar_proceso_completamente()
                 elif self.tipo_bloqueo in ['tip', 'tcp'] and self.proceso_actual is not None:
                     # Para TIP y TCP, usar el proceso actual
@@ -439,23 +386,3 @@ class FCFS:
             
             return True # Aun esta bloqueado
         return False # Ya termin0 el bloqueo
-    
-    def finalizar_proceso_completamente(self):
-        """Finaliza completamente un proceso después del TFP."""
-        # Buscar el proceso que estaba terminando
-        for proceso in self.procesos_terminados:
-            if proceso.estado == "terminando":
-                # Registrar tiempo de finalización (con TFP)
-                self.t_fin_por_proceso[proceso.nombre] = self.tiempo_actual
-                self.t_ultimo_tfp = self.tiempo_actual
-                
-                proceso.calcular_tiempo_retorno(self.tiempo_actual)
-                proceso.estado = "terminado"
-                
-                self.resultados.append({
-                    'tiempo': self.tiempo_actual,
-                    'proceso': proceso.nombre,
-                    'evento': 'terminacion',
-                    'estado': 'terminado'
-                })
-                break
\ No newline at end of file
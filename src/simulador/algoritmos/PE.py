@@ -1,6 +1,18 @@
-class PE:
-    def __init__(self, procesos, tiempo_tip, tiempo_tcp, tiempo_tfp):
+from collections import deque
+from operator import methodcaller
+
+from .cola_bloqueados import ColaBloqueados
+from .cola_listos import ColaPrioridad
+from .planificador import Planificador
+from .registro_eventos import crear_destino_eventos
+
+
+class PE(Planificador):
+    def __init__(self, procesos, tiempo_tip, tiempo_tcp, tiempo_tfp, tiempo_maximo=None, max_eventos=None,
+                 destino_eventos=None):
         self.procesos = procesos
+        # Índice de llegadas ordenado por tiempo de arribo
+        self.preparar_llegadas()
         
         # Instante del tiempo actual
         self.tiempo_actual = 0
@@ -8,19 +20,27 @@ class PE:
         # No hay procesos ejecutandose en la primera instancia de tiempo
         self.proceso_actual = None
         
-        # Colas vacias
-        self.cola_listos = []
-        self.procesos_bloqueados = []
+        # Colas vacias (la de listos ordenada por prioridad externa, mayor primero)
+        self.cola_listos = ColaPrioridad(methodcaller('get_prioridad'), descendente=True)
+        self.procesos_bloqueados = ColaBloqueados()
         self.procesos_terminados = []
+        # Procesos cumpliendo su TFP, en el orden en que terminaron
+        self.procesos_terminando = deque()
         
-        # Lista para guardar los eventos que fueron sucediendo
-        self.resultados = []
+        # Destino de los eventos que van sucediendo (por defecto se guardan todos)
+        self.resultados = crear_destino_eventos(destino_eventos)
 
         # Tiempos del SO
         self.tiempo_tip = tiempo_tip
         self.tiempo_tcp = tiempo_tcp
         self.tiempo_tfp = tiempo_tfp
 
+        # Horizonte de la simulación (None = sin límite)
+        self.tiempo_maximo = tiempo_maximo
+        self.max_eventos = max_eventos
+        # Indica si la simulación se cortó antes de terminar todos los procesos
+        self.truncado = False
+
         self.tiempo_restante_bloqueo = 0
         
         # TIP, TCP O TFP
@@ -40,65 +60,26 @@ class PE:
         self.cpu_proc = 0  # Tiempo real de CPU ejecutando procesos
         self.cpu_so = 0    # Tiempo real de CPU en labores del SO
         self.cpu_idle = 0  # Tiempo real de CPU desocupada
+        self.cambios_contexto = 0  # Cantidad de cambios de contexto (TCP aplicados)
         
         # Tiempos de referencia para cálculos
         self.t_primer_arribo = None
         self.t_ultimo_tfp = None
         
-        # Contadores por proceso
-        self.cpu_proc_por_proceso = {}
-        self.t_arribo_por_proceso = {}
-        self.t_fin_por_proceso = {}
-        self.t_listo_por_proceso = {}
+        # Contadores por proceso, indexados por pid
+        self.preparar_contadores()
         
         # Lista de procesos que terminaron I/O en el tiempo actual
         # No pueden ser seleccionados hasta el siguiente tiempo
         self.procesos_recien_terminaron_io = []
 
-    def procesar_llegadas(self):
-        for proceso in self.procesos:
-            if proceso.tiempo_arrivo == self.tiempo_actual:
-                self.insertar_ordenado(proceso)
-                proceso.estado = "listo"
-                
-                # Registrar primer arribo
-                if self.t_primer_arribo is None:
-                    self.t_primer_arribo = self.tiempo_actual
-                
-                # Registrar tiempo de arribo del proceso
-                self.t_arribo_por_proceso[proceso.nombre] = self.tiempo_actual
-                self.cpu_proc_por_proceso[proceso.nombre] = 0
-                self.t_listo_por_proceso[proceso.nombre] = 0
-
-                # Registrar eventos
-                self.resultados.append({
-                    'tiempo': self.tiempo_actual,
-                    'proceso': proceso.nombre,
-                    'evento': 'llegada',
-                    'estado': 'arrivo'
-                })
-
     def insertar_ordenado(self, proceso):
         """
         Inserta el proceso en la cola de listos manteniendo el orden de prioridad externa.
-        Para PE, el orden se basa en la prioridad externa (mayor prioridad primero).
+        Para PE, el orden se basa en la prioridad externa (mayor prioridad primero;
+        a igual prioridad, por orden de llegada a la cola).
         """
-        if len(self.cola_listos) == 0:
-            self.cola_listos.append(proceso)
-            return
-
-        # Ordenar por prioridad externa (mayor prioridad primero)
-        prioridad_proceso = proceso.get_prioridad()
-        
-        for i, proceso_en_cola in enumerate(self.cola_listos):
-            prioridad_en_cola = proceso_en_cola.get_prioridad()
-            
-            if prioridad_proceso > prioridad_en_cola:
-                # Insertar antes del proceso actual (mayor prioridad)
-                self.cola_listos.insert(i, proceso)
-                return
-
-        self.cola_listos.append(proceso)
+        self.cola_listos.insertar(proceso)
 
     def verificar_preemption(self):
         """
@@ -109,12 +90,9 @@ class PE:
         if self.proceso_actual is None or len(self.cola_listos) == 0:
             return False
             
-        # Ordenar la cola por prioridad externa (mayor primero)
-        self.cola_listos.sort(key=lambda p: p.get_prioridad(), reverse=True)
-        
         # Para preemption, SÍ considerar procesos que acaban de terminar I/O
         # porque deben poder preemptar inmediatamente si tienen mayor prioridad
-        proceso_mas_prioritario = self.cola_listos[0]
+        proceso_mas_prioritario = self.cola_listos.primero()
         
         # Si hay un proceso con mayor prioridad que el actual
         if proceso_mas_prioritario.get_prioridad() > self.proceso_actual.get_prioridad():
@@ -122,6 +100,33 @@ class PE:
             
         return False
 
+    def calcular_salto(self, limite):
+        """
+        Calcula cuantos ticks se pueden avanzar sin eventos.
+        Si hay un fin_tcp pendiente de registrar el tick actual no se puede saltar.
+        """
+        if self.registrar_fin_tcp_despues_tip:
+            return 0
+        return super().calcular_salto(limite)
+
+    def limite_salto_ejecucion(self):
+        """
+        Ticks que puede ejecutar el proceso actual sin terminar su rafaga
+        ni ser preemptado por un proceso de mayor prioridad.
+        """
+        if self.verificar_preemption():
+            return 0
+        return self.proceso_actual.duracion_rafagas_cpu - 1
+
+    def avanzar_salto(self, salto):
+        """
+        Aplica `salto` ticks sin eventos. Fuera de TIP/TCP/TFP cada tick limpia
+        la lista de procesos que recien terminaron I/O.
+        """
+        if self.tiempo_restante_bloqueo == 0:
+            self.procesos_recien_terminaron_io.clear()
+        super().avanzar_salto(salto)
+
     def preemptar_proceso_actual(self):
         """
         Preempta el proceso actual y lo devuelve a la cola de listos
@@ -130,14 +135,6 @@ class PE:
         if self.proceso_actual is None or len(self.cola_listos) == 0:
             return
             
-        # Ordenar la cola para obtener el proceso de mayor prioridad
-        self.cola_listos.sort(key=lambda p: p.get_prioridad(), reverse=True)
-        
-        # Para preemption, tomar el proceso más prioritario directamente
-        # (incluso si acaba de terminar I/O, porque debe poder preemptar)
-        proceso_mayor_prioridad = self.cola_listos[0]
-        indice_mayor_prioridad = 0
-        
         # Registrar evento de fin de ejecución
         self.resultados.append({
             'tiempo': self.tiempo_actual - 1,
@@ -158,8 +155,9 @@ class PE:
             'estado': 'listo'
         })
         
-        # El proceso de mayor prioridad toma la CPU
-        self.proceso_actual = self.cola_listos.pop(indice_mayor_prioridad)
+        # El proceso de mayor prioridad toma la CPU directamente
+        # (incluso si acaba de terminar I/O, porque debe poder preemptar)
+        self.proceso_actual = self.cola_listos.extraer()
         
         # Determinar qué tiempos del sistema aplicar para el proceso que preempta
         if self.proceso_actual.proceso_nuevo:
@@ -177,93 +175,80 @@ class PE:
         if self.proceso_actual.nombre in self.procesos_recien_terminaron_io:
             self.procesos_recien_terminaron_io.remove(self.proceso_actual.nombre)
 
-    def ejecutar(self):
-        # Límite de seguridad para evitar bucles infinitos
-        tiempo_maximo = 1000
-        iteraciones = 0
-
-        while self.hay_procesos_pendientes() and iteraciones < tiempo_maximo:
-            iteraciones += 1
-
-            # Verificar si se debe registrar fin_tcp después de TIP
-            if self.registrar_fin_tcp_despues_tip and self.proceso_actual is not None:
-                self.resultados.append({
-                    'tiempo': self.tiempo_actual,
-                    'proceso': self.proceso_actual.nombre,
-                    'evento': 'fin_tcp',
-                    'estado': 'sistema_libre'
-                })
-                # Iniciar ejecución inmediatamente después del fin_tcp
-                self.proceso_actual.estado = "ejecutando"
-                self.resultados.append({
-                    'tiempo': self.tiempo_actual,
-                    'proceso': self.proceso_actual.nombre,
-                    'evento': 'inicio ejecucion',
-                    'estado': 'ejecutando'
-                })
-                self.registrar_fin_tcp_despues_tip = False
-
-            self.procesar_llegadas()
+    def procesar_tick(self):
+        """Procesa un tick de simulación en el que ocurre algún evento."""
+        # Verificar si se debe registrar fin_tcp después de TIP
+        if self.registrar_fin_tcp_despues_tip and self.proceso_actual is not None:
+            self.resultados.append({
+                'tiempo': self.tiempo_actual,
+                'proceso': self.proceso_actual.nombre,
+                'evento': 'fin_tcp',
+                'estado': 'sistema_libre'
+            })
+            # Iniciar ejecución inmediatamente después del fin_tcp
+            self.proceso_actual.estado = "ejecutando"
+            self.resultados.append({
+                'tiempo': self.tiempo_actual,
+                'proceso': self.proceso_actual.nombre,
+                'evento': 'inicio ejecucion',
+                'estado': 'ejecutando'
+            })
+            self.registrar_fin_tcp_despues_tip = False
 
-            # Procesar tiempo de TIP/TCP/TFP
-            if self.procesar_tiempo_bloqueo():
-                # Procesar procesos bloqueados incluso si hay TIP/TCP/TFP activo
-                self.procesar_procesos_bloqueados()
-                self.tiempo_actual += 1
-                continue
+        self.procesar_llegadas()
 
-            # PRIMERO: Procesar procesos bloqueados para que puedan preemptar inmediatamente
+        # Procesar tiempo de TIP/TCP/TFP
+        if self.procesar_tiempo_bloqueo():
+            # Procesar procesos bloqueados incluso si hay TIP/TCP/TFP activo
             self.procesar_procesos_bloqueados()
+            self.tiempo_actual += 1
+            return
 
-            # SEGUNDO: Verificar preemption DESPUÉS de procesar procesos bloqueados
-            if self.proceso_actual is not None and self.tiempo_restante_bloqueo == 0:
-                # ¿Hay alguien más prioritario en cola_listos?
-                if self.verificar_preemption():
-                    # tie-break: si el proceso actual va a TERMINAR su ráfaga en ESTE tick,
-                    # permitile ejecutar (porque debe poder iniciar su I/O inmediatamente).
-                    # Observá que miramos la duracion _antes_ de ejecutar.
-                    if getattr(self.proceso_actual, 'duracion_rafagas_cpu', None) == 1:
-                        # dejar que ejecute su último unit, no preempuar
-                        pass
-                    else:
-                        # preemptar ahora, no ejecuta este tick
-                        self.preemptar_proceso_actual()
-
-            # Incrementar tiempo de espera para procesos en cola de listos
-            for proceso in self.cola_listos:
-                proceso.tiempo_en_listo += 1
-                # Acumular tiempo en estado listo (solo después de pagar TIP)
-                if proceso.nombre in self.t_listo_por_proceso:
-                    self.t_listo_por_proceso[proceso.nombre] += 1
+        # PRIMERO: Procesar procesos bloqueados para que puedan preemptar inmediatamente
+        self.procesar_procesos_bloqueados()
+
+        # SEGUNDO: Verificar preemption DESPUÉS de procesar procesos bloqueados
+        if self.proceso_actual is not None and self.tiempo_restante_bloqueo == 0:
+            # ¿Hay alguien más prioritario en cola_listos?
+            if self.verificar_preemption():
+                # tie-break: si el proceso actual va a TERMINAR su ráfaga en ESTE tick,
+                # permitile ejecutar (porque debe poder iniciar su I/O inmediatamente).
+                # Observá que miramos la duracion _antes_ de ejecutar.
+                if getattr(self.proceso_actual, 'duracion_rafagas_cpu', None) == 1:
+                    # dejar que ejecute su último unit, no preempuar
+                    pass
+                else:
+                    # preemptar ahora, no ejecuta este tick
+                    self.preemptar_proceso_actual()
+
+        # Los procesos en cola de listos acumulan un tick de espera
+        # (se les suma a su tiempo en listo cuando salen de la cola)
+        self.cola_listos.acumular_espera(1)
+
+        # Si no hay proceso ejecutandose, selecciona uno
+        if self.proceso_actual is None:
+            self.seleccionar_siguiente_proceso()
 
-            # Si no hay proceso ejecutandose, selecciona uno
-            if self.proceso_actual is None:
-                self.seleccionar_siguiente_proceso()
+        # Ahora, si aún hay proceso en CPU y no hay bloqueo, ejecuta UNA sola unidad
+        if self.proceso_actual is not None and self.tiempo_restante_bloqueo == 0:
+            self.ejecutar_proceso_actual()
 
-            # Ahora, si aún hay proceso en CPU y no hay bloqueo, ejecuta UNA sola unidad
-            if self.proceso_actual is not None and self.tiempo_restante_bloqueo == 0:
-                self.ejecutar_proceso_actual()
 
 
 
 
+        # Calcular CPU_idle: si no hay proceso ejecutándose ni labores del SO
+        if (self.proceso_actual is None and 
+            self.tiempo_restante_bloqueo == 0 and 
+            len(self.cola_listos) == 0):
+            self.cpu_idle += 1
 
-            # Calcular CPU_idle: si no hay proceso ejecutándose ni labores del SO
-            if (self.proceso_actual is None and 
-                self.tiempo_restante_bloqueo == 0 and 
-                len(self.cola_listos) == 0):
-                self.cpu_idle += 1
+        # Limpiar la lista de procesos que terminaron I/O en este tiempo
+        # Ahora pueden ser seleccionados en el siguiente tiempo
+        self.procesos_recien_terminaron_io.clear()
 
-            # Limpiar la lista de procesos que terminaron I/O en este tiempo
-            # Ahora pueden ser seleccionados en el siguiente tiempo
-            self.procesos_recien_terminaron_io.clear()
-            
-            # Avanzar una unidad de tiempo
-            self.tiempo_actual += 1
-        
-        if iteraciones >= tiempo_maximo:
-            print(f"Advertencia: Simulación terminada por límite de tiempo ({tiempo_maximo} iteraciones)")
-            print(f"Estado final - Tiempo: {self.tiempo_actual}, Iteraciones: {iteraciones}")
+        # Avanzar una unidad de tiempo
+        self.tiempo_actual += 1
     
     def obtener_estadisticas_cpu(self):
         """Retorna las estadísticas de CPU."""
@@ -290,10 +275,10 @@ class PE:
             't_total': t_total,
             't_primer_arribo': self.t_primer_arribo,
             't_ultimo_tfp': self.t_ultimo_tfp,
-            'cpu_proc_por_proceso': self.cpu_proc_por_proceso,
-            't_arribo_por_proceso': self.t_arribo_por_proceso,
-            't_fin_por_proceso': self.t_fin_por_proceso,
-            't_listo_por_proceso': self.t_listo_por_proceso
+            'cpu_proc_por_proceso': self.contadores_por_nombre(self.cpu_proc_por_proceso),
+            't_arribo_por_proceso': self.contadores_por_nombre(self.t_arribo_por_proceso),
+            't_fin_por_proceso': self.contadores_por_nombre(self.t_fin_por_proceso),
+            't_listo_por_proceso': self.contadores_por_nombre(self.t_listo_por_proceso)
         }
 
     def ejecutar_proceso_actual(self):
@@ -303,7 +288,7 @@ class PE:
         # Se consume una unidad de tiempo de CPU ejecutando proceso
         self.proceso_actual.duracion_rafagas_cpu -= 1
         self.cpu_proc += 1  # Acumular tiempo real de CPU ejecutando procesos
-        self.cpu_proc_por_proceso[self.proceso_actual.nombre] += 1  # Acumular por proceso
+        self.cpu_proc_por_proceso[self.proceso_actual.pid] += 1  # Acumular por proceso
 
         if self.proceso_actual.duracion_rafagas_cpu == 0:
             self.proceso_actual.cantidad_rafagas_cpu -= 1
@@ -319,22 +304,17 @@ class PE:
         La cola ya está ordenada por PE, por lo que solo se toma el primero.
         """
         if len(self.cola_listos) > 0:
-            # Buscar el primer proceso que no haya terminado I/O en este tiempo
-            proceso_seleccionado = None
-            indice_seleccionado = -1
-            
-            for i, proceso in enumerate(self.cola_listos):
-                if proceso.nombre not in self.procesos_recien_terminaron_io:
-                    proceso_seleccionado = proceso
-                    indice_seleccionado = i
-                    break
+            # Buscar y sacar el primer proceso que no haya terminado I/O en este tiempo
+            proceso_seleccionado = self.cola_listos.extraer_primero_que(
+                lambda p: p.nombre not in self.procesos_recien_terminaron_io
+            )
             
             # Si no hay procesos disponibles (todos terminaron I/O en este tiempo), no seleccionar ninguno
             if proceso_seleccionado is None:
                 return
                 
             # Seleccionar el proceso encontrado
-            self.proceso_actual = self.cola_listos.pop(indice_seleccionado)
+            self.proceso_actual = proceso_seleccionado
             
             # Determinar qué tiempos del sistema aplicar
             if self.proceso_actual.proceso_nuevo:
@@ -348,22 +328,6 @@ class PE:
             # NO cambiar estado a "ejecutando" ni registrar evento aquí
             # El proceso solo empezará a ejecutarse después de que termine TIP/TCP
     
-    def hay_procesos_pendientes(self):
-        """
-        Verifica si quedan trabajos por hacer:
-            - hay procesos en cola de listos
-            - hay procesos bloqueados
-            - hay procesos ejecutandose
-            - hay procesos que aun no llegaron a su tiempo total
-            de ejecucion
-        """
-        resultado = (len(self.cola_listos) > 0 or 
-        len(self.procesos_bloqueados) > 0 or (self.proceso_actual is not None) or
-        (any(p.tiempo_arrivo > self.tiempo_actual for p in self.procesos)) or
-        (any(p.estado == "terminando" for p in self.procesos)))
-        
-        return resultado
-
     def bloquear_proceso(self):
         # Guardar tiempo de bloqueo y duración original de I/O
         self.proceso_actual.tiempo_bloqueo = self.tiempo_actual
@@ -373,7 +337,8 @@ class PE:
         self.proceso_actual.duracion_rafagas_io = self.proceso_actual.duracion_rafagas_io_original
         
         self.proceso_actual.estado = "bloqueado"
-        self.procesos_bloqueados.append(self.proceso_actual)
+        self.procesos_bloqueados.insertar(self.proceso_actual, self.tiempo_actual,
+                                         self.proceso_actual.duracion_rafagas_io)
 
         # Registrar evento de fin de ejecución
         self.resultados.append({
@@ -415,9 +380,10 @@ class PE:
             self.aplicar_tfp()
             self.proceso_actual.estado = "terminando"
             self.procesos_terminados.append(self.proceso_actual)
+            self.procesos_terminando.append(self.proceso_actual)
         else: 
             # Registrar tiempo de finalización (sin TFP)
-            self.t_fin_por_proceso[self.proceso_actual.nombre] = self.tiempo_actual
+            self.t_fin_por_proceso[self.proceso_actual.pid] = self.tiempo_actual
             # Para TFP = 0, no hay TFP real, por lo que no registramos t_ultimo_tfp
             # El T_total se calculará usando tiempo_actual - 1
             
@@ -440,37 +406,29 @@ class PE:
         a la cola de listos
         """
         
-        procesos_que_terminaron_io = []
+        # Solo se recorren los que terminan su I/O en este tiempo (un proceso
+        # bloqueado en el tiempo actual termina recien en un tiempo posterior)
+        for proceso in self.procesos_bloqueados.extraer_terminados(self.tiempo_actual):
+            proceso.duracion_rafagas_io = 0
+            proceso.estado = "listo"
+            
+            # Reiniciar duracion de CPU para la siguiente ejecución
+            proceso.duracion_rafagas_cpu = proceso.get_duracion_rafagas_cpu()
 
-        for proceso in self.procesos_bloqueados:
-            # Solo procesar procesos que no se bloquearon en este tiempo
-            if proceso.tiempo_bloqueo < self.tiempo_actual:
-                # Decrementar la duración de I/O
-                proceso.duracion_rafagas_io -= 1
-                
-                if proceso.duracion_rafagas_io == 0:
-                    procesos_que_terminaron_io.append(proceso)
-                    proceso.estado = "listo"
-                    
-                    # Reiniciar duracion de CPU para la siguiente ejecución
-                    proceso.duracion_rafagas_cpu = proceso.get_duracion_rafagas_cpu()
-
-                    # Insertar el proceso en la cola de listos manteniendo el orden PE
-                    self.insertar_ordenado(proceso)
-                    
-                    # Marcar que este proceso acaba de terminar I/O en este tiempo
-                    # No puede ser seleccionado hasta el siguiente tiempo
-                    self.procesos_recien_terminaron_io.append(proceso.nombre)
-
-                    # Registrar evento de fin de I/O en el tiempo actual del simulador
-                    self.resultados.append({
-                        'tiempo': self.tiempo_actual,
-                        'proceso': proceso.nombre,
-                        'evento': 'fin_io',
-                        'estado': 'listo'
-                    })
-        for proceso in procesos_que_terminaron_io:
-            self.procesos_bloqueados.remove(proceso)
+            # Insertar el proceso en la cola de listos manteniendo el orden PE
+            self.insertar_ordenado(proceso)
+            
+            # Marcar que este proceso acaba de terminar I/O en este tiempo
+            # No puede ser seleccionado hasta el siguiente tiempo
+            self.procesos_recien_terminaron_io.append(proceso.nombre)
+
+            # Registrar evento de fin de I/O en el tiempo actual del simulador
+            self.resultados.append({
+                'tiempo': self.tiempo_actual,
+                'proceso': proceso.nombre,
+                'evento': 'fin_io',
+                'estado': 'listo'
+            })
 
     def aplicar_tip(self):
         if self.tiempo_tip > 0:
@@ -502,6 +460,7 @@ class PE:
                 })
 
     def aplicar_tcp(self):
+        self.cambios_contexto += 1
         if self.tiempo_tcp > 0:
             self.tiempo_restante_bloqueo = self.tiempo_tcp
             self.tipo_bloqueo = "tcp"
@@ -542,7 +501,7 @@ class PE:
             self.proceso_actual.calcular_tiempo_retorno(self.tiempo_actual)
             self.proceso_actual.estado = "terminado"
             self.procesos_terminados.append(self.proceso_actual)
-            self.t_fin_por_proceso[self.proceso_actual.nombre] = self.tiempo_actual
+            self.t_fin_por_proceso[self.proceso_actual.pid] = self.tiempo_actual
             self.t_ultimo_tfp = self.tiempo_actual
             
             self.resultados.append({
@@ -567,10 +526,8 @@ class PE:
 
                 if tipo_original == 'tfp':
                     # Para TFP, buscar el proceso que está terminando
-                    for proceso in self.procesos_terminados:
-                        if proceso.estado == "terminando":
-                            nombre_proceso = proceso.nombre
-                            break
+                    if self.procesos_terminando:
+                        nombre_proceso = self.procesos_terminando[0].nombre
                     # Finaliza el proceso completamente (esto puede sobrescribir self.tipo_bloqueo)
                     self.finalizar_proceso_completamente()
 
@@ -597,11 +554,8 @@ class PE:
                         # Verificar si hay un proceso más prioritario en la cola de listos
                         # (Lógica para evitar TCP duplicado, similar a SRTN)
                         if len(self.cola_listos) > 0:
-                            # Ordenar la cola por prioridad externa (mayor primero)
-                            self.cola_listos.sort(key=lambda p: p.get_prioridad(), reverse=True)
-                            
-                            # Verificar si el primer proceso en la cola es más prioritario
-                            proceso_mas_prioritario = self.cola_listos[0]
+                            # Verificar si el primer proceso en la cola (mayor prioridad) es más prioritario
+                            proceso_mas_prioritario = self.cola_listos.primero()
                             if (proceso_mas_prioritario.get_prioridad() > 
                                 self.proceso_actual.get_prioridad()):
                                 
@@ -610,13 +564,13 @@ class PE:
                                 self.proceso_actual.estado = "listo"
                                 # Restar 1 al contador de CPU del proceso que cede la CPU
                                 self.cpu_proc -= 1
-                                self.cpu_proc_por_proceso[self.proceso_actual.nombre] -= 1
+                                self.cpu_proc_por_proceso[self.proceso_actual.pid] -= 1
                                 self.insertar_ordenado(self.proceso_actual)
                                 self.proceso_actual = None
                                 
                                 # El proceso más prioritario debe ejecutarse directamente
                                 # (sin ejecutar TCP ya que el TCP ya fue consumido)
-                                self.proceso_actual = self.cola_listos.pop(0)
+                                self.proceso_actual = self.cola_listos.extraer()
                                 self.proceso_actual.estado = "ejecutando"
                                 
                                 # Registrar evento de cambio de proceso
@@ -675,23 +629,3 @@ class PE:
 
             return True  # Aun esta bloqueado
         return False  # Ya terminó el bloqueo
-    
-    def finalizar_proceso_completamente(self):
-        """Finaliza completamente un proceso después del TFP."""
-        # Buscar el proceso que estaba terminando
-        for proceso in self.procesos_terminados:
-            if proceso.estado == "terminando":
-                # Registrar tiempo de finalización (con TFP)
-                self.t_fin_por_proceso[proceso.nombre] = self.tiempo_actual
-                self.t_ultimo_tfp = self.tiempo_actual
-                
-                proceso.calcular_tiempo_retorno(self.tiempo_actual)
-                proceso.estado = "terminado"
-                
-                self.resultados.append({
-                    'tiempo': self.tiempo_actual,
-                    'proceso': proceso.nombre,
-                    'evento': 'terminacion',
-                    'estado': 'terminado'
-                })
-                break
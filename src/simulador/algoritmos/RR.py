@@ -1,22 +1,41 @@
-class RR:
-    def __init__(self, procesos, tiempo_tip, tiempo_tcp, tiempo_tfp, quantum):
+from collections import deque
+
+from .cola_bloqueados import ColaBloqueados
+from .cola_listos import ColaFIFO
+from .planificador import Planificador
+from .registro_eventos import crear_destino_eventos
+
+
+class RR(Planificador):
+    def __init__(self, procesos, tiempo_tip, tiempo_tcp, tiempo_tfp, quantum, tiempo_maximo=None, max_eventos=None,
+                 destino_eventos=None):
         self.procesos = procesos
+        # Índice de llegadas ordenado por tiempo de arribo
+        self.preparar_llegadas()
         # Instante de tiempo actual del puntero
         self.tiempo_actual = 0
         # No hay procesos ejecutandose en la primera instancia de tiempo
         self.proceso_actual = None
         # Colas vacias
-        self.cola_listos = []
-        self.procesos_bloqueados = []
+        self.cola_listos = ColaFIFO()
+        self.procesos_bloqueados = ColaBloqueados()
         self.procesos_terminados = []
-        # Lista para guardar los eventos que fueron sucediendo
-        self.resultados = []
+        # Procesos cumpliendo su TFP, en el orden en que terminaron
+        self.procesos_terminando = deque()
+        # Destino de los eventos que van sucediendo (por defecto se guardan todos)
+        self.resultados = crear_destino_eventos(destino_eventos)
 
         self.tiempo_tip = tiempo_tip
         self.tiempo_tcp = tiempo_tcp
         self.tiempo_tfp = tiempo_tfp
         self.quantum = quantum  # Nueva variable para Round Robin
 
+        # Horizonte de la simulación (None = sin límite)
+        self.tiempo_maximo = tiempo_maximo
+        self.max_eventos = max_eventos
+        # Indica si la simulación se cortó antes de terminar todos los procesos
+        self.truncado = False
+
         self.tiempo_restante_bloqueo = 0
         self.tipo_bloqueo = None
         
@@ -34,51 +53,30 @@ class RR:
         
         # Flag para indicar si se debe registrar fin_tcp después de TIP
         self.registrar_fin_tcp_despues_tip = False
+
+        # TCP abiertos por proceso (inicio_tcp sin su fin_tcp), indexados por
+        # pid, para no tener que recorrer los eventos al terminar un proceso
+        self.tcp_abiertos = [None] * len(self.procesos)
         
         # Contadores de CPU para mediciones correctas
         self.cpu_proc = 0  # Tiempo real de CPU ejecutando procesos
         self.cpu_so = 0    # Tiempo real de CPU en labores del SO
         self.cpu_idle = 0  # Tiempo real de CPU desocupada
+        self.cambios_contexto = 0  # Cantidad de cambios de contexto (TCP aplicados)
         
         # Tiempos de referencia para cálculos
         self.t_primer_arribo = None
         self.t_ultimo_tfp = None
         
-        # Contadores por proceso
-        self.cpu_proc_por_proceso = {}
-        self.t_arribo_por_proceso = {}
-        self.t_fin_por_proceso = {}
-        self.t_listo_por_proceso = {}
-
-    def procesar_llegadas(self):
-        for proceso in self.procesos:
-            if proceso.tiempo_arrivo == self.tiempo_actual:
-                self.insertar_ordenado(proceso)
-                proceso.estado = "listo"
-                
-                # Registrar primer arribo
-                if self.t_primer_arribo is None:
-                    self.t_primer_arribo = self.tiempo_actual
-                
-                # Registrar tiempo de arribo del proceso
-                self.t_arribo_por_proceso[proceso.nombre] = self.tiempo_actual
-                self.cpu_proc_por_proceso[proceso.nombre] = 0
-                self.t_listo_por_proceso[proceso.nombre] = 0
-
-                # Registrar eventos
-                self.resultados.append({
-                    'tiempo': self.tiempo_actual,
-                    'proceso': proceso.nombre,
-                    'evento': 'llegada',
-                    'estado': 'arrivo'
-                })
+        # Contadores por proceso, indexados por pid
+        self.preparar_contadores()
 
     def insertar_ordenado(self, proceso):
         """
         Inserta el proceso en la cola de listos.
         Para Round Robin, los procesos van al FINAL de la cola (FIFO).
         """
-        self.cola_listos.append(proceso)
+        self.cola_listos.insertar(proceso)
 
     def verificar_preemption_quantum(self):
         """
@@ -93,6 +91,27 @@ class RR:
             
         return False
 
+    def calcular_salto(self, limite):
+        """
+        Calcula cuantos ticks se pueden avanzar sin eventos.
+        Si hay un fin_tcp pendiente de registrar el tick actual no se puede saltar.
+        """
+        if self.registrar_fin_tcp_despues_tip:
+            return 0
+        return super().calcular_salto(limite)
+
+    def limite_salto_ejecucion(self):
+        """
+        Ticks que puede ejecutar el proceso actual sin terminar su rafaga
+        ni agotar su quantum.
+        """
+        return min(self.proceso_actual.duracion_rafagas_cpu, self.quantum_restante) - 1
+
+    def avanzar_ejecucion(self, salto):
+        """Ejecuta `salto` unidades de CPU consumiendo tambien el quantum."""
+        super().avanzar_ejecucion(salto)
+        self.quantum_restante -= salto
+
     def preemptar_proceso_actual(self):
         """
         Preempta el proceso actual y lo devuelve al FINAL de la cola de listos
@@ -111,7 +130,7 @@ class RR:
         
         # El proceso actual vuelve al FINAL de la cola de listos con su duración restante
         self.proceso_actual.estado = "listo"
-        self.cola_listos.append(self.proceso_actual)
+        self.cola_listos.insertar(self.proceso_actual)
         
         # Registrar evento de preemption
         self.resultados.append({
@@ -128,75 +147,63 @@ class RR:
         self.proceso_actual = None
         self.quantum_restante = 0
 
-    def ejecutar(self):
-        # Límite de seguridad para evitar bucles infinitos
-        tiempo_maximo = 1000
-        iteraciones = 0
+    def procesar_tick(self):
+        """Procesa un tick de simulación en el que ocurre algún evento."""
+        # Verificar si se debe registrar fin_tcp después de TIP
+        if self.registrar_fin_tcp_despues_tip and self.proceso_actual is not None:
+            self.actualizar_tcp_abiertos(self.proceso_actual, -1)
+            self.resultados.append({
+                'tiempo': self.tiempo_actual,
+                'proceso': self.proceso_actual.nombre,
+                'evento': 'fin_tcp',
+                'estado': 'sistema_libre'
+            })
+            # Iniciar ejecución inmediatamente después del fin_tcp
+            self.proceso_actual.estado = "ejecutando"
+            self.resultados.append({
+                'tiempo': self.tiempo_actual,
+                'proceso': self.proceso_actual.nombre,
+                'evento': 'inicio ejecucion',
+                'estado': 'ejecutando'
+            })
+            self.registrar_fin_tcp_despues_tip = False
 
-        while self.hay_procesos_pendientes() and iteraciones < tiempo_maximo:
-            iteraciones += 1
+        self.procesar_llegadas()
 
-            # Verificar si se debe registrar fin_tcp después de TIP
-            if self.registrar_fin_tcp_despues_tip and self.proceso_actual is not None:
-                self.resultados.append({
-                    'tiempo': self.tiempo_actual,
-                    'proceso': self.proceso_actual.nombre,
-                    'evento': 'fin_tcp',
-                    'estado': 'sistema_libre'
-                })
-                # Iniciar ejecución inmediatamente después del fin_tcp
-                self.proceso_actual.estado = "ejecutando"
-                self.resultados.append({
-                    'tiempo': self.tiempo_actual,
-                    'proceso': self.proceso_actual.nombre,
-                    'evento': 'inicio ejecucion',
-                    'estado': 'ejecutando'
-                })
-                self.registrar_fin_tcp_despues_tip = False
-
-            self.procesar_llegadas()
+        # Procesar tiempo de TIP/TCP/TFP
+        if self.procesar_tiempo_bloqueo():
+            # Procesar procesos bloqueados incluso si hay TIP/TCP/TFP activo
+            self.procesar_procesos_bloqueados()
+            self.tiempo_actual += 1
+            return
 
-            # Procesar tiempo de TIP/TCP/TFP
-            if self.procesar_tiempo_bloqueo():
-                # Procesar procesos bloqueados incluso si hay TIP/TCP/TFP activo
-                self.procesar_procesos_bloqueados()
-                self.tiempo_actual += 1
-                continue
+        # Procesar procesos bloqueados
+        self.procesar_procesos_bloqueados()
 
-            # Procesar procesos bloqueados
-            self.procesar_procesos_bloqueados()
+        # Los procesos en cola de listos acumulan un tick de espera
+        # (se les suma a su tiempo en listo cuando salen de la cola)
+        self.cola_listos.acumular_espera(1)
 
-            # Incrementar tiempo de espera para procesos en cola de listos
-            for proceso in self.cola_listos:
-                proceso.tiempo_en_listo += 1
-                # Acumular tiempo en estado listo (solo después de pagar TIP)
-                if proceso.nombre in self.t_listo_por_proceso:
-                    self.t_listo_por_proceso[proceso.nombre] += 1
+        # Si no hay proceso ejecutandose, selecciona uno
+        if self.proceso_actual is None:
+            self.seleccionar_siguiente_proceso()
 
-            # Si no hay proceso ejecutandose, selecciona uno
-            if self.proceso_actual is None:
-                self.seleccionar_siguiente_proceso()
+        # Si hay proceso ejecutandose, ejecutarlo
+        if self.proceso_actual is not None and self.tiempo_restante_bloqueo == 0:
+            self.ejecutar_proceso_actual()
 
-            # Si hay proceso ejecutandose, ejecutarlo
-            if self.proceso_actual is not None and self.tiempo_restante_bloqueo == 0:
-                self.ejecutar_proceso_actual()
-                
-                # Verificar preemption por quantum DESPUÉS de ejecutar
-                if self.verificar_preemption_quantum():
-                    self.preemptar_proceso_actual()
+            # Verificar preemption por quantum DESPUÉS de ejecutar
+            if self.verificar_preemption_quantum():
+                self.preemptar_proceso_actual()
 
-            # Calcular CPU_idle: si no hay proceso ejecutándose ni labores del SO
-            if (self.proceso_actual is None and 
-                self.tiempo_restante_bloqueo == 0 and 
-                len(self.cola_listos) == 0):
-                self.cpu_idle += 1
+        # Calcular CPU_idle: si no hay proceso ejecutándose ni labores del SO
+        if (self.proceso_actual is None and 
+            self.tiempo_restante_bloqueo == 0 and 
+            len(self.cola_listos) == 0):
+            self.cpu_idle += 1
 
-            # Avanzar una unidad de tiempo
-            self.tiempo_actual += 1
-        
-        if iteraciones >= tiempo_maximo:
-            print(f"Advertencia: Simulación terminada por límite de tiempo ({tiempo_maximo} iteraciones)")
-            print(f"Estado final - Tiempo: {self.tiempo_actual}, Iteraciones: {iteraciones}")
+        # Avanzar una unidad de tiempo
+        self.tiempo_actual += 1
     
     def obtener_estadisticas_cpu(self):
         """Retorna las estadísticas de CPU calculadas correctamente."""
@@ -223,10 +230,10 @@ class RR:
             't_total': t_total,
             't_primer_arribo': self.t_primer_arribo,
             't_ultimo_tfp': self.t_ultimo_tfp,
-            'cpu_proc_por_proceso': self.cpu_proc_por_proceso,
-            't_arribo_por_proceso': self.t_arribo_por_proceso,
-            't_fin_por_proceso': self.t_fin_por_proceso,
-            't_listo_por_proceso': self.t_listo_por_proceso
+            'cpu_proc_por_proceso': self.contadores_por_nombre(self.cpu_proc_por_proceso),
+            't_arribo_por_proceso': self.contadores_por_nombre(self.t_arribo_por_proceso),
+            't_fin_por_proceso': self.contadores_por_nombre(self.t_fin_por_proceso),
+            't_listo_por_proceso': self.contadores_por_nombre(self.t_listo_por_proceso)
         }
 
     def ejecutar_proceso_actual(self):
@@ -236,7 +243,7 @@ class RR:
         # Consumir SIEMPRE un tick de CPU
         self.proceso_actual.duracion_rafagas_cpu -= 1
         self.cpu_proc += 1  # Acumular tiempo real de CPU ejecutando procesos
-        self.cpu_proc_por_proceso[self.proceso_actual.nombre] += 1  # Acumular por proceso
+        self.cpu_proc_por_proceso[self.proceso_actual.pid] += 1  # Acumular por proceso
         self.quantum_restante -= 1
 
         # Caso 1: la ráfaga terminó justo ahora
@@ -259,7 +266,7 @@ class RR:
     def seleccionar_siguiente_proceso(self):
         if len(self.cola_listos) > 0:
             # Agarrar el primer proceso de la cola (FCFS)
-            self.proceso_actual = self.cola_listos.pop(0)
+            self.proceso_actual = self.cola_listos.extraer()
             
             # Reiniciar el quantum para el nuevo proceso
             self.quantum_restante = self.quantum
@@ -282,22 +289,6 @@ class RR:
             # NO cambiar estado a "ejecutando" ni registrar evento aquí
             # El proceso solo empezará a ejecutarse después de que termine TIP/TCP
 
-    def hay_procesos_pendientes(self):
-        """
-        Verifica si quedan trabajos por hacer:
-            - hay procesos en cola de listos
-            - hay procesos bloqueados
-            - hay procesos ejecutandose
-            - hay procesos que aun no llegaron a su tiempo total
-            de ejecucion
-        """
-        resultado = (len(self.cola_listos) > 0 or 
-        len(self.procesos_bloqueados) > 0 or (self.proceso_actual is not None) or
-        (any(p.tiempo_arrivo > self.tiempo_actual for p in self.procesos)) or
-        (any(p.estado == "terminando" for p in self.procesos)))
-        
-        return resultado
-
     def bloquear_proceso(self):
         # Guardar tiempo de bloqueo y duración original de I/O
         self.proceso_actual.tiempo_bloqueo = self.tiempo_actual
@@ -307,7 +298,8 @@ class RR:
         self.proceso_actual.duracion_rafagas_io = self.proceso_actual.duracion_rafagas_io_original
         
         self.proceso_actual.estado = "bloqueado"
-        self.procesos_bloqueados.append(self.proceso_actual)
+        self.procesos_bloqueados.insertar(self.proceso_actual, self.tiempo_actual,
+                                         self.proceso_actual.duracion_rafagas_io)
 
         # Registrar evento de fin de ejecución
         self.resultados.append({
@@ -347,18 +339,9 @@ class RR:
         })
 
         # Si el proceso estaba ejecutándose después de un TCP, registrar fin_tcp
-        # Buscar el último inicio_tcp del proceso que no tenga fin_tcp correspondiente
-        eventos_inicio_tcp = [e for e in self.resultados 
-                             if e['proceso'] == self.proceso_actual.nombre and 
-                                e['evento'] == 'inicio_tcp' and 
-                                e['tiempo'] < self.tiempo_actual]
-        
-        eventos_fin_tcp = [e for e in self.resultados 
-                          if e['proceso'] == self.proceso_actual.nombre and 
-                             e['evento'] == 'fin_tcp' and 
-                             e['tiempo'] < self.tiempo_actual]
-        
-        if len(eventos_inicio_tcp) > len(eventos_fin_tcp):
+        # (tiene un inicio_tcp de un tiempo anterior sin su fin_tcp)
+        if self.tiene_tcp_abierto(self.proceso_actual):
+            self.actualizar_tcp_abiertos(self.proceso_actual, -1)
             self.resultados.append({
                 'tiempo': self.tiempo_actual,
                 'proceso': self.proceso_actual.nombre,
@@ -370,9 +353,10 @@ class RR:
             self.aplicar_tfp()
             self.proceso_actual.estado = "terminando"
             self.procesos_terminados.append(self.proceso_actual)
+            self.procesos_terminando.append(self.proceso_actual)
         else: 
             # Registrar tiempo de finalización (sin TFP)
-            self.t_fin_por_proceso[self.proceso_actual.nombre] = self.tiempo_actual
+            self.t_fin_por_proceso[self.proceso_actual.pid] = self.tiempo_actual
             # Para TFP = 0, no hay TFP real, por lo que no registramos t_ultimo_tfp
             # El T_total se calculará usando tiempo_actual - 1
             
@@ -396,33 +380,25 @@ class RR:
         a la cola de listos
         """
         
-        procesos_que_terminaron_io = []
-
-        for proceso in self.procesos_bloqueados:
-            # Solo procesar procesos que no se bloquearon en este tiempo
-            if proceso.tiempo_bloqueo < self.tiempo_actual:
-                # Decrementar la duración de I/O
-                proceso.duracion_rafagas_io -= 1
-                
-                if proceso.duracion_rafagas_io == 0:
-                    procesos_que_terminaron_io.append(proceso)
-                    proceso.estado = "listo"
-                    
-                    # Reiniciar duracion de CPU para la siguiente ejecución
-                    proceso.duracion_rafagas_cpu = proceso.get_duracion_rafagas_cpu()
+        # Solo se recorren los que terminan su I/O en este tiempo (un proceso
+        # bloqueado en el tiempo actual termina recien en un tiempo posterior)
+        for proceso in self.procesos_bloqueados.extraer_terminados(self.tiempo_actual):
+            proceso.duracion_rafagas_io = 0
+            proceso.estado = "listo"
+            
+            # Reiniciar duracion de CPU para la siguiente ejecución
+            proceso.duracion_rafagas_cpu = proceso.get_duracion_rafagas_cpu()
 
-                    # IMPORTANTE: Los procesos que vuelven de I/O van al FINAL de la cola
-                    self.cola_listos.append(proceso)
+            # IMPORTANTE: Los procesos que vuelven de I/O van al FINAL de la cola
+            self.cola_listos.insertar(proceso)
 
-                    # Registrar evento de fin de I/O en el tiempo actual del simulador
-                    self.resultados.append({
-                        'tiempo': self.tiempo_actual,
-                        'proceso': proceso.nombre,
-                        'evento': 'fin_io',
-                        'estado': 'listo'
-                    })
-        for proceso in procesos_que_terminaron_io:
-            self.procesos_bloqueados.remove(proceso)
+            # Registrar evento de fin de I/O en el tiempo actual del simulador
+            self.resultados.append({
+                'tiempo': self.tiempo_actual,
+                'proceso': proceso.nombre,
+                'evento': 'fin_io',
+                'estado': 'listo'
+            })
 
     def aplicar_tip(self):
         if self.tiempo_tip > 0:
@@ -453,12 +429,40 @@ class RR:
                     'estado': 'ejecutando'
                 })
 
+    def actualizar_tcp_abiertos(self, proceso, cambio):
+        """
+        Actualiza la cantidad de TCP abiertos de un proceso al registrar un
+        inicio_tcp (+1) o un fin_tcp (-1) en el tiempo actual.
+
+        Se guarda (tiempo del último cambio, abiertos antes de ese tiempo,
+        abiertos) para poder responder cuántos quedaron abiertos en tiempos
+        anteriores sin contar los eventos del tiempo actual.
+        """
+        tiempo, anteriores, abiertos = self.tcp_abiertos[proceso.pid] or (self.tiempo_actual, 0, 0)
+        if tiempo < self.tiempo_actual:
+            anteriores = abiertos
+        self.tcp_abiertos[proceso.pid] = (self.tiempo_actual, anteriores, abiertos + cambio)
+
+    def tiene_tcp_abierto(self, proceso):
+        """
+        Indica si el proceso tiene más inicio_tcp que fin_tcp registrados en
+        tiempos anteriores al actual.
+        """
+        if self.tcp_abiertos[proceso.pid] is None:
+            return False
+        tiempo, anteriores, abiertos = self.tcp_abiertos[proceso.pid]
+        if tiempo < self.tiempo_actual:
+            return abiertos > 0
+        return anteriores > 0
+
     def aplicar_tcp(self):
+        self.cambios_contexto += 1
         if self.tiempo_tcp > 0:
             self.tiempo_restante_bloqueo = self.tiempo_tcp
             self.tipo_bloqueo = "tcp"
             
             # Registrar evento solo si TCP > 0
+            self.actualizar_tcp_abiertos(self.proceso_actual, 1)
             self.resultados.append({
                 'tiempo': self.tiempo_actual,
                 'proceso': self.proceso_actual.nombre,
@@ -494,7 +498,7 @@ class RR:
             self.proceso_actual.calcular_tiempo_retorno(self.tiempo_actual)
             self.proceso_actual.estado = "terminado"
             self.procesos_terminados.append(self.proceso_actual)
-            self.t_fin_por_proceso[self.proceso_actual.nombre] = self.tiempo_actual
+            self.t_fin_por_proceso[self.proceso_actual.pid] = self.tiempo_actual
             self.t_ultimo_tfp = self.tiempo_actual
             
             self.resultados.append({
@@ -516,19 +520,19 @@ class RR:
 
                 # Determinar el nombre del proceso para el evento de fin
                 nombre_proceso = None
+                proceso_fin = None
 
                 if tipo_original == 'tfp':
                     # Para TFP, buscar el proceso que está terminando
-                    for proceso in self.procesos_terminados:
-                        if proceso.estado == "terminando":
-                            nombre_proceso = proceso.nombre
-                            break
+                    if self.procesos_terminando:
+                        nombre_proceso = self.procesos_terminando[0].nombre
                     # Finaliza el proceso completamente (esto puede sobrescribir self.tipo_bloqueo)
                     self.finalizar_proceso_completamente()
 
                 elif tipo_original in ['tip', 'tcp'] and self.proceso_actual is not None:
                     # Para TIP y TCP, usar el proceso actual
-                    nombre_proceso = self.proceso_actual.nombre
+                    proceso_fin = self.proceso_actual
+                    nombre_proceso = proceso_fin.nombre
 
                     # Verificar si después del TIP se debe aplicar TCP
                     if tipo_original == 'tip' and self.aplicar_tcp_despues_tip:
@@ -561,6 +565,8 @@ class RR:
 
                 # Registrar evento de fin con el tipo ORIGINAL del bloqueo
                 if nombre_proceso:
+                    if tipo_original == 'tcp':
+                        self.actualizar_tcp_abiertos(proceso_fin, -1)
                     self.resultados.append({
                         'tiempo': self.tiempo_actual,
                         'proceso': nombre_proceso,
@@ -577,24 +583,3 @@ class RR:
 
             return True  # Aun esta bloqueado
         return False  # Ya terminó el bloqueo
-
-    
-    def finalizar_proceso_completamente(self):
-        """Finaliza completamente un proceso después del TFP."""
-        # Buscar el proceso que estaba terminando
-        for proceso in self.procesos_terminados:
-            if proceso.estado == "terminando":
-                # Registrar tiempo de finalización (con TFP)
-                self.t_fin_por_proceso[proceso.nombre] = self.tiempo_actual
-                self.t_ultimo_tfp = self.tiempo_actual
-                
-                proceso.calcular_tiempo_retorno(self.tiempo_actual)
-                proceso.estado = "terminado"
-                
-                self.resultados.append({
-                    'tiempo': self.tiempo_actual,
-                    'proceso': proceso.nombre,
-                    'evento': 'terminacion',
-                    'estado': 'terminado'
-                })
-                break
@@ -1,6 +1,18 @@
-class SRTN:
-    def __init__(self, procesos, tiempo_tip, tiempo_tcp, tiempo_tfp):
+from collections import deque
+from operator import attrgetter
+
+from .cola_bloqueados import ColaBloqueados
+from .cola_listos import ColaPrioridad
+from .planificador import Planificador
+from .registro_eventos import crear_destino_eventos
+
+
+class SRTN(Planificador):
+    def __init__(self, procesos, tiempo_tip, tiempo_tcp, tiempo_tfp, tiempo_maximo=None, max_eventos=None,
+                 destino_eventos=None):
         self.procesos = procesos
+        # Índice de llegadas ordenado por tiempo de arribo
+        self.preparar_llegadas()
         
         # Instante del tiempo actual
         self.tiempo_actual = 0
@@ -8,19 +20,27 @@ class SRTN:
         # No hay procesos ejecutandose en la primera instancia de tiempo
         self.proceso_actual = None
         
-        # Colas vacias
-        self.cola_listos = []
-        self.procesos_bloqueados = []
+        # Colas vacias (la de listos ordenada por duración restante de ráfaga)
+        self.cola_listos = ColaPrioridad(attrgetter('duracion_rafagas_cpu'))
+        self.procesos_bloqueados = ColaBloqueados()
         self.procesos_terminados = []
+        # Procesos cumpliendo su TFP, en el orden en que terminaron
+        self.procesos_terminando = deque()
         
-        # Lista para guardar los eventos que fueron sucediendo
-        self.resultados = []
+        # Destino de los eventos que van sucediendo (por defecto se guardan todos)
+        self.resultados = crear_destino_eventos(destino_eventos)
 
         # Tiempos del SO
         self.tiempo_tip = tiempo_tip
         self.tiempo_tcp = tiempo_tcp
         self.tiempo_tfp = tiempo_tfp
 
+        # Horizonte de la simulación (None = sin límite)
+        self.tiempo_maximo = tiempo_maximo
+        self.max_eventos = max_eventos
+        # Indica si la simulación se cortó antes de terminar todos los procesos
+        self.truncado = False
+
         self.tiempo_restante_bloqueo = 0
         
         # TIP, TCP O TFP
@@ -30,61 +50,23 @@ class SRTN:
         self.cpu_proc = 0  # Tiempo real de CPU ejecutando procesos
         self.cpu_so = 0    # Tiempo real de CPU en labores del SO
         self.cpu_idle = 0  # Tiempo real de CPU desocupada
+        self.cambios_contexto = 0  # Cantidad de cambios de contexto (TCP aplicados)
         
         # Tiempos de referencia para cálculos
         self.t_primer_arribo = None
         self.t_ultimo_tfp = None
         
-        # Contadores por proceso
-        self.cpu_proc_por_proceso = {}
-        self.t_arribo_por_proceso = {}
-        self.t_fin_por_proceso = {}
-        self.t_listo_por_proceso = {}
-
-    def procesar_llegadas(self):
-        for proceso in self.procesos:
-            if proceso.tiempo_arrivo == self.tiempo_actual:
-                self.insertar_ordenado(proceso)
-                proceso.estado = "listo"
-                
-                # Registrar primer arribo
-                if self.t_primer_arribo is None:
-                    self.t_primer_arribo = self.tiempo_actual
-                
-                # Registrar tiempo de arribo del proceso
-                self.t_arribo_por_proceso[proceso.nombre] = self.tiempo_actual
-                self.cpu_proc_por_proceso[proceso.nombre] = 0
-                self.t_listo_por_proceso[proceso.nombre] = 0
-
-                # Registrar eventos
-                self.resultados.append({
-                    'tiempo': self.tiempo_actual,
-                    'proceso': proceso.nombre,
-                    'evento': 'llegada',
-                    'estado': 'arrivo'
-                })
+        # Contadores por proceso, indexados por pid
+        self.preparar_contadores()
 
     def insertar_ordenado(self, proceso):
         """
         Inserta el proceso en la cola de listos manteniendo el orden SRTN.
-        Para SRTN, el orden se basa en la duración restante de ráfaga de CPU.
+        Para SRTN, el orden se basa en la duración restante de ráfaga de CPU
+        (menor primero; a igual duración, por orden de llegada a la cola).
+        La duración restante de un proceso no cambia mientras está en la cola.
         """
-        if len(self.cola_listos) == 0:
-            self.cola_listos.append(proceso)
-            return
-
-        # Ordenar por duración restante de ráfaga de CPU (menor primero)
-        duracion_restante_proceso = proceso.duracion_rafagas_cpu
-        
-        for i, proceso_en_cola in enumerate(self.cola_listos):
-            duracion_restante_en_cola = proceso_en_cola.duracion_rafagas_cpu
-            
-            if duracion_restante_proceso < duracion_restante_en_cola:
-                # Insertar antes del proceso actual
-                self.cola_listos.insert(i, proceso)
-                return
-
-        self.cola_listos.append(proceso)
+        self.cola_listos.insertar(proceso)
 
     def verificar_preemption(self):
         """
@@ -94,15 +76,21 @@ class SRTN:
         if self.proceso_actual is None or len(self.cola_listos) == 0:
             return False
             
-        # Ordenar la cola por duración restante (menor primero)
-        self.cola_listos.sort(key=lambda p: p.duracion_rafagas_cpu)
-        
         # Si hay un proceso con menor duración restante que el actual
-        if self.cola_listos[0].duracion_rafagas_cpu < self.proceso_actual.duracion_rafagas_cpu:
+        if self.cola_listos.primero().duracion_rafagas_cpu < self.proceso_actual.duracion_rafagas_cpu:
             return True
             
         return False
 
+    def limite_salto_ejecucion(self):
+        """
+        Ticks que puede ejecutar el proceso actual sin terminar su rafaga
+        ni ser preemptado por un proceso mas corto.
+        """
+        if self.verificar_preemption():
+            return 0
+        return self.proceso_actual.duracion_rafagas_cpu - 1
+
     def preemptar_proceso_actual(self):
         """
         Preempta el proceso actual y lo devuelve a la cola de listos
@@ -111,10 +99,6 @@ class SRTN:
         if self.proceso_actual is None or len(self.cola_listos) == 0:
             return
             
-        # Ordenar la cola para obtener el proceso más corto
-        self.cola_listos.sort(key=lambda p: p.duracion_rafagas_cpu)
-        proceso_mas_corto = self.cola_listos[0]
-        
         # El proceso actual vuelve a la cola de listos con su duración restante
         self.proceso_actual.estado = "listo"
         self.insertar_ordenado(self.proceso_actual)
@@ -136,62 +120,49 @@ class SRTN:
         
         
         # El proceso más corto toma la CPU
-        self.proceso_actual = self.cola_listos.pop(0)
+        self.proceso_actual = self.cola_listos.extraer()
         
         # Aplicar TCP ya que es un cambio de proceso
         self.aplicar_tcp()
 
-    def ejecutar(self):
-        # Límite de seguridad para evitar bucles infinitos
-        tiempo_maximo = 1000
-        iteraciones = 0
+    def procesar_tick(self):
+        """Procesa un tick de simulación en el que ocurre algún evento."""
+        self.procesar_llegadas()
 
-        while self.hay_procesos_pendientes() and iteraciones < tiempo_maximo:
-            iteraciones += 1
-
-            self.procesar_llegadas()
-
-            # Procesar tiempo de TIP/TCP/TFP
-            if self.procesar_tiempo_bloqueo():
-                # Procesar procesos bloqueados incluso si hay TIP/TCP/TFP activo
-                self.procesar_procesos_bloqueados()
-                self.tiempo_actual += 1
-                continue
-
-            # Procesar procesos bloqueados
+        # Procesar tiempo de TIP/TCP/TFP
+        if self.procesar_tiempo_bloqueo():
+            # Procesar procesos bloqueados incluso si hay TIP/TCP/TFP activo
             self.procesar_procesos_bloqueados()
+            self.tiempo_actual += 1
+            return
 
-            # Verificar preemption después de procesar llegadas y procesos bloqueados
-            if self.verificar_preemption():
-                self.preemptar_proceso_actual()
+        # Procesar procesos bloqueados
+        self.procesar_procesos_bloqueados()
 
-            # Incrementar tiempo de espera para procesos en cola de listos
-            for proceso in self.cola_listos:
-                proceso.tiempo_en_listo += 1
-                # Acumular tiempo en estado listo (solo después de pagar TIP)
-                if proceso.nombre in self.t_listo_por_proceso:
-                    self.t_listo_por_proceso[proceso.nombre] += 1
+        # Verificar preemption después de procesar llegadas y procesos bloqueados
+        if self.verificar_preemption():
+            self.preemptar_proceso_actual()
 
-            # Si no hay proceso ejecutandose, selecciona uno
-            if self.proceso_actual is None:
-                self.seleccionar_siguiente_proceso()
+        # Los procesos en cola de listos acumulan un tick de espera
+        # (se les suma a su tiempo en listo cuando salen de la cola)
+        self.cola_listos.acumular_espera(1)
 
-            # Si hay proceso ejecutandose, ejecutarlo
-            if self.proceso_actual is not None:
-                self.ejecutar_proceso_actual()
+        # Si no hay proceso ejecutandose, selecciona uno
+        if self.proceso_actual is None:
+            self.seleccionar_siguiente_proceso()
 
-            # Calcular CPU_idle: si no hay proceso ejecutándose ni labores del SO
-            if (self.proceso_actual is None and 
-                self.tiempo_restante_bloqueo == 0 and 
-                len(self.cola_listos) == 0):
-                self.cpu_idle += 1
+        # Si hay proceso ejecutandose, ejecutarlo
+        if self.proceso_actual is not None:
+            self.ejecutar_proceso_actual()
 
-            # Avanzar una unidad de tiempo
-            self.tiempo_actual += 1
-        
-        if iteraciones >= tiempo_maximo:
-            print(f"Advertencia: Simulación terminada por límite de tiempo ({tiempo_maximo} iteraciones)")
-            print(f"Estado final - Tiempo: {self.tiempo_actual}, Iteraciones: {iteraciones}")
+        # Calcular CPU_idle: si no hay proceso ejecutándose ni labores del SO
+        if (self.proceso_actual is None and 
+            self.tiempo_restante_bloqueo == 0 and 
+            len(self.cola_listos) == 0):
+            self.cpu_idle += 1
+
+        # Avanzar una unidad de tiempo
+        self.tiempo_actual += 1
     
     def obtener_estadisticas_cpu(self):
         """Retorna las estadísticas de CPU."""
@@ -218,10 +189,10 @@ class SRTN:
             't_total': t_total,
             't_primer_arribo': self.t_primer_arribo,
             't_ultimo_tfp': self.t_ultimo_tfp,
-            'cpu_proc_por_proceso': self.cpu_proc_por_proceso,
-            't_arribo_por_proceso': self.t_arribo_por_proceso,
-            't_fin_por_proceso': self.t_fin_por_proceso,
-            't_listo_por_proceso': self.t_listo_por_proceso
+            'cpu_proc_por_proceso': self.contadores_por_nombre(self.cpu_proc_por_proceso),
+            't_arribo_por_proceso': self.contadores_por_nombre(self.t_arribo_por_proceso),
+            't_fin_por_proceso': self.contadores_por_nombre(self.t_fin_por_proceso),
+            't_listo_por_proceso': self.contadores_por_nombre(self.t_listo_por_proceso)
         }
 
     def ejecutar_proceso_actual(self):
@@ -231,7 +202,7 @@ class SRTN:
         # Se consume una unidad de tiempo de CPU ejecutando proceso
         self.proceso_actual.duracion_rafagas_cpu -= 1
         self.cpu_proc += 1  # Acumular tiempo real de CPU ejecutando procesos
-        self.cpu_proc_por_proceso[self.proceso_actual.nombre] += 1  # Acumular por proceso
+        self.cpu_proc_por_proceso[self.proceso_actual.pid] += 1  # Acumular por proceso
 
         if self.proceso_actual.duracion_rafagas_cpu == 0:
             self.proceso_actual.cantidad_rafagas_cpu -= 1
@@ -248,7 +219,7 @@ class SRTN:
         """
         if len(self.cola_listos) > 0:
             # Seleccionar el primer proceso (menor duración restante, ya está ordenado)
-            self.proceso_actual = self.cola_listos.pop(0)
+            self.proceso_actual = self.cola_listos.extraer()
             
             # Aplicar TIP o TCP según corresponda
             if self.proceso_actual.proceso_nuevo:
@@ -257,22 +228,6 @@ class SRTN:
             else:
                 self.aplicar_tcp()
     
-    def hay_procesos_pendientes(self):
-        """
-        Verifica si quedan trabajos por hacer:
-            - hay procesos en cola de listos
-            - hay procesos bloqueados
-            - hay procesos ejecutandose
-            - hay procesos que aun no llegaron a su tiempo total
-            de ejecucion
-        """
-        resultado = (len(self.cola_listos) > 0 or 
-        len(self.procesos_bloqueados) > 0 or (self.proceso_actual is not None) or
-        (any(p.tiempo_arrivo > self.tiempo_actual for p in self.procesos)) or
-        (any(p.estado == "terminando" for p in self.procesos)))
-        
-        return resultado
-
     def bloquear_proceso(self):
         # Guardar tiempo de bloqueo y duración original de I/O
         self.proceso_actual.tiempo_bloqueo = self.tiempo_actual
@@ -282,7 +237,8 @@ class SRTN:
         self.proceso_actual.duracion_rafagas_io = self.proceso_actual.duracion_rafagas_io_original
         
         self.proceso_actual.estado = "bloqueado"
-        self.procesos_bloqueados.append(self.proceso_actual)
+        self.procesos_bloqueados.insertar(self.proceso_actual, self.tiempo_actual,
+                                         self.proceso_actual.duracion_rafagas_io)
 
         # Registrar evento de fin de ejecución
         self.resultados.append({
@@ -324,9 +280,10 @@ class SRTN:
             self.aplicar_tfp()
             self.proceso_actual.estado = "terminando"
             self.procesos_terminados.append(self.proceso_actual)
+            self.procesos_terminando.append(self.proceso_actual)
         else: 
             # Registrar tiempo de finalización (sin TFP)
-            self.t_fin_por_proceso[self.proceso_actual.nombre] = self.tiempo_actual
+            self.t_fin_por_proceso[self.proceso_actual.pid] = self.tiempo_actual
             # Para TFP = 0, no hay TFP real, por lo que no registramos t_ultimo_tfp
             # El T_total se calculará usando tiempo_actual - 1
             
@@ -349,33 +306,25 @@ class SRTN:
         a la cola de listos
         """
         
-        procesos_que_terminaron_io = []
-
-        for proceso in self.procesos_bloqueados:
-            # Solo procesar procesos que no se bloquearon en este tiempo
-            if proceso.tiempo_bloqueo < self.tiempo_actual:
-                # Decrementar la duración de I/O
-                proceso.duracion_rafagas_io -= 1
-                
-                if proceso.duracion_rafagas_io == 0:
-                    procesos_que_terminaron_io.append(proceso)
-                    proceso.estado = "listo"
-                    
-                    # Reiniciar duracion de CPU para la siguiente ejecución
-                    proceso.duracion_rafagas_cpu = proceso.get_duracion_rafagas_cpu()
+        # Solo se recorren los que terminan su I/O en este tiempo (un proceso
+        # bloqueado en el tiempo actual termina recien en un tiempo posterior)
+        for proceso in self.procesos_bloqueados.extraer_terminados(self.tiempo_actual):
+            proceso.duracion_rafagas_io = 0
+            proceso.estado = "listo"
+            
+            # Reiniciar duracion de CPU para la siguiente ejecución
+            proceso.duracion_rafagas_cpu = proceso.get_duracion_rafagas_cpu()
 
-                    # Insertar el proceso en la cola de listos manteniendo el orden SRTN
-                    self.insertar_ordenado(proceso)
+            # Insertar el proceso en la cola de listos manteniendo el orden SRTN
+            self.insertar_ordenado(proceso)
 
-                    # Registrar evento de fin de I/O en el tiempo actual del simulador
-                    self.resultados.append({
-                        'tiempo': self.tiempo_actual,
-                        'proceso': proceso.nombre,
-                        'evento': 'fin_io',
-                        'estado': 'listo'
-                    })
-        for proceso in procesos_que_terminaron_io:
-            self.procesos_bloqueados.remove(proceso)
+            # Registrar evento de fin de I/O en el tiempo actual del simulador
+            self.resultados.append({
+                'tiempo': self.tiempo_actual,
+                'proceso': proceso.nombre,
+                'evento': 'fin_io',
+                'estado': 'listo'
+            })
 
     def aplicar_tip(self):
         if self.tiempo_tip > 0:
@@ -401,6 +350,7 @@ class SRTN:
             })
 
     def aplicar_tcp(self):
+        self.cambios_contexto += 1
         if self.tiempo_tcp > 0:
             self.tiempo_restante_bloqueo = self.tiempo_tcp
             self.tipo_bloqueo = "tcp"
@@ -441,7 +391,7 @@ class SRTN:
             self.proceso_actual.calcular_tiempo_retorno(self.tiempo_actual)
             self.proceso_actual.estado = "terminado"
             self.procesos_terminados.append(self.proceso_actual)
-            self.t_fin_por_proceso[self.proceso_actual.nombre] = self.tiempo_actual
+            self.t_fin_por_proceso[self.proceso_actual.pid] = self.tiempo_actual
             self.t_ultimo_tfp = self.tiempo_actual
             
             self.resultados.append({
@@ -463,10 +413,8 @@ class SRTN:
                 nombre_proceso = None
                 if self.tipo_bloqueo == 'tfp':
                     # Para TFP, buscar el proceso que está terminando
-                    for proceso in self.procesos_terminados:
-                        if proceso.estado == "terminando":
-                            nombre_proceso = proceso.nombre
-                            break
+                    if self.procesos_terminando:
+                        nombre_proceso = self.procesos_terminando[0].nombre
                     self.finalizar_proceso_completamente()
                 elif self.tipo_bloqueo in ['tip', 'tcp'] and self.proceso_actual is not None:
                     # Para TIP y TCP, usar el proceso actual
@@ -474,11 +422,8 @@ class SRTN:
                     
                     # Verificar si hay un proceso más prioritario en la cola de listos
                     if len(self.cola_listos) > 0:
-                        # Ordenar la cola por duración restante de ráfaga de CPU (menor primero)
-                        self.cola_listos.sort(key=lambda p: p.duracion_rafagas_cpu)
-                        
-                        # Verificar si el primer proceso en la cola es más prioritario
-                        proceso_mas_prioritario = self.cola_listos[0]
+                        # Verificar si el primer proceso en la cola (menor duración restante) es más prioritario
+                        proceso_mas_prioritario = self.cola_listos.primero()
                         if (proceso_mas_prioritario.duracion_rafagas_cpu < 
                             self.proceso_actual.duracion_rafagas_cpu):
                             
@@ -487,13 +432,13 @@ class SRTN:
                             self.proceso_actual.estado = "listo"
                             # Restar 1 al contador de CPU del proceso que cede la CPU
                             self.cpu_proc -= 1
-                            self.cpu_proc_por_proceso[self.proceso_actual.nombre] -= 1
+                            self.cpu_proc_por_proceso[self.proceso_actual.pid] -= 1
                             self.insertar_ordenado(self.proceso_actual)
                             self.proceso_actual = None
                             
                             # El proceso más prioritario debe ejecutarse directamente
                             # (sin ejecutar TCP ya que el TCP ya fue consumido)
-                            self.proceso_actual = self.cola_listos.pop(0)
+                            self.proceso_actual = self.cola_listos.extraer()
                             self.proceso_actual.estado = "ejecutando"
                             
                             # Registrar evento de cambio de proceso
@@ -555,23 +500,3 @@ class SRTN:
             
             return True # Aun esta bloqueado
         return False # Ya terminó el bloqueo
-    
-    def finalizar_proceso_completamente(self):
-        """Finaliza completamente un proceso después del TFP."""
-        # Buscar el proceso que estaba terminando
-        for proceso in self.procesos_terminados:
-            if proceso.estado == "terminando":
-                # Registrar tiempo de finalización (con TFP)
-                self.t_fin_por_proceso[proceso.nombre] = self.tiempo_actual
-                self.t_ultimo_tfp = self.tiempo_actual
-                
-                proceso.calcular_tiempo_retorno(self.tiempo_actual)
-                proceso.estado = "terminado"
-                
-                self.resultados.append({
-                    'tiempo': self.tiempo_actual,
-                    'proceso': proceso.nombre,
-                    'evento': 'terminacion',
-                    'estado': 'terminado'
-                })
-                break
\ No newline at end of file
@@ -1,7 +1,15 @@
+from .planificador import Planificador, SimulacionCancelada
+from .cola_listos import ColaListos, ColaFIFO, ColaPrioridad
+from .cola_bloqueados import ColaBloqueados
+from .instrumentacion import Instrumentacion
+from .registro_eventos import (DestinoEventos, RegistroEventos, DescartarEventos,
+                               FuncionEventos, EventosNDJSON, ResumenEventos)
 from .FCFS import FCFS
 from .RR import RR
 from .SPN import SPN
 from .SRTN import SRTN
 from .PE import PE
 
-__all__ = ['FCFS', 'RR', 'SPN', 'SRTN', 'PE']
\ No newline at end of file
+__all__ = ['Planificador', 'SimulacionCancelada', 'ColaListos', 'ColaFIFO', 'ColaPrioridad', 'ColaBloqueados',
+           'DestinoEventos', 'RegistroEventos', 'DescartarEventos', 'FuncionEventos',
+           'EventosNDJSON', 'ResumenEventos', 'Instrumentacion', 'FCFS', 'RR', 'SPN', 'SRTN', 'PE']
\ No newline at end of file
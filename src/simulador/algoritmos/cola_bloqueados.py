@@ -0,0 +1,64 @@
+"""
+Cola de procesos bloqueados haciendo I/O.
+"""
+
+import heapq
+
+
+class ColaBloqueados:
+    """
+    Procesos bloqueados ordenados por el tiempo absoluto en el que terminan su
+    I/O, sobre un heap binario: O(log n) para bloquear y para cada fin de I/O,
+    O(1) para consultar el próximo fin. No hace falta recorrer los bloqueados
+    en cada tick para descontarles el I/O.
+
+    A igual tiempo de fin salen en el orden en que se bloquearon, que es el
+    orden en que se recorría la lista de bloqueados.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._secuencia = 0
+        # Procesos con I/O de duración 0 (o negativa): nunca terminan su I/O
+        self._sin_fin = []
+
+    def insertar(self, proceso, tiempo_bloqueo, duracion_io):
+        """
+        Agrega un proceso que se bloquea para hacer I/O.
+
+        Args:
+            proceso: Proceso que se bloquea
+            tiempo_bloqueo: Tiempo en el que se bloquea
+            duracion_io: Duración de su ráfaga de I/O. Si es menor o igual a 0
+                         el proceso nunca termina su I/O
+        """
+        if duracion_io <= 0:
+            self._sin_fin.append(proceso)
+            return
+        heapq.heappush(self._heap, (tiempo_bloqueo + duracion_io, self._secuencia, proceso))
+        self._secuencia += 1
+
+    def proximo_fin(self):
+        """Retorna el tiempo del próximo fin de I/O, o None si no hay ninguno."""
+        if self._heap:
+            return self._heap[0][0]
+        return None
+
+    def extraer_terminados(self, tiempo):
+        """
+        Saca y retorna, en orden, los procesos cuyo I/O termina hasta el
+        tiempo indicado.
+        """
+        terminados = []
+        while self._heap and self._heap[0][0] <= tiempo:
+            terminados.append(heapq.heappop(self._heap)[2])
+        return terminados
+
+    def __len__(self):
+        return len(self._heap) + len(self._sin_fin)
+
+    def __iter__(self):
+        """Recorre los procesos bloqueados (sin orden garantizado)."""
+        for entrada in self._heap:
+            yield entrada[2]
+        yield from self._sin_fin
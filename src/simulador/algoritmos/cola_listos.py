@@ -0,0 +1,171 @@
+"""
+Colas de listos usadas por los algoritmos de planificación.
+"""
+
+import heapq
+from abc import ABC, abstractmethod
+from collections import deque
+
+
+class ColaListos(ABC):
+    """
+    Interfaz común de las colas de listos.
+
+    Las implementaciones deben permitir insertar un proceso, consultar y
+    extraer el próximo a ejecutar, y recorrer los procesos encolados.
+
+    El tiempo en listo se contabiliza por marcas en lugar de recorrer la cola
+    en cada tick: la cola lleva un reloj de espera que avanza en los ticks en
+    los que los procesos encolados acumulan tiempo en listo, y cada proceso
+    guarda el valor del reloj al entrar. Al salir se le suma la diferencia a
+    su `tiempo_en_listo`.
+    """
+
+    def acumular_espera(self, ticks=1):
+        """Todos los procesos encolados acumulan `ticks` de tiempo en listo."""
+        self.reloj_espera += ticks
+
+    @abstractmethod
+    def liquidar_espera(self):
+        """
+        Suma a `tiempo_en_listo` la espera acumulada por los procesos que
+        siguen encolados, sin sacarlos de la cola.
+        """
+
+    def _liquidar(self, ingreso, proceso):
+        proceso.tiempo_en_listo += self.reloj_espera - ingreso
+        return proceso
+
+    @abstractmethod
+    def insertar(self, proceso):
+        """Agrega un proceso a la cola."""
+
+    @abstractmethod
+    def primero(self):
+        """Retorna el próximo proceso a ejecutar sin sacarlo de la cola."""
+
+    @abstractmethod
+    def extraer(self):
+        """Saca y retorna el próximo proceso a ejecutar."""
+
+    @abstractmethod
+    def extraer_primero_que(self, condicion):
+        """
+        Saca y retorna el primer proceso (en orden de la cola) que cumple
+        la condición, o None si ninguno la cumple.
+        """
+
+    @abstractmethod
+    def __len__(self):
+        """Cantidad de procesos encolados."""
+
+    @abstractmethod
+    def __iter__(self):
+        """Recorre los procesos encolados."""
+
+
+class ColaFIFO(ColaListos):
+    """Cola de listos por orden de llegada (FCFS y Round Robin)."""
+
+    def __init__(self):
+        self.reloj_espera = 0
+        # Entradas (reloj de espera al encolarse, proceso)
+        self._procesos = deque()
+
+    def insertar(self, proceso):
+        self._procesos.append((self.reloj_espera, proceso))
+
+    def primero(self):
+        return self._procesos[0][1]
+
+    def extraer(self):
+        return self._liquidar(*self._procesos.popleft())
+
+    def extraer_primero_que(self, condicion):
+        for i, (ingreso, proceso) in enumerate(self._procesos):
+            if condicion(proceso):
+                del self._procesos[i]
+                return self._liquidar(ingreso, proceso)
+        return None
+
+    def liquidar_espera(self):
+        for ingreso, proceso in self._procesos:
+            self._liquidar(ingreso, proceso)
+        self._procesos = deque((self.reloj_espera, proceso) for _, proceso in self._procesos)
+
+    def __len__(self):
+        return len(self._procesos)
+
+    def __iter__(self):
+        return (proceso for _, proceso in self._procesos)
+
+
+class ColaPrioridad(ColaListos):
+    """
+    Cola de listos ordenada por una clave (por defecto, menor clave primero)
+    sobre un heap binario: O(log n) para insertar y extraer, O(1) para
+    consultar el primero.
+
+    A igual clave se respeta el orden de inserción (FIFO), que es el mismo
+    orden que resultaba de insertar ordenado en una lista y reordenarla con
+    un sort estable.
+    """
+
+    def __init__(self, clave, descendente=False):
+        """
+        Args:
+            clave: Función que recibe un proceso y retorna su clave numérica
+                   de orden. Se evalúa una sola vez, al insertar.
+            descendente: Si es True sale primero el de mayor clave
+        """
+        self.clave = clave
+        self.descendente = descendente
+        self.reloj_espera = 0
+        # Entradas (clave, secuencia, reloj de espera al encolarse, proceso)
+        self._heap = []
+        self._secuencia = 0
+
+    def insertar(self, proceso):
+        valor = self.clave(proceso)
+        if self.descendente:
+            valor = -valor
+        heapq.heappush(self._heap, (valor, self._secuencia, self.reloj_espera, proceso))
+        self._secuencia += 1
+
+    def primero(self):
+        return self._heap[0][3]
+
+    def extraer(self):
+        _, _, ingreso, proceso = heapq.heappop(self._heap)
+        return self._liquidar(ingreso, proceso)
+
+    def extraer_primero_que(self, condicion):
+        # Sacar en orden hasta encontrar uno que cumpla y devolver el resto
+        # con su misma clave y secuencia para no alterar el orden
+        descartados = []
+        encontrado = None
+        while self._heap:
+            entrada = heapq.heappop(self._heap)
+            if condicion(entrada[3]):
+                encontrado = self._liquidar(entrada[2], entrada[3])
+                break
+            descartados.append(entrada)
+
+        for entrada in descartados:
+            heapq.heappush(self._heap, entrada)
+
+        return encontrado
+
+    def liquidar_espera(self):
+        # Cambiar solo la marca no altera el orden: clave y secuencia son únicas
+        for valor, secuencia, ingreso, proceso in self._heap:
+            self._liquidar(ingreso, proceso)
+        self._heap = [(valor, secuencia, self.reloj_espera, proceso)
+                      for valor, secuencia, _, proceso in self._heap]
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __iter__(self):
+        """Recorre los procesos encolados (sin orden garantizado)."""
+        return (entrada[3] for entrada in self._heap)
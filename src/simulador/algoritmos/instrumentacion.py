@@ -0,0 +1,197 @@
+"""
+Instrumentación opcional del bucle de simulación.
+
+Mide cuántas veces se llama y cuánto tiempo lleva cada fase del bucle
+(llegadas, TIP/TCP/TFP, bloqueados, espera en listos, selección, ejecución,
+cálculo y aplicación de saltos) y cuenta los eventos por tipo.
+
+Para que no cueste nada cuando está apagada, no hay ningún chequeo en el
+bucle: al instalarla se reemplazan los métodos de cada fase por versiones
+medidas, como atributos de la instancia (tapan a los de la clase), y al
+desinstalarla se borran. Los eventos se cuentan poniendo delante del destino
+de eventos un EventosContados, que se saca al desinstalarla.
+"""
+
+from time import perf_counter
+
+# Fase -> métodos del planificador que la implementan (los que el algoritmo tenga)
+FASES = (
+    ('bucle', ('avanzar',)),
+    ('control', ('hay_procesos_pendientes', 'horizonte_alcanzado')),
+    ('calculo_salto', ('calcular_salto',)),
+    ('salto', ('avanzar_salto',)),
+    ('tick', ('procesar_tick',)),
+    ('llegadas', ('procesar_llegadas',)),
+    ('tiempo_bloqueo', ('procesar_tiempo_bloqueo',)),
+    ('bloqueados', ('procesar_procesos_bloqueados',)),
+    ('seleccion', ('seleccionar_siguiente_proceso',)),
+    ('preemption', ('verificar_preemption', 'verificar_preemption_quantum')),
+    ('ejecucion', ('ejecutar_proceso_actual',)),
+    ('liquidacion', ('liquidar_tiempo_listo',)),
+)
+
+# Fase de los métodos de la cola de listos
+FASE_ESPERA = 'tiempo_listo'
+
+
+class Instrumentacion:
+    """
+    Contadores de llamadas, tiempo por fase y eventos por tipo de un
+    planificador.
+
+    Los tiempos son exclusivos: el de una fase no incluye el de las fases que
+    llama (por ejemplo, el de 'tick' no incluye el de 'llegadas'), así que
+    sumados dan el tiempo total medido.
+    """
+
+    def __init__(self):
+        self.llamadas = {}
+        self.tiempos = {}
+        self.eventos = {}
+        # Tiempo de las fases anidadas en cada llamada en curso
+        self._pila = []
+        # (objeto, nombre del atributo) reemplazados al instalar
+        self._instalados = []
+        # Planificador cuyo destino de eventos se envolvió al instalar
+        self._planificador = None
+
+    def instalar(self, planificador):
+        """Reemplaza los métodos de cada fase del planificador por versiones medidas."""
+        for fase, metodos in FASES:
+            for metodo in metodos:
+                if hasattr(planificador, metodo):
+                    self._medir(planificador, metodo, fase)
+        self._medir(planificador.cola_listos, 'acumular_espera', FASE_ESPERA)
+        self._medir(planificador.cola_listos, 'liquidar_espera', FASE_ESPERA)
+        self._contar_eventos(planificador)
+
+    def desinstalar(self):
+        """Vuelve a los métodos originales (los de la clase) y al destino de eventos."""
+        for objeto, metodo in self._instalados:
+            objeto.__dict__.pop(metodo, None)
+        self._instalados = []
+        planificador = self._planificador
+        if planificador is not None and isinstance(planificador.resultados, EventosContados):
+            planificador.resultados = planificador.resultados.destino
+        self._planificador = None
+
+    def _medir(self, objeto, metodo, fase):
+        funcion = getattr(objeto, metodo)
+        pila = self._pila
+        llamadas = self.llamadas
+        tiempos = self.tiempos
+        llamadas.setdefault(fase, 0)
+        tiempos.setdefault(fase, 0.0)
+
+        def medido(*args, **kwargs):
+            pila.append(0.0)
+            inicio = perf_counter()
+            try:
+                return funcion(*args, **kwargs)
+            finally:
+                transcurrido = perf_counter() - inicio
+                anidado = pila.pop()
+                llamadas[fase] += 1
+                tiempos[fase] += transcurrido - anidado
+                if pila:
+                    pila[-1] += transcurrido
+
+        setattr(objeto, metodo, medido)
+        self._instalados.append((objeto, metodo))
+
+    def _contar_eventos(self, planificador):
+        # Se envuelve el destino en lugar de reemplazar su append: una lista
+        # o un destino con __slots__ no aceptan atributos nuevos
+        destino = planificador.resultados
+        if isinstance(destino, EventosContados):
+            destino = destino.destino
+        planificador.resultados = EventosContados(destino, self.eventos)
+        self._planificador = planificador
+
+    def resumen(self):
+        """
+        Retorna las mediciones como diccionario:
+            {'fases': {fase: {'llamadas', 'tiempo', 'porcentaje'}},
+             'tiempo_total': suma de los tiempos de las fases,
+             'eventos': {tipo de evento: cantidad}}
+        """
+        total = sum(self.tiempos.values())
+        fases = {}
+        for fase in sorted(self.tiempos, key=self.tiempos.get, reverse=True):
+            fases[fase] = {
+                'llamadas': self.llamadas[fase],
+                'tiempo': self.tiempos[fase],
+                'porcentaje': self.tiempos[fase] / total * 100 if total > 0 else 0
+            }
+        return {
+            'fases': fases,
+            'tiempo_total': total,
+            'eventos': dict(sorted(self.eventos.items(), key=lambda item: item[1], reverse=True))
+        }
+
+
+class EventosContados:
+    """
+    Destino de eventos que cuenta cada evento por tipo y lo pasa a otro
+    destino (lista, RegistroEventos o cualquier objeto con append). El resto
+    de los atributos y operaciones van al destino envuelto, y al copiarlo o
+    serializarlo queda solo el destino.
+    """
+
+    __slots__ = ('destino', 'eventos')
+
+    def __init__(self, destino, eventos):
+        """
+        Args:
+            destino: Destino de eventos envuelto
+            eventos: Diccionario {tipo de evento: cantidad} a incrementar
+        """
+        self.destino = destino
+        self.eventos = eventos
+
+    def append(self, evento):
+        tipo = evento['evento']
+        self.eventos[tipo] = self.eventos.get(tipo, 0) + 1
+        return self.destino.append(evento)
+
+    def __getattr__(self, nombre):
+        # Solo se llama para atributos que no son de la clase
+        return getattr(self.destino, nombre)
+
+    def __len__(self):
+        return len(self.destino)
+
+    def __iter__(self):
+        return iter(self.destino)
+
+    def __getitem__(self, indice):
+        return self.destino[indice]
+
+    def __eq__(self, otro):
+        if isinstance(otro, EventosContados):
+            otro = otro.destino
+        return self.destino == otro
+
+    __hash__ = None
+
+    def __reduce__(self):
+        return _sin_contar, (self.destino,)
+
+
+def _sin_contar(destino):
+    """Reconstruye un EventosContados copiado o serializado: solo el destino."""
+    return destino
+
+
+def formatear_instrumentacion(resumen):
+    """Retorna el resumen de una Instrumentacion como tabla de texto."""
+    lineas = [f"{'fase':<16}{'llamadas':>12}{'tiempo (s)':>14}{'%':>8}"]
+    for fase, datos in resumen['fases'].items():
+        lineas.append(f"{fase:<16}{datos['llamadas']:>12}{datos['tiempo']:>14.4f}{datos['porcentaje']:>8.1f}")
+    lineas.append(f"{'total':<16}{'':>12}{resumen['tiempo_total']:>14.4f}")
+    if resumen['eventos']:
+        lineas.append("")
+        lineas.append(f"{'evento':<24}{'cantidad':>12}")
+        for tipo, cantidad in resumen['eventos'].items():
+            lineas.append(f"{tipo:<24}{cantidad:>12}")
+    return "\n".join(lineas)
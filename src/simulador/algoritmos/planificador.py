@@ -0,0 +1,438 @@
+import math
+import pickle
+from time import perf_counter
+
+from .instrumentacion import Instrumentacion
+from .registro_eventos import crear_destino_eventos
+
+
+class SimulacionCancelada(Exception):
+    """Se lanza cuando se cancela una simulacion en curso (ver ejecutar_por_tramos)."""
+
+
+class Planificador:
+    """
+    Base comun de los algoritmos de planificacion.
+
+    Implementa el avance por eventos: en lugar de recorrer tick por tick los
+    intervalos en los que no ocurre nada, calcula cuantos ticks faltan para el
+    proximo evento (llegada, fin de rafaga, fin de I/O, fin de quantum o fin de
+    TIP/TCP/TFP) y aplica ese intervalo de una sola vez. Los ticks con eventos
+    se siguen procesando con la logica de cada algoritmo, por lo que la lista
+    de eventos y las estadisticas resultantes son las mismas.
+
+    Cada algoritmo implementa `procesar_tick()` con la logica de un tick.
+    """
+
+    # Mediciones por fase del bucle (None = sin instrumentar, ver instrumentar())
+    instrumentacion = None
+
+    def ejecutar(self):
+        """
+        Ejecuta la simulacion hasta que no queden procesos pendientes o se
+        alcance el horizonte configurado (tiempo_maximo / max_eventos).
+        Si se corta antes de terminar, `self.truncado` queda en True.
+        """
+        self.avanzar()
+        self.liquidar_tiempo_listo()
+
+    def avanzar(self):
+        """
+        Bucle principal de la simulacion (ver `ejecutar`), sin volcar al final
+        la espera de los procesos que siguen en la cola de listos.
+        """
+        while self.hay_procesos_pendientes():
+            if self.horizonte_alcanzado():
+                self.truncado = True
+                break
+
+            # Saltar de una vez los ticks en los que no ocurre ningun evento.
+            # El salto se calcula sin el horizonte y se recorta despues: con
+            # un tiempo_maximo (por ejemplo en ejecutar_hasta) el salto nunca
+            # seria infinito y no se detectaria la simulacion trabada
+            salto = self.calcular_salto(math.inf)
+            if salto == math.inf:
+                # Ningun evento futuro puede destrabar a los procesos pendientes
+                # (por ejemplo, un proceso bloqueado con I/O de duracion 0)
+                self.truncado = True
+                break
+            salto = min(salto, self.ticks_hasta_horizonte())
+
+            if salto > 0:
+                self.avanzar_salto(salto)
+            else:
+                self.procesar_tick()
+
+    def ejecutar_hasta(self, tiempo):
+        """
+        Ejecuta la simulacion hasta el tiempo indicado (o hasta que termine),
+        por ejemplo para tomar un snapshot a mitad de camino. Se puede seguir
+        llamando con tiempos mayores, o a `ejecutar()` para terminarla.
+
+        Args:
+            tiempo: Tiempo de simulacion en el que detenerse
+
+        Returns:
+            True si quedan procesos pendientes (la simulacion puede seguir)
+        """
+        tiempo_maximo = self.tiempo_maximo
+        if tiempo_maximo is None or tiempo < tiempo_maximo:
+            self.tiempo_maximo = tiempo
+        try:
+            self.avanzar()
+        finally:
+            self.tiempo_maximo = tiempo_maximo
+
+        # Detenerse en el tiempo pedido no es un corte de la simulacion
+        if self.truncado and self.tiempo_actual >= tiempo and not self.horizonte_alcanzado():
+            self.truncado = False
+
+        # La espera en listos se vuelca recien al terminar: en las pausas
+        # queda en las marcas de la cola (que el snapshot tambien guarda)
+        pendiente = not self.truncado and self.hay_procesos_pendientes()
+        if not pendiente:
+            self.liquidar_tiempo_listo()
+        return pendiente
+
+    def ejecutar_por_tramos(self, progreso=None, cancelado=None, duracion_tramo=0.05):
+        """
+        Ejecuta la simulacion como `ejecutar()`, pero en tramos (con
+        `ejecutar_hasta`) para informar el progreso y poder cancelarla, por
+        ejemplo desde otro hilo. El largo de cada tramo en tiempo simulado se
+        ajusta para que dure cerca de `duracion_tramo` segundos, asi el costo
+        de los cortes no depende del tamano de la tanda. La lista de eventos y
+        las estadisticas son las mismas que con `ejecutar()`.
+
+        Args:
+            progreso: Funcion que recibe (tiempo actual, eventos registrados,
+                      procesos terminados) despues de cada tramo
+            cancelado: Funcion sin argumentos que retorna True para detener la
+                       simulacion
+            duracion_tramo: Segundos aproximados de cada tramo
+
+        Raises:
+            SimulacionCancelada: Si cancelado() retorno True antes de terminar
+        """
+        paso = 1
+        while True:
+            if cancelado is not None and cancelado():
+                raise SimulacionCancelada()
+
+            inicio = perf_counter()
+            pendiente = self.ejecutar_hasta(self.tiempo_actual + paso)
+            transcurrido = perf_counter() - inicio
+
+            if progreso is not None:
+                progreso(self.tiempo_actual, len(self.resultados), len(self.procesos_terminados))
+            if not pendiente:
+                return
+
+            if transcurrido < duracion_tramo / 2:
+                paso *= 2
+            elif transcurrido > duracion_tramo * 2 and paso > 1:
+                paso //= 2
+
+    def instrumentar(self):
+        """
+        Activa la medicion de llamadas y tiempo por fase del bucle y la cuenta
+        de eventos por tipo (ver algoritmos.instrumentacion). Sin llamarlo la
+        simulacion no paga ningun costo por la instrumentacion.
+
+        Returns:
+            La Instrumentacion del planificador (`resumen()` da las mediciones)
+        """
+        if self.instrumentacion is None:
+            self.instrumentacion = Instrumentacion()
+            self.instrumentacion.instalar(self)
+        return self.instrumentacion
+
+    def snapshot(self, incluir_eventos=True):
+        """
+        Captura el estado completo del planificador: colas, temporizadores,
+        flags, contadores, el estado de cada proceso y los eventos
+        registrados. El estado se serializa con pickle, por lo que los
+        procesos compartidos entre colas y listas se guardan una sola vez.
+
+        Args:
+            incluir_eventos: Si es False solo se guarda la cantidad de eventos.
+                             Al restaurarlo, el RegistroEventos destino tiene que
+                             tener ya esos eventos como prefijo (se recorta el
+                             resto). Evita copiar el registro en cada snapshot
+                             cuando se toman muchos durante una misma corrida
+
+        Returns:
+            bytes con el estado, para `restore()` o `desde_snapshot()`
+        """
+        # Los metodos medidos no se pueden serializar: se quitan mientras tanto
+        instrumentacion = self.instrumentacion
+        if instrumentacion is not None:
+            instrumentacion.desinstalar()
+        try:
+            estado = dict(self.__dict__)
+            estado.pop('instrumentacion', None)
+            destino = estado.pop('resultados')
+            return pickle.dumps({
+                'clase': type(self),
+                'estado': estado,
+                'eventos': destino.instantanea() if incluir_eventos else {'cantidad': len(destino)}
+            }, protocol=pickle.HIGHEST_PROTOCOL)
+        finally:
+            if instrumentacion is not None:
+                instrumentacion.instalar(self)
+
+    def restore(self, instantanea):
+        """
+        Vuelve al estado capturado con `snapshot()`. Se conserva el destino de
+        eventos actual, que vuelve a la cantidad (y a los eventos, si los
+        guarda) del momento del snapshot.
+
+        Args:
+            instantanea: bytes retornados por `snapshot()` de un planificador
+                         de la misma clase
+        """
+        datos = pickle.loads(instantanea)
+        if datos['clase'] is not type(self):
+            raise TypeError(f"El snapshot es de {datos['clase'].__name__}, no de {type(self).__name__}")
+
+        instrumentacion = self.instrumentacion
+        if instrumentacion is not None:
+            instrumentacion.desinstalar()
+
+        destino = self.resultados
+        self.__dict__.clear()
+        self.__dict__.update(datos['estado'])
+        destino.restaurar(datos['eventos'])
+        self.resultados = destino
+
+        # La instrumentacion sigue acumulando sobre el estado restaurado
+        if instrumentacion is not None:
+            self.instrumentacion = instrumentacion
+            instrumentacion.instalar(self)
+
+    @staticmethod
+    def desde_snapshot(instantanea, destino_eventos=None):
+        """
+        Crea un planificador nuevo a partir de un snapshot, independiente del
+        original: sirve para bifurcar varias variantes desde un prefijo comun
+        de la simulacion sin volver a calcularlo.
+
+        Args:
+            instantanea: bytes retornados por `snapshot()`
+            destino_eventos: Destino de los eventos de la copia (None = guardarlos
+                             todos, empezando por los del snapshot). Si el
+                             snapshot no incluye los eventos, un RegistroEventos
+                             que ya los tenga como prefijo
+
+        Returns:
+            Planificador de la misma clase que el original
+        """
+        datos = pickle.loads(instantanea)
+        planificador = datos['clase'].__new__(datos['clase'])
+        planificador.__dict__.update(datos['estado'])
+        planificador.resultados = crear_destino_eventos(destino_eventos)
+        planificador.resultados.restaurar(datos['eventos'])
+        return planificador
+
+    def liquidar_tiempo_listo(self):
+        """
+        Vuelca la espera de los procesos que siguen en la cola de listos en su
+        tiempo en listo y actualiza el tiempo en listo por proceso.
+        """
+        self.cola_listos.liquidar_espera()
+        for proceso in self.procesos:
+            if self.t_listo_por_proceso[proceso.pid] is not None:
+                self.t_listo_por_proceso[proceso.pid] = proceso.tiempo_en_listo
+
+    def preparar_contadores(self):
+        """
+        Numera los procesos (pid = posicion en la tanda) y arma los contadores
+        por proceso como listas indexadas por pid: en el bucle se accede por
+        posicion en lugar de buscar el nombre en un diccionario, y dos
+        procesos con el mismo nombre no comparten contadores. None indica que
+        el proceso todavia no llego (o no termino, en t_fin_por_proceso).
+        """
+        for pid, proceso in enumerate(self.procesos):
+            proceso.pid = pid
+        cantidad = len(self.procesos)
+        self.cpu_proc_por_proceso = [None] * cantidad
+        self.t_arribo_por_proceso = [None] * cantidad
+        self.t_fin_por_proceso = [None] * cantidad
+        self.t_listo_por_proceso = [None] * cantidad
+
+    def contadores_por_nombre(self, contadores):
+        """
+        Convierte un contador indexado por pid en un diccionario por nombre,
+        solo con los procesos que tienen valor (para las estadisticas).
+        """
+        return {proceso.nombre: valor for proceso, valor in zip(self.procesos, contadores)
+                if valor is not None}
+
+    def preparar_llegadas(self):
+        """
+        Arma el indice de llegadas: los procesos ordenados por tiempo de arribo
+        y un cursor al proximo por llegar. El orden es estable, por lo que los
+        procesos que llegan en el mismo tick se procesan en el orden de la tanda.
+        """
+        self.llegadas = sorted(self.procesos, key=lambda p: p.tiempo_arrivo)
+        self.indice_llegada = 0
+        # Mientras el tiempo actual sea menor, queda algun proceso por llegar
+        self.ultimo_arribo = self.llegadas[-1].tiempo_arrivo if self.llegadas else None
+
+    def proxima_llegada(self):
+        """
+        Retorna el tiempo de la proxima llegada a partir del tiempo actual, o
+        None si no quedan procesos por llegar. Los procesos con arribo anterior
+        al tiempo actual se descartan: su tick ya paso y nunca llegan.
+        """
+        while (self.indice_llegada < len(self.llegadas) and
+               self.llegadas[self.indice_llegada].tiempo_arrivo < self.tiempo_actual):
+            self.indice_llegada += 1
+
+        if self.indice_llegada < len(self.llegadas):
+            return self.llegadas[self.indice_llegada].tiempo_arrivo
+        return None
+
+    def procesar_llegadas(self):
+        """Pasa a listos los procesos cuyo tiempo de arribo es el tiempo actual."""
+        while self.proxima_llegada() == self.tiempo_actual:
+            proceso = self.llegadas[self.indice_llegada]
+            self.indice_llegada += 1
+
+            self.insertar_ordenado(proceso)
+            proceso.estado = "listo"
+
+            # Registrar primer arribo
+            if self.t_primer_arribo is None:
+                self.t_primer_arribo = self.tiempo_actual
+
+            # Registrar tiempo de arribo del proceso
+            self.t_arribo_por_proceso[proceso.pid] = self.tiempo_actual
+            self.cpu_proc_por_proceso[proceso.pid] = 0
+            self.t_listo_por_proceso[proceso.pid] = 0
+
+            # Registrar eventos
+            self.resultados.append({
+                'tiempo': self.tiempo_actual,
+                'proceso': proceso.nombre,
+                'evento': 'llegada',
+                'estado': 'arrivo'
+            })
+
+    def hay_procesos_pendientes(self):
+        """
+        Verifica si quedan trabajos por hacer:
+            - hay procesos en cola de listos
+            - hay procesos bloqueados
+            - hay procesos ejecutandose
+            - hay procesos que aun no llegaron
+            - hay procesos cumpliendo su TFP
+        """
+        return (len(self.cola_listos) > 0 or
+                len(self.procesos_bloqueados) > 0 or
+                self.proceso_actual is not None or
+                (self.ultimo_arribo is not None and self.ultimo_arribo > self.tiempo_actual) or
+                len(self.procesos_terminando) > 0)
+
+    def finalizar_proceso_completamente(self):
+        """Finaliza completamente un proceso despues del TFP."""
+        if not self.procesos_terminando:
+            return
+
+        # El primero en terminar es el que estaba cumpliendo el TFP
+        proceso = self.procesos_terminando.popleft()
+
+        # Registrar tiempo de finalizacion (con TFP)
+        self.t_fin_por_proceso[proceso.pid] = self.tiempo_actual
+        self.t_ultimo_tfp = self.tiempo_actual
+
+        proceso.calcular_tiempo_retorno(self.tiempo_actual)
+        proceso.estado = "terminado"
+
+        self.resultados.append({
+            'tiempo': self.tiempo_actual,
+            'proceso': proceso.nombre,
+            'evento': 'terminacion',
+            'estado': 'terminado'
+        })
+
+    def horizonte_alcanzado(self):
+        """Indica si se alcanzo el tiempo maximo o la cantidad maxima de eventos."""
+        if self.tiempo_maximo is not None and self.tiempo_actual >= self.tiempo_maximo:
+            return True
+        if self.max_eventos is not None and len(self.resultados) >= self.max_eventos:
+            return True
+        return False
+
+    def ticks_hasta_horizonte(self):
+        """Ticks que faltan para el tiempo maximo (infinito si no hay limite)."""
+        if self.tiempo_maximo is None:
+            return math.inf
+        return self.tiempo_maximo - self.tiempo_actual
+
+    def calcular_salto(self, limite):
+        """
+        Calcula cuantos ticks se pueden avanzar sin que ocurra ningun evento.
+
+        Args:
+            limite: Cantidad maxima de ticks a avanzar (puede ser math.inf)
+
+        Returns:
+            Cantidad de ticks sin eventos a partir del tiempo actual (0 si el
+            tick actual tiene que procesarse normalmente, math.inf si no hay
+            ningun evento futuro)
+        """
+        salto = limite
+
+        # Proxima llegada (la llegada se procesa en su propio tick)
+        llegada = self.proxima_llegada()
+        if llegada is not None:
+            salto = min(salto, llegada - self.tiempo_actual)
+
+        # Proximo fin de I/O (se procesa en su propio tick)
+        fin_io = self.procesos_bloqueados.proximo_fin()
+        if fin_io is not None:
+            salto = min(salto, fin_io - self.tiempo_actual)
+
+        if self.tiempo_restante_bloqueo > 0:
+            # Fin del TIP/TCP/TFP en curso
+            salto = min(salto, self.tiempo_restante_bloqueo - 1)
+        elif self.proceso_actual is not None:
+            # Fin de rafaga, quantum o preemption del proceso en ejecucion
+            salto = min(salto, self.limite_salto_ejecucion())
+        elif len(self.cola_listos) > 0:
+            # CPU libre con procesos listos: hay que seleccionar en este tick
+            return 0
+
+        return max(salto, 0)
+
+    def limite_salto_ejecucion(self):
+        """Ticks que puede ejecutar el proceso actual sin terminar su rafaga."""
+        return self.proceso_actual.duracion_rafagas_cpu - 1
+
+    def avanzar_salto(self, salto):
+        """
+        Aplica de una vez el efecto de `salto` ticks sin eventos.
+
+        Args:
+            salto: Cantidad de ticks a avanzar (calculada con calcular_salto)
+        """
+        # Los procesos bloqueados no se tocan: su fin de I/O es un tiempo absoluto
+        if self.tiempo_restante_bloqueo > 0:
+            # Labores del SO: no se acumula tiempo en listo mientras dura
+            self.tiempo_restante_bloqueo -= salto
+            self.cpu_so += salto
+        else:
+            self.cola_listos.acumular_espera(salto)
+
+            if self.proceso_actual is not None:
+                self.avanzar_ejecucion(salto)
+            else:
+                self.cpu_idle += salto
+
+        self.tiempo_actual += salto
+
+    def avanzar_ejecucion(self, salto):
+        """Ejecuta `salto` unidades de CPU del proceso actual sin terminar su rafaga."""
+        self.proceso_actual.duracion_rafagas_cpu -= salto
+        self.cpu_proc += salto
+        self.cpu_proc_por_proceso[self.proceso_actual.pid] += salto
@@ -0,0 +1,348 @@
+"""
+Destinos de los eventos de la simulación.
+
+Los algoritmos entregan cada evento a un destino a medida que ocurre. El destino
+por defecto (RegistroEventos) los guarda todos, pero se puede usar otro para no
+retenerlos: descartarlos, escribirlos a un archivo NDJSON o solo contarlos.
+"""
+
+import json
+import sys
+from array import array
+
+
+# Códigos precargados de los eventos y estados que registran los algoritmos.
+# Cualquier otro valor se agrega a la tabla la primera vez que aparece.
+EVENTOS = (
+    'llegada', 'inicio_tip', 'fin_tip', 'inicio_tcp', 'fin_tcp', 'inicio_tfp',
+    'fin_tfp', 'inicio ejecucion', 'fin_ejecucion', 'bloqueo', 'inicio_io',
+    'fin_io', 'preemption', 'preemption_quantum', 'cambio_proceso_spn',
+    'cambio_proceso_srtn', 'cambio_proceso_pe', 'terminacion',
+)
+
+ESTADOS = (
+    'arrivo', 'listo', 'ejecutando', 'bloqueado', 'bloqueado_sistema',
+    'sistema_libre', 'terminado',
+)
+
+
+class TablaCodigos:
+    """Asigna un código entero a cada valor distinto (internado de valores)."""
+
+    def __init__(self, valores=()):
+        self.valores = []
+        self.codigos = {}
+        for valor in valores:
+            self.codigo(valor)
+
+    def codigo(self, valor):
+        """Retorna el código del valor, agregándolo a la tabla si es nuevo."""
+        codigo = self.codigos.get(valor)
+        if codigo is None:
+            codigo = len(self.valores)
+            self.codigos[valor] = codigo
+            self.valores.append(valor)
+        return codigo
+
+
+class DestinoEventos:
+    """
+    Interfaz común de los destinos de eventos.
+
+    Los algoritmos llaman a `append()` con el diccionario de cada evento
+    ({'tiempo', 'proceso', 'evento', 'estado'}). `len()` es la cantidad de
+    eventos recibidos (se usa para el límite max_eventos) y recorrer el
+    destino devuelve los eventos que haya retenido (ninguno si no guarda).
+    """
+
+    def __init__(self):
+        self.cantidad = 0
+
+    def append(self, evento):
+        """Recibe un evento."""
+        self.cantidad += 1
+
+    def cerrar(self):
+        """Libera los recursos del destino (por ejemplo, un archivo abierto)."""
+
+    def instantanea(self):
+        """
+        Retorna el estado del destino para un snapshot del planificador. Los
+        destinos que no guardan los eventos solo conservan la cantidad: los
+        que ya entregaron (a una función o a un archivo) no se pueden deshacer.
+        """
+        return {'cantidad': self.cantidad}
+
+    def restaurar(self, estado):
+        """Vuelve al estado tomado con instantanea()."""
+        self.cantidad = estado['cantidad']
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, tipo, valor, traza):
+        self.cerrar()
+
+    def __len__(self):
+        return self.cantidad
+
+    def __iter__(self):
+        return iter(())
+
+
+class DescartarEventos(DestinoEventos):
+    """Descarta los eventos: solo cuenta cuántos hubo."""
+
+
+class FuncionEventos(DestinoEventos):
+    """Entrega cada evento a una función (por ejemplo, un callback del llamador)."""
+
+    def __init__(self, funcion):
+        super().__init__()
+        self.funcion = funcion
+
+    def append(self, evento):
+        self.cantidad += 1
+        self.funcion(evento)
+
+
+class EventosNDJSON(DestinoEventos):
+    """Escribe cada evento como una línea JSON (NDJSON) en un archivo."""
+
+    def __init__(self, archivo):
+        """
+        Args:
+            archivo: Ruta del archivo a crear, o un archivo de texto ya abierto
+                     (en ese caso no se cierra al cerrar el destino)
+        """
+        super().__init__()
+        if hasattr(archivo, 'write'):
+            self.archivo = archivo
+            self.cerrar_archivo = False
+        else:
+            self.archivo = open(archivo, 'w', encoding='utf-8')
+            self.cerrar_archivo = True
+
+    def append(self, evento):
+        self.cantidad += 1
+        self.archivo.write(json.dumps(evento, ensure_ascii=False))
+        self.archivo.write('\n')
+
+    def cerrar(self):
+        if self.cerrar_archivo:
+            self.archivo.close()
+        else:
+            self.archivo.flush()
+
+
+class ResumenEventos(DestinoEventos):
+    """
+    Solo acumula totales: cantidad de eventos por tipo y por proceso, y el
+    primer y último tiempo registrados. La memoria no crece con la duración
+    de la simulación.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.por_evento = {}
+        self.por_proceso = {}
+        self.tiempo_inicial = None
+        self.tiempo_final = None
+
+    def append(self, evento):
+        self.cantidad += 1
+        tipo = evento['evento']
+        self.por_evento[tipo] = self.por_evento.get(tipo, 0) + 1
+        proceso = evento['proceso']
+        self.por_proceso[proceso] = self.por_proceso.get(proceso, 0) + 1
+        if self.tiempo_inicial is None:
+            self.tiempo_inicial = evento['tiempo']
+        self.tiempo_final = evento['tiempo']
+
+    def instantanea(self):
+        estado = self.resumen()
+        estado['cantidad'] = estado.pop('cantidad_eventos')
+        return estado
+
+    def restaurar(self, estado):
+        self.cantidad = estado['cantidad']
+        self.por_evento = dict(estado.get('por_evento', {}))
+        self.por_proceso = dict(estado.get('por_proceso', {}))
+        self.tiempo_inicial = estado.get('tiempo_inicial')
+        self.tiempo_final = estado.get('tiempo_final')
+
+    def resumen(self):
+        """Retorna los totales acumulados como diccionario."""
+        return {
+            'cantidad_eventos': self.cantidad,
+            'por_evento': dict(self.por_evento),
+            'por_proceso': dict(self.por_proceso),
+            'tiempo_inicial': self.tiempo_inicial,
+            'tiempo_final': self.tiempo_final
+        }
+
+
+def crear_destino_eventos(destino=None):
+    """
+    Normaliza el destino de eventos recibido por un algoritmo.
+
+    Args:
+        destino: None para guardar todos los eventos (RegistroEventos), un
+                 DestinoEventos (o cualquier objeto con append) o una función
+                 que recibe cada evento
+
+    Returns:
+        El destino a usar
+    """
+    if destino is None:
+        return RegistroEventos()
+    if hasattr(destino, 'append'):
+        return destino
+    if callable(destino):
+        return FuncionEventos(destino)
+    raise TypeError("El destino de eventos debe ser un DestinoEventos o una función")
+
+
+class RegistroEventos(DestinoEventos):
+    """
+    Lista de eventos de la simulación guardada en arreglos paralelos tipados
+    (tiempo int32, proceso int32, evento uint8, estado uint8) en lugar de un
+    diccionario por evento. Los nombres de proceso, eventos y estados se
+    guardan una sola vez en tablas de códigos.
+
+    Se usa como la lista de diccionarios que reemplaza: `append()` recibe el
+    diccionario del evento, y al recorrerla o indexarla se arma un diccionario
+    {'tiempo', 'proceso', 'evento', 'estado'} por evento, recién en ese momento.
+    """
+
+    def __init__(self):
+        self.tiempos = array('i')
+        self.procesos = array('i')
+        self.eventos = array('B')
+        self.estados = array('B')
+
+        self.tabla_procesos = TablaCodigos()
+        self.tabla_eventos = TablaCodigos(EVENTOS)
+        self.tabla_estados = TablaCodigos(ESTADOS)
+
+    @property
+    def cantidad(self):
+        return len(self.tiempos)
+
+    def registrar(self, tiempo, proceso, evento, estado):
+        """
+        Agrega un evento al registro.
+
+        Args:
+            tiempo: Tiempo de simulación del evento
+            proceso: Nombre del proceso involucrado
+            evento: Tipo de evento (por ejemplo 'llegada' o 'fin_io')
+            estado: Estado asociado al evento
+        """
+        self.tiempos.append(tiempo)
+        self.procesos.append(self.tabla_procesos.codigo(proceso))
+        self.eventos.append(self.tabla_eventos.codigo(evento))
+        self.estados.append(self.tabla_estados.codigo(estado))
+
+    def append(self, evento):
+        """Agrega un evento dado como diccionario, igual que en una lista."""
+        self.registrar(evento['tiempo'], evento['proceso'], evento['evento'], evento['estado'])
+
+    def extend(self, eventos):
+        for evento in eventos:
+            self.append(evento)
+
+    def instantanea(self):
+        """Copia de las columnas y las tablas de códigos (la copia de un array es compacta)."""
+        return {
+            'cantidad': len(self),
+            'tiempos': array('i', self.tiempos),
+            'procesos': array('i', self.procesos),
+            'eventos': array('B', self.eventos),
+            'estados': array('B', self.estados),
+            'tabla_procesos': list(self.tabla_procesos.valores),
+            'tabla_eventos': list(self.tabla_eventos.valores),
+            'tabla_estados': list(self.tabla_estados.valores)
+        }
+
+    def restaurar(self, estado):
+        if 'tiempos' not in estado:
+            # Snapshot sin eventos: el registro ya tiene que tenerlos como prefijo
+            cantidad = estado['cantidad']
+            if cantidad > len(self):
+                raise ValueError("El snapshot no guarda los eventos y el registro no los tiene")
+            for columna in (self.tiempos, self.procesos, self.eventos, self.estados):
+                del columna[cantidad:]
+            return
+        self.tiempos = array('i', estado['tiempos'])
+        self.procesos = array('i', estado['procesos'])
+        self.eventos = array('B', estado['eventos'])
+        self.estados = array('B', estado['estados'])
+        self.tabla_procesos = TablaCodigos(estado['tabla_procesos'])
+        self.tabla_eventos = TablaCodigos(estado['tabla_eventos'])
+        self.tabla_estados = TablaCodigos(estado['tabla_estados'])
+
+    def copia(self, cantidad=None):
+        """
+        Retorna un registro nuevo con los primeros `cantidad` eventos (todos si
+        es None). Las tablas de códigos se copian enteras.
+        """
+        if cantidad is None:
+            cantidad = len(self)
+        copia = RegistroEventos()
+        copia.tiempos = self.tiempos[:cantidad]
+        copia.procesos = self.procesos[:cantidad]
+        copia.eventos = self.eventos[:cantidad]
+        copia.estados = self.estados[:cantidad]
+        copia.tabla_procesos = TablaCodigos(self.tabla_procesos.valores)
+        copia.tabla_eventos = TablaCodigos(self.tabla_eventos.valores)
+        copia.tabla_estados = TablaCodigos(self.tabla_estados.valores)
+        return copia
+
+    def memoria(self):
+        """Retorna los bytes que ocupan las columnas y las tablas de códigos."""
+        columnas = sum(columna.buffer_info()[1] * columna.itemsize
+                       for columna in (self.tiempos, self.procesos, self.eventos, self.estados))
+        tablas = sum(sys.getsizeof(valor) for valor in self.tabla_procesos.valores)
+        return columnas + tablas
+
+    def _evento(self, i):
+        return {
+            'tiempo': self.tiempos[i],
+            'proceso': self.tabla_procesos.valores[self.procesos[i]],
+            'evento': self.tabla_eventos.valores[self.eventos[i]],
+            'estado': self.tabla_estados.valores[self.estados[i]]
+        }
+
+    def __len__(self):
+        return len(self.tiempos)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self._evento(i) for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("índice de evento fuera de rango")
+        return self._evento(indice)
+
+    def __iter__(self):
+        procesos = self.tabla_procesos.valores
+        eventos = self.tabla_eventos.valores
+        estados = self.tabla_estados.valores
+        for tiempo, proceso, evento, estado in zip(self.tiempos, self.procesos,
+                                                   self.eventos, self.estados):
+            yield {
+                'tiempo': tiempo,
+                'proceso': procesos[proceso],
+                'evento': eventos[evento],
+                'estado': estados[estado]
+            }
+
+    def __eq__(self, otro):
+        if isinstance(otro, (RegistroEventos, list)):
+            return len(self) == len(otro) and all(a == b for a, b in zip(self, otro))
+        return NotImplemented
+
+    def __repr__(self):
+        return f"RegistroEventos({len(self)} eventos)"
@@ -0,0 +1,280 @@
+"""
+Almacén en disco de resultados de simulación.
+
+Guarda los resultados entre sesiones, direccionados por la misma clave que el
+cache en memoria (hash de la tanda, la política y los parámetros), para que
+un lote que se vuelve a ejecutar (o que se cortó a la mitad) saltee las
+configuraciones que ya se calcularon.
+
+Estructura del directorio:
+
+    indice.ndjson            Registro de operaciones (una línea JSON por
+                             operación: guardar, usar, borrar). Solo se
+                             agregan líneas, así que un corte a mitad de
+                             escritura pierde como mucho la última.
+    ab/abcdef....res.gz      Un archivo por resultado, comprimido con gzip:
+                             una línea JSON con los resultados (sin eventos)
+                             seguida de las columnas binarias del registro
+                             de eventos.
+"""
+
+import gzip
+import json
+import os
+import sys
+import time
+from array import array
+from collections import OrderedDict
+
+from .algoritmos.registro_eventos import RegistroEventos, TablaCodigos
+
+# Tipos de las columnas del registro de eventos, en el orden en que se escriben
+COLUMNAS_EVENTOS = (('tiempos', 'i'), ('procesos', 'i'), ('eventos', 'B'), ('estados', 'B'))
+
+
+class AlmacenResultados:
+    """
+    Resultados de simulación persistidos en un directorio, con un índice para
+    buscarlos sin abrir los archivos y un límite de tamaño total: al
+    superarlo se borran los resultados usados hace más tiempo.
+    """
+
+    def __init__(self, directorio, max_bytes=512 * 1024 * 1024):
+        """
+        Args:
+            directorio: Directorio del almacén (se crea si no existe)
+            max_bytes: Tamaño total máximo de los archivos de resultados
+        """
+        self.directorio = directorio
+        self.max_bytes = max_bytes
+        self.ruta_indice = os.path.join(directorio, 'indice.ndjson')
+
+        # clave -> datos del índice, de la usada hace más tiempo a la más reciente
+        self._entradas = OrderedDict()
+        self.bytes = 0
+
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+        os.makedirs(directorio, exist_ok=True)
+        self._cargar_indice()
+
+    def _cargar_indice(self):
+        """Reconstruye las entradas repitiendo las operaciones del índice."""
+        if not os.path.exists(self.ruta_indice):
+            return
+
+        lineas = 0
+        with open(self.ruta_indice, encoding='utf-8') as archivo:
+            for linea in archivo:
+                lineas += 1
+                try:
+                    operacion = json.loads(linea)
+                except ValueError:
+                    # Línea cortada por una interrupción: se ignora
+                    continue
+                clave = operacion.get('clave')
+                if operacion.get('op') == 'guardar':
+                    self._quitar_entrada(clave)
+                    self._entradas[clave] = operacion
+                    self.bytes += operacion['bytes']
+                elif operacion.get('op') == 'usar' and clave in self._entradas:
+                    self._entradas.move_to_end(clave)
+                elif operacion.get('op') == 'borrar':
+                    self._quitar_entrada(clave)
+
+        # Respetar el tamaño máximo aunque haya cambiado desde la última sesión
+        self._desalojar()
+
+        # Compactar el índice si acumula muchas operaciones viejas
+        if lineas > 2 * len(self._entradas) + 100:
+            self.compactar_indice()
+
+    def _quitar_entrada(self, clave):
+        entrada = self._entradas.pop(clave, None)
+        if entrada is not None:
+            self.bytes -= entrada['bytes']
+
+    def _registrar(self, operacion):
+        """Agrega una operación al índice."""
+        with open(self.ruta_indice, 'a', encoding='utf-8') as archivo:
+            archivo.write(json.dumps(operacion, ensure_ascii=False) + '\n')
+
+    def compactar_indice(self):
+        """Reescribe el índice con una sola línea por resultado guardado."""
+        temporal = self.ruta_indice + '.tmp'
+        with open(temporal, 'w', encoding='utf-8') as archivo:
+            for entrada in self._entradas.values():
+                archivo.write(json.dumps(entrada, ensure_ascii=False) + '\n')
+        os.replace(temporal, self.ruta_indice)
+
+    def _ruta(self, clave):
+        return os.path.join(self.directorio, clave[:2], f"{clave}.res.gz")
+
+    def obtener(self, clave):
+        """
+        Lee el resultado guardado para la clave.
+
+        Returns:
+            Diccionario de resultados (los eventos como RegistroEventos, o una
+            lista vacía si se guardó sin eventos), o None si no está
+        """
+        if clave not in self._entradas:
+            self.fallos += 1
+            return None
+
+        try:
+            resultados = _leer_resultados(self._ruta(clave))
+        except (OSError, ValueError, EOFError):
+            # Archivo borrado a mano o dañado: se olvida la entrada
+            self.descartar(clave)
+            self.fallos += 1
+            return None
+
+        self._entradas.move_to_end(clave)
+        self._registrar({'op': 'usar', 'clave': clave})
+        self.aciertos += 1
+        return resultados
+
+    def guardar(self, clave, resultados, descripcion=None):
+        """
+        Guarda un resultado y borra los usados hace más tiempo si se supera
+        el tamaño máximo.
+
+        Args:
+            clave: Clave de la simulación (ver cache_resultados.clave_simulacion)
+            resultados: Diccionario de resultados de la simulación
+            descripcion: Datos para identificar la entrada en el índice (por
+                         ejemplo la política y los parámetros)
+
+        Returns:
+            True si se guardó
+        """
+        ruta = self._ruta(clave)
+        os.makedirs(os.path.dirname(ruta), exist_ok=True)
+
+        # Escribir en un temporal y reemplazar: nunca queda un archivo a medias
+        temporal = ruta + '.tmp'
+        _escribir_resultados(temporal, resultados)
+        tamano = os.path.getsize(temporal)
+        if tamano > self.max_bytes:
+            os.remove(temporal)
+            return False
+        os.replace(temporal, ruta)
+
+        self._quitar_entrada(clave)
+        entrada = {
+            'op': 'guardar',
+            'clave': clave,
+            'bytes': tamano,
+            'creado': time.time(),
+            'descripcion': descripcion or {}
+        }
+        self._entradas[clave] = entrada
+        self.bytes += tamano
+        self._registrar(entrada)
+        self._desalojar()
+        return True
+
+    def _desalojar(self):
+        """Borra los resultados usados hace más tiempo hasta respetar max_bytes."""
+        while self.bytes > self.max_bytes:
+            self.descartar(next(iter(self._entradas)))
+            self.desalojos += 1
+
+    def descartar(self, clave):
+        """Borra el resultado de la clave, si está."""
+        if clave not in self._entradas:
+            return
+        self._quitar_entrada(clave)
+        try:
+            os.remove(self._ruta(clave))
+        except OSError:
+            pass
+        self._registrar({'op': 'borrar', 'clave': clave})
+
+    def limpiar(self):
+        """Borra todos los resultados guardados."""
+        for clave in list(self._entradas):
+            try:
+                os.remove(self._ruta(clave))
+            except OSError:
+                pass
+        self._entradas.clear()
+        self.bytes = 0
+        self.compactar_indice()
+
+    def estadisticas(self):
+        """Retorna los contadores del almacén como diccionario."""
+        consultas = self.aciertos + self.fallos
+        return {
+            'entradas': len(self._entradas),
+            'bytes': self.bytes,
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'desalojos': self.desalojos,
+            'tasa_aciertos': self.aciertos / consultas if consultas else 0
+        }
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def __contains__(self, clave):
+        return clave in self._entradas
+
+
+def _escribir_resultados(ruta, resultados):
+    """
+    Escribe los resultados en un archivo gzip: una línea JSON con todo menos
+    los eventos y, si hay un RegistroEventos, sus columnas en binario.
+    """
+    datos = dict(resultados)
+    eventos = datos.pop('eventos', None)
+    # La ruta del PDF es de la sesión en que se generó
+    datos['ruta_pdf'] = None
+
+    if isinstance(eventos, RegistroEventos):
+        datos['_eventos'] = {
+            'cantidad': len(eventos),
+            'orden_bytes': sys.byteorder,
+            'procesos': eventos.tabla_procesos.valores,
+            'eventos': eventos.tabla_eventos.valores,
+            'estados': eventos.tabla_estados.valores
+        }
+    else:
+        datos['_eventos'] = None
+
+    with gzip.open(ruta, 'wb') as archivo:
+        archivo.write(json.dumps(datos, ensure_ascii=False).encode('utf-8'))
+        archivo.write(b'\n')
+        if datos['_eventos'] is not None:
+            for nombre, _ in COLUMNAS_EVENTOS:
+                archivo.write(getattr(eventos, nombre).tobytes())
+
+
+def _leer_resultados(ruta):
+    """Lee un archivo escrito por _escribir_resultados."""
+    with gzip.open(ruta, 'rb') as archivo:
+        datos = json.loads(archivo.readline())
+        encabezado = datos.pop('_eventos')
+        if encabezado is None:
+            datos['eventos'] = []
+            return datos
+
+        registro = RegistroEventos()
+        cantidad = encabezado['cantidad']
+        for nombre, tipo in COLUMNAS_EVENTOS:
+            columna = array(tipo)
+            columna.frombytes(archivo.read(cantidad * columna.itemsize))
+            if len(columna) != cantidad:
+                raise EOFError("registro de eventos incompleto")
+            if encabezado['orden_bytes'] != sys.byteorder:
+                columna.byteswap()
+            setattr(registro, nombre, columna)
+
+    registro.tabla_procesos = TablaCodigos(encabezado['procesos'])
+    registro.tabla_eventos = TablaCodigos(encabezado['eventos'])
+    registro.tabla_estados = TablaCodigos(encabezado['estados'])
+    datos['eventos'] = registro
+    return datos
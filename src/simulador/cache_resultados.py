@@ -0,0 +1,204 @@
+"""
+Cache en memoria de resultados de simulación.
+
+Una simulación queda determinada por la tanda de procesos, la política y sus
+parámetros, así que repetir la misma combinación (volver a presionar
+"Ejecutar Simulación" sin cambiar nada, o configuraciones repetidas en un
+lote) puede devolver el resultado ya calculado.
+"""
+
+import hashlib
+import json
+import sys
+from collections import OrderedDict
+from operator import itemgetter
+
+from .algoritmos.registro_eventos import RegistroEventos
+from .proceso import normalizar_datos_proceso
+
+# Campos de cada proceso que determinan el resultado de la simulación
+CAMPOS_PROCESO = ('nombre', 'tiempo_arribo', 'cantidad_rafagas_cpu', 'duracion_rafaga_cpu',
+                  'duracion_rafaga_es', 'prioridad_externa')
+
+# Parámetros de ejecutar_politica que determinan el resultado
+PARAMETROS_CLAVE = ('tiempo_tip', 'tiempo_tcp', 'tiempo_tfp', 'quantum', 'tiempo_maximo', 'max_eventos')
+
+
+def huella_tanda(procesos_datos):
+    """
+    Calcula un hash canónico de una tanda de procesos.
+
+    Se usan los datos normalizados (ver proceso.normalizar_datos_proceso):
+    solo los campos que usa la simulación, con sus tipos, así que el orden de
+    las claves de cada diccionario y escribir "5" o 5 no importan. Los
+    procesos se ordenan por tiempo de arribo: el orden de la tanda solo
+    cambia el resultado entre procesos que llegan al mismo tiempo (decide los
+    desempates), y entre ellos se mantiene.
+
+    Args:
+        procesos_datos: Lista de diccionarios con datos de procesos
+
+    Returns:
+        Hash hexadecimal (sha256) de la tanda
+
+    Raises:
+        KeyError, ValueError: Si un proceso no tiene los campos o tipos esperados
+    """
+    filas = [tuple(normalizar_datos_proceso(proceso)[campo] for campo in CAMPOS_PROCESO)
+             for proceso in procesos_datos]
+    # sorted es estable: los que llegan al mismo tiempo quedan en su orden
+    filas.sort(key=itemgetter(CAMPOS_PROCESO.index('tiempo_arribo')))
+
+    huella = hashlib.sha256()
+    for fila in filas:
+        huella.update(json.dumps(fila, separators=(',', ':')).encode('utf-8'))
+        huella.update(b'\n')
+    return huella.hexdigest()
+
+
+def clave_simulacion(procesos_datos, politica, parametros, eventos=True):
+    """
+    Arma la clave de una simulación: tanda, política y parámetros.
+
+    Args:
+        procesos_datos: Lista de diccionarios con datos de procesos
+        politica: Nombre canónico de la política ('FCFS', 'SPN', 'SRTN', 'RR', 'PE')
+        parametros: Diccionario con los parámetros de ejecutar_politica. El
+                    quantum solo cuenta para Round Robin
+        eventos: Si el resultado guarda la lista de eventos
+
+    Returns:
+        Hash hexadecimal (sha256) de la simulación
+    """
+    valores = {parametro: parametros.get(parametro) for parametro in PARAMETROS_CLAVE}
+    if politica != 'RR':
+        valores['quantum'] = None
+
+    clave = {
+        'tanda': huella_tanda(procesos_datos),
+        'politica': politica,
+        'parametros': valores,
+        'eventos': bool(eventos)
+    }
+    return hashlib.sha256(json.dumps(clave, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def estimar_tamano(objeto):
+    """
+    Estima cuántos bytes ocupa un resultado de simulación (diccionarios,
+    listas, registros de eventos y procesos). Es una aproximación, alcanza
+    para acotar la memoria del cache.
+    """
+    if isinstance(objeto, RegistroEventos):
+        return objeto.memoria()
+    if isinstance(objeto, dict):
+        return sys.getsizeof(objeto) + sum(estimar_tamano(clave) + estimar_tamano(valor)
+                                           for clave, valor in objeto.items())
+    if isinstance(objeto, (list, tuple)):
+        return sys.getsizeof(objeto) + sum(estimar_tamano(valor) for valor in objeto)
+    if hasattr(objeto, '__slots__'):
+        return sys.getsizeof(objeto) + sum(sys.getsizeof(getattr(objeto, atributo, None))
+                                           for atributo in objeto.__slots__)
+    return sys.getsizeof(objeto)
+
+
+class CacheResultados:
+    """
+    Cache LRU de resultados de simulación, acotado por cantidad de entradas
+    y por bytes estimados. Cuando se supera alguno de los límites se
+    descartan las entradas usadas hace más tiempo.
+    """
+
+    def __init__(self, max_entradas=32, max_bytes=64 * 1024 * 1024):
+        """
+        Args:
+            max_entradas: Cantidad máxima de resultados guardados
+            max_bytes: Tamaño total máximo estimado de los resultados guardados
+        """
+        self.max_entradas = max_entradas
+        self.max_bytes = max_bytes
+        # clave -> (valor, tamaño estimado), de la usada hace más tiempo a la más reciente
+        self._entradas = OrderedDict()
+        self.bytes = 0
+
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+
+    def obtener(self, clave):
+        """
+        Retorna el valor guardado para la clave (y lo marca como el más
+        reciente), o None si no está.
+        """
+        entrada = self._entradas.get(clave)
+        if entrada is None:
+            self.fallos += 1
+            return None
+        self._entradas.move_to_end(clave)
+        self.aciertos += 1
+        return entrada[0]
+
+    def consultar(self, clave):
+        """
+        Retorna el valor guardado para la clave, o None si no está, sin
+        contarlo como acierto ni marcarlo como el más reciente.
+        """
+        entrada = self._entradas.get(clave)
+        return entrada[0] if entrada is not None else None
+
+    def guardar(self, clave, valor, tamano=None):
+        """
+        Guarda un valor. Si por sí solo supera max_bytes no se guarda.
+
+        Args:
+            clave: Clave de la simulación (ver clave_simulacion)
+            valor: Valor a guardar
+            tamano: Bytes que ocupa el valor (None = estimarlo)
+
+        Returns:
+            True si se guardó
+        """
+        if tamano is None:
+            tamano = estimar_tamano(valor)
+
+        self.descartar(clave)
+        if tamano > self.max_bytes or self.max_entradas <= 0:
+            return False
+
+        self._entradas[clave] = (valor, tamano)
+        self.bytes += tamano
+
+        while len(self._entradas) > self.max_entradas or self.bytes > self.max_bytes:
+            _, (_, tamano_desalojado) = self._entradas.popitem(last=False)
+            self.bytes -= tamano_desalojado
+            self.desalojos += 1
+        return True
+
+    def descartar(self, clave):
+        """Saca la entrada de la clave, si está."""
+        entrada = self._entradas.pop(clave, None)
+        if entrada is not None:
+            self.bytes -= entrada[1]
+
+    def limpiar(self):
+        """Vacía el cache (los contadores se mantienen)."""
+        self._entradas.clear()
+        self.bytes = 0
+
+    def estadisticas(self):
+        """Retorna los contadores del cache como diccionario."""
+        consultas = self.aciertos + self.fallos
+        return {
+            'entradas': len(self._entradas),
+            'bytes': self.bytes,
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'desalojos': self.desalojos,
+            'tasa_aciertos': self.aciertos / consultas if consultas else 0
+        }
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def __contains__(self, clave):
+        return clave in self._entradas
@@ -0,0 +1,222 @@
+"""
+Interfaz de línea de comandos del simulador.
+
+Ejecuta una o varias políticas sobre una tanda de procesos y escribe las
+métricas como JSON o CSV, sin la interfaz gráfica: solo importa
+src.simulador, así que funciona en un servidor sin pantalla.
+
+Uso (desde la raíz del proyecto):
+    python -m src.simulador data/input/procesos_tanda_5p.json --politicas FCFS RR --quantum 3
+    python -m src.simulador tanda.ndjson --tip 1 --tcp 1 --tfp 1 --quantum 4 --formato csv --salida metricas.csv
+"""
+
+import argparse
+import contextlib
+import csv
+import json
+import sys
+import time
+
+from .algoritmos.instrumentacion import formatear_instrumentacion
+from .algoritmos.registro_eventos import DescartarEventos
+from .cache_resultados import CAMPOS_PROCESO
+from .generador_tandas import leer_tanda
+from .proceso import normalizar_datos_proceso, validar_datos_proceso
+from .simulador import Simulador
+
+POLITICAS = ('FCFS', 'SPN', 'SRTN', 'RR', 'PE')
+
+# Columnas de la salida CSV (una fila por política)
+COLUMNAS_METRICAS = ('tiempo_total', 'tiempo_medio_retorno', 'tiempo_medio_retorno_normalizado',
+                     'cpu_desocupada', 'cpu_so', 'cpu_procesos', 'porcentaje_cpu_so',
+                     'cambios_contexto', 'procesos_terminados')
+
+
+def cargar_tanda(ruta):
+    """
+    Lee una tanda de procesos (lista JSON, o un proceso por línea si la ruta
+    termina en .ndjson) y la valida como el cargador de archivos de la
+    interfaz.
+
+    Args:
+        ruta: Ruta del archivo
+
+    Returns:
+        Lista de diccionarios con datos de procesos
+
+    Raises:
+        ValueError: Si el archivo no tiene el formato esperado
+    """
+    try:
+        procesos_datos = []
+        for i, proceso_data in enumerate(leer_tanda(ruta)):
+            if not isinstance(proceso_data, dict):
+                raise ValueError(f"El proceso {i + 1} no es un objeto JSON")
+            for campo in CAMPOS_PROCESO:
+                if campo not in proceso_data:
+                    raise ValueError(f"Falta el campo '{campo}' en el proceso {i + 1}")
+            try:
+                proceso = normalizar_datos_proceso(proceso_data)
+            except (TypeError, ValueError):
+                raise ValueError(f"El proceso {i + 1} tiene tiempos o prioridad que no son números enteros")
+            validar_datos_proceso(proceso, i + 1)
+            procesos_datos.append(proceso)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Error al parsear JSON: {e}")
+
+    if not procesos_datos:
+        raise ValueError("No se encontraron procesos en el archivo")
+    return procesos_datos
+
+
+def ejecutar_politicas(procesos_datos, politicas, tiempo_tip, tiempo_tcp, tiempo_tfp, quantum=None,
+                       tiempo_maximo=None, max_eventos=None, generar_pdf=False, incluir_procesos=False,
+                       instrumentar=False):
+    """
+    Ejecuta cada política sobre la tanda.
+
+    Args:
+        procesos_datos: Lista de diccionarios con datos de procesos
+        politicas: Nombres de las políticas a ejecutar
+        tiempo_tip: Tiempo de ingreso de proceso
+        tiempo_tcp: Tiempo de conmutación de proceso
+        tiempo_tfp: Tiempo de finalización de proceso
+        quantum: Tiempo de quantum (solo para Round Robin)
+        tiempo_maximo: Tiempo máximo de simulación (None = sin límite)
+        max_eventos: Cantidad máxima de eventos a registrar (None = sin límite)
+        generar_pdf: Si es True, exporta el reporte PDF de cada política
+        incluir_procesos: Si es True, incluye los tiempos de cada proceso
+        instrumentar: Si es True, incluye el tiempo por fase del bucle
+
+    Returns:
+        Lista con un diccionario por política: politica, metricas, truncado,
+        tiempo_ejecucion, ruta_pdf y, si se pidieron, procesos e
+        instrumentacion
+    """
+    simulador = Simulador(generar_pdf=generar_pdf, cache=False, instrumentar=instrumentar)
+    corridas = []
+    for politica in politicas:
+        # Sin PDF los eventos no se usan: se cuentan sin guardarlos
+        destino_eventos = None if generar_pdf else DescartarEventos()
+
+        inicio = time.perf_counter()
+        resultados = simulador.ejecutar_politica(politica, procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp,
+                                                 quantum=quantum, tiempo_maximo=tiempo_maximo,
+                                                 max_eventos=max_eventos, destino_eventos=destino_eventos)
+        corrida = {
+            'politica': politica,
+            'metricas': resultados['metricas'],
+            'truncado': resultados['truncado'],
+            'tiempo_ejecucion': time.perf_counter() - inicio,
+            'ruta_pdf': resultados['ruta_pdf']
+        }
+        if incluir_procesos:
+            corrida['procesos'] = resultados['procesos']
+        if instrumentar:
+            corrida['instrumentacion'] = resultados['instrumentacion']
+        corridas.append(corrida)
+    return corridas
+
+
+def escribir_json(corridas, parametros, archivo):
+    json.dump({'parametros': parametros, 'resultados': corridas}, archivo, ensure_ascii=False, indent=2)
+    archivo.write('\n')
+
+
+def escribir_csv(corridas, archivo):
+    escritor = csv.writer(archivo)
+    escritor.writerow(('politica',) + COLUMNAS_METRICAS + ('truncado', 'tiempo_ejecucion', 'ruta_pdf'))
+    for corrida in corridas:
+        escritor.writerow([corrida['politica']] +
+                          [corrida['metricas'][columna] for columna in COLUMNAS_METRICAS] +
+                          [corrida['truncado'], round(corrida['tiempo_ejecucion'], 6), corrida['ruta_pdf'] or ''])
+
+
+def entero_positivo(texto):
+    """Tipo de argparse para un entero mayor que 0."""
+    try:
+        valor = int(texto)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{texto}' no es un número entero")
+    if valor <= 0:
+        raise argparse.ArgumentTypeError(f"debe ser mayor que 0 (se recibió {valor})")
+    return valor
+
+
+def crear_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m src.simulador',
+        description="Simula políticas de planificación sobre una tanda de procesos, sin interfaz gráfica")
+    parser.add_argument('tanda', help="Archivo de procesos (lista JSON o .ndjson)")
+    parser.add_argument('--politicas', nargs='+', choices=POLITICAS,
+                        help="Políticas a ejecutar (por defecto: todas, RR solo si se da --quantum)")
+    parser.add_argument('--tip', type=int, default=0, help="Tiempo de ingreso de proceso")
+    parser.add_argument('--tcp', type=int, default=0, help="Tiempo de conmutación de proceso")
+    parser.add_argument('--tfp', type=int, default=0, help="Tiempo de finalización de proceso")
+    parser.add_argument('--quantum', type=int, help="Quantum de Round Robin (obligatorio con RR)")
+    parser.add_argument('--tiempo-maximo', type=entero_positivo, help="Cortar la simulación en este tiempo")
+    parser.add_argument('--max-eventos', type=entero_positivo, help="Cortar la simulación al registrar N eventos")
+    parser.add_argument('--formato', choices=('json', 'csv'), default='json')
+    parser.add_argument('--salida', help="Archivo de salida (por defecto, la salida estándar)")
+    parser.add_argument('--pdf', action='store_true', help="Exportar también el reporte PDF de cada política")
+    parser.add_argument('--procesos', action='store_true',
+                        help="Incluir los tiempos de cada proceso (solo JSON)")
+    parser.add_argument('--instrumentar', action='store_true',
+                        help="Medir el tiempo por fase del bucle y los eventos por tipo")
+    return parser
+
+
+def main(argumentos=None):
+    parser = crear_parser()
+    args = parser.parse_args(argumentos)
+
+    if args.politicas is None:
+        args.politicas = [politica for politica in POLITICAS if politica != 'RR' or args.quantum is not None]
+    if 'RR' in args.politicas and args.quantum is None:
+        parser.error("Round Robin requiere --quantum")
+    for nombre in ('tip', 'tcp', 'tfp', 'quantum'):
+        valor = getattr(args, nombre)
+        if valor is not None and valor < 0:
+            parser.error(f"--{nombre} no puede ser negativo")
+    if args.quantum is not None and args.quantum <= 0:
+        parser.error("--quantum debe ser mayor que 0")
+
+    try:
+        procesos_datos = cargar_tanda(args.tanda)
+    except (OSError, ValueError) as e:
+        print(f"Error al leer la tanda: {e}", file=sys.stderr)
+        return 1
+
+    # Los mensajes del simulador (por ejemplo, la ruta del PDF) van a stderr
+    # para no mezclarse con los resultados
+    with contextlib.redirect_stdout(sys.stderr):
+        corridas = ejecutar_politicas(procesos_datos, args.politicas, args.tip, args.tcp, args.tfp,
+                                      quantum=args.quantum, tiempo_maximo=args.tiempo_maximo,
+                                      max_eventos=args.max_eventos, generar_pdf=args.pdf,
+                                      incluir_procesos=args.procesos, instrumentar=args.instrumentar)
+
+    parametros = {
+        'tanda': args.tanda,
+        'procesos': len(procesos_datos),
+        'tiempo_tip': args.tip,
+        'tiempo_tcp': args.tcp,
+        'tiempo_tfp': args.tfp,
+        'quantum': args.quantum,
+        'tiempo_maximo': args.tiempo_maximo,
+        'max_eventos': args.max_eventos
+    }
+
+    archivo = open(args.salida, 'w', newline='', encoding='utf-8') if args.salida else sys.stdout
+    try:
+        if args.formato == 'json':
+            escribir_json(corridas, parametros, archivo)
+        else:
+            escribir_csv(corridas, archivo)
+            if args.instrumentar:
+                for corrida in corridas:
+                    print(f"\n{corrida['politica']}", file=sys.stderr)
+                    print(formatear_instrumentacion(corrida['instrumentacion']), file=sys.stderr)
+    finally:
+        if args.salida:
+            archivo.close()
+    return 0
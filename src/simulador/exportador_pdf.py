@@ -17,6 +17,15 @@ from reportlab.graphics.charts.piecharts import Pie
 from reportlab.graphics import renderPDF
 
 
+# Parte del progreso que corresponde a construir el contenido; el resto es
+# el armado de las páginas
+FRACCION_CONTENIDO = 0.2
+
+
+class ExportacionCancelada(Exception):
+    """Se lanza cuando se cancela una exportación en curso."""
+
+
 class ExportadorPDF:
     """Clase para exportar resultados de simulación a PDF."""
     
@@ -65,16 +74,24 @@ class ExportadorPDF:
             textColor=colors.HexColor('#333333')
         ))
     
-    def exportar_simulacion(self, datos_simulacion, ruta_archivo=None):
+    def exportar_simulacion(self, datos_simulacion, ruta_archivo=None, progreso=None, cancelado=None):
         """
         Exporta los resultados de la simulación a un archivo PDF.
         
         Args:
             datos_simulacion: Diccionario con los datos de la simulación
             ruta_archivo: Ruta donde guardar el PDF (opcional)
+            progreso: Función que recibe la fracción completada, de 0 a 1
+                      (opcional)
+            cancelado: Función sin argumentos que retorna True para cancelar
+                       la exportación, por ejemplo threading.Event().is_set
+                       (opcional)
             
         Returns:
             str: Ruta del archivo generado
+            
+        Raises:
+            ExportacionCancelada: Si cancelado() retornó True antes de terminar
         """
         if ruta_archivo is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -95,11 +112,19 @@ class ExportadorPDF:
             bottomMargin=18
         )
         
+        def avanzar(fraccion):
+            if cancelado is not None and cancelado():
+                raise ExportacionCancelada()
+            if progreso is not None:
+                progreso(fraccion)
+        
         # Construir contenido
         contenido = []
+        avanzar(0.0)
         contenido.extend(self._crear_portada(datos_simulacion))
         contenido.append(PageBreak())
         contenido.extend(self._crear_tabla_eventos(datos_simulacion))
+        avanzar(FRACCION_CONTENIDO / 2)
         contenido.append(PageBreak())
         contenido.extend(self._crear_estadisticas_procesos(datos_simulacion))
         
@@ -108,9 +133,26 @@ class ExportadorPDF:
         if algoritmo not in ['SRTN', 'PE']:
             contenido.append(PageBreak())
             contenido.extend(self._crear_diagrama_gantt(datos_simulacion))
+        avanzar(FRACCION_CONTENIDO)
+        
+        # ReportLab informa cuántos elementos va a ubicar ('SIZE_EST') y
+        # cuántos lleva ubicados ('PROGRESS')
+        total = [len(contenido)]
+        
+        def progreso_armado(tipo, valor):
+            if tipo == 'SIZE_EST':
+                total[0] = max(1, valor)
+            elif tipo == 'PROGRESS':
+                avanzar(FRACCION_CONTENIDO + (1 - FRACCION_CONTENIDO) * min(1.0, valor / total[0]))
+        
+        if progreso is not None or cancelado is not None:
+            doc.setProgressCallBack(progreso_armado)
         
-        # Generar PDF
+        # Generar PDF (el archivo se escribe recién al final, así que una
+        # exportación cancelada no deja un PDF a medias)
         doc.build(contenido)
+        if progreso is not None:
+            progreso(1.0)
         
         return ruta_archivo
     
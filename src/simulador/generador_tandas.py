@@ -0,0 +1,197 @@
+"""
+Generador de tandas de procesos sintéticas.
+
+Produce tandas con el mismo formato que los archivos de entrada, a partir de
+distribuciones configurables y una semilla (la misma semilla y configuración
+generan siempre la misma tanda). Los procesos se generan de a uno, así que se
+pueden escribir a un archivo o cargar como instancias de Proceso sin armar
+listas intermedias, aun para millones de procesos.
+"""
+
+import json
+import math
+import random
+from bisect import bisect
+from itertools import accumulate
+
+from .proceso import Proceso
+
+LLEGADAS = ('poisson', 'rafagas', 'uniforme')
+DURACIONES = ('exponencial', 'lognormal', 'uniforme')
+
+
+def _filas(cantidad, semilla=None, llegadas='poisson', tasa_llegada=0.2, tamano_rafaga_llegadas=10,
+           duracion_cpu='exponencial', media_cpu=5, sigma_cpu=0.75, rafagas_cpu=(1, 5),
+           proporcion_io=1.0, prioridades=None, prefijo='P'):
+    """
+    Genera los procesos como tuplas (nombre, arribo, cantidad de ráfagas,
+    duración de ráfaga de CPU, duración de ráfaga de E/S, prioridad). Los
+    argumentos se describen en generar_tanda.
+    """
+    if llegadas not in LLEGADAS:
+        raise ValueError(f"Distribución de llegadas desconocida: {llegadas}")
+    if duracion_cpu not in DURACIONES:
+        raise ValueError(f"Distribución de duración de CPU desconocida: {duracion_cpu}")
+    if tasa_llegada <= 0 or media_cpu <= 0:
+        raise ValueError("La tasa de llegada y la duración media de CPU deben ser positivas")
+    minimo_rafagas, maximo_rafagas = rafagas_cpu
+    if minimo_rafagas < 1 or maximo_rafagas < minimo_rafagas:
+        raise ValueError(f"Rango de ráfagas de CPU inválido: {rafagas_cpu} (mínimo 1, máximo >= mínimo)")
+
+    if prioridades is None:
+        prioridades = {prioridad: 1 for prioridad in range(1, 6)}
+
+    rng = random.Random(semilla)
+    expovariate = rng.expovariate
+    lognormvariate = rng.lognormvariate
+    randint = rng.randint
+    uniform = rng.uniform
+    aleatorio = rng.random
+
+    # Prioridades por peso: búsqueda binaria sobre los pesos acumulados
+    valores_prioridad = list(prioridades)
+    acumulados = list(accumulate(prioridades[valor] for valor in valores_prioridad))
+    total_pesos = acumulados[-1]
+
+    # Log-normal con la media pedida: media = exp(mu + sigma^2 / 2)
+    mu_cpu = math.log(media_cpu) - sigma_cpu ** 2 / 2
+
+    # Llegadas en ráfagas: grupos de tamaño medio m que llegan m veces más
+    # rápido, separados por pausas que mantienen la tasa media
+    tasa_en_rafaga = tasa_llegada * tamano_rafaga_llegadas
+    pausa_media = (tamano_rafaga_llegadas - 1) / tasa_llegada
+    fin_rafaga = 1 / tamano_rafaga_llegadas
+
+    tiempo = 0.0
+    for i in range(cantidad):
+        if i > 0:
+            if llegadas == 'poisson':
+                tiempo += expovariate(tasa_llegada)
+            elif llegadas == 'uniforme':
+                tiempo += 1 / tasa_llegada
+            else:
+                tiempo += expovariate(tasa_en_rafaga)
+                if aleatorio() < fin_rafaga and pausa_media > 0:
+                    tiempo += expovariate(1 / pausa_media)
+
+        if duracion_cpu == 'exponencial':
+            cpu = expovariate(1 / media_cpu)
+        elif duracion_cpu == 'lognormal':
+            cpu = lognormvariate(mu_cpu, sigma_cpu)
+        else:
+            cpu = uniform(1, 2 * media_cpu - 1) if media_cpu > 1 else 1
+        cpu = max(1, round(cpu))
+
+        # La E/S nunca es 0: un proceso bloqueado con E/S 0 no se desbloquea
+        io = max(1, round(expovariate(1 / (cpu * proporcion_io)))) if proporcion_io > 0 else 1
+
+        prioridad = valores_prioridad[bisect(acumulados, aleatorio() * total_pesos)]
+
+        yield (f"{prefijo}{i + 1}", int(tiempo), randint(minimo_rafagas, maximo_rafagas), cpu, io, prioridad)
+
+
+def generar_tanda(cantidad, semilla=None, **distribuciones):
+    """
+    Genera una tanda de procesos, de a uno, en el formato de los archivos de
+    entrada (los diccionarios que reciben los métodos de Simulador).
+
+    Args:
+        cantidad: Cantidad de procesos
+        semilla: Semilla del generador (None = aleatoria)
+        **distribuciones: Opcionales:
+            llegadas: 'poisson' (tiempos entre llegadas exponenciales, por
+                      defecto), 'rafagas' (grupos de procesos que llegan casi
+                      juntos) o 'uniforme' (a intervalos fijos)
+            tasa_llegada: Procesos que llegan por unidad de tiempo, en
+                          promedio (0.2)
+            tamano_rafaga_llegadas: Procesos por grupo, en promedio (10; solo
+                                    'rafagas')
+            duracion_cpu: Distribución de la duración de ráfaga de CPU:
+                          'exponencial' (por defecto), 'lognormal' o 'uniforme'
+            media_cpu: Duración media de ráfaga de CPU (5)
+            sigma_cpu: Dispersión de la log-normal, desvío de su logaritmo (0.75)
+            rafagas_cpu: Rango (mínimo, máximo) de la cantidad de ráfagas de
+                         CPU ((1, 5); el mínimo tiene que ser al menos 1)
+            proporcion_io: Duración media de la ráfaga de E/S relativa a la de
+                           CPU (1.0; exponencial, mínimo 1)
+            prioridades: Diccionario {prioridad: peso} (None = 1 a 5 con igual peso)
+            prefijo: Prefijo de los nombres de proceso ('P')
+
+    Returns:
+        Iterador de diccionarios con datos de procesos
+    """
+    for nombre, arribo, rafagas, cpu, io, prioridad in _filas(cantidad, semilla, **distribuciones):
+        yield {
+            'nombre': nombre,
+            'tiempo_arribo': arribo,
+            'cantidad_rafagas_cpu': rafagas,
+            'duracion_rafaga_cpu': cpu,
+            'duracion_rafaga_es': io,
+            'prioridad_externa': prioridad
+        }
+
+
+def generar_procesos(cantidad, semilla=None, **distribuciones):
+    """
+    Genera una tanda directamente como instancias de Proceso, sin pasar por
+    los diccionarios de datos. Recibe los mismos argumentos que generar_tanda.
+
+    Returns:
+        Lista de Proceso, lista para pasar a un algoritmo
+    """
+    return [Proceso(*fila) for fila in _filas(cantidad, semilla, **distribuciones)]
+
+
+def escribir_tanda(ruta, procesos):
+    """
+    Escribe una tanda a un archivo a medida que se genera, sin tenerla
+    entera en memoria. Con extensión .ndjson se escribe un proceso por línea;
+    si no, una lista JSON como la de los archivos de entrada.
+
+    Args:
+        ruta: Ruta del archivo
+        procesos: Iterable de diccionarios con datos de procesos (por ejemplo,
+                  el iterador de generar_tanda)
+
+    Returns:
+        Cantidad de procesos escritos
+    """
+    por_linea = ruta.endswith('.ndjson')
+    cantidad = 0
+    with open(ruta, 'w', encoding='utf-8') as archivo:
+        if not por_linea:
+            archivo.write('[')
+        for proceso in procesos:
+            if por_linea:
+                archivo.write(json.dumps(proceso, ensure_ascii=False))
+                archivo.write('\n')
+            else:
+                archivo.write(',\n  ' if cantidad else '\n  ')
+                archivo.write(json.dumps(proceso, ensure_ascii=False))
+            cantidad += 1
+        if not por_linea:
+            archivo.write('\n]\n')
+    return cantidad
+
+
+def leer_tanda(ruta):
+    """
+    Lee una tanda escrita con escribir_tanda (o un archivo de entrada). Los
+    archivos .ndjson se leen de a un proceso por vez.
+
+    Returns:
+        Iterador de diccionarios con datos de procesos
+
+    Raises:
+        ValueError: Si el archivo no es JSON válido o no contiene una lista
+    """
+    with open(ruta, encoding='utf-8') as archivo:
+        if ruta.endswith('.ndjson'):
+            for linea in archivo:
+                if linea.strip():
+                    yield json.loads(linea)
+        else:
+            procesos_datos = json.load(archivo)
+            if not isinstance(procesos_datos, list):
+                raise ValueError("El archivo JSON debe contener una lista de procesos")
+            yield from procesos_datos
@@ -0,0 +1,185 @@
+"""
+Re-simulación incremental de una tanda cuando se edita un proceso.
+
+Mientras se ejecuta, la simulación guarda checkpoints periódicos (snapshots
+del planificador). Al editar un proceso, nada de lo que pasó antes de
+min(arribo anterior, arribo nuevo) puede cambiar, porque el proceso todavía
+no había llegado. Así que se retoma desde el último checkpoint anterior a ese
+tiempo, reutilizando el prefijo del registro de eventos, en lugar de volver
+a simular desde t=0.
+"""
+
+import time
+
+from .algoritmos.planificador import Planificador
+
+
+class SimulacionIncremental:
+    """
+    Simulación de una tanda con checkpoints periódicos, que se puede volver a
+    ejecutar parcialmente al editar un proceso.
+
+    Los checkpoints se toman cada `intervalo` ticks. Si superan
+    `max_checkpoints` se descarta uno de cada dos y se duplica el intervalo,
+    así que la memoria queda acotada aunque la corrida sea larga. El
+    intervalo también se duplica si tomar un checkpoint cuesta más que
+    `sobrecarga_maxima` del tiempo de simulación desde el anterior (un
+    snapshot recorre todos los procesos, así que en tandas grandes conviene
+    espaciarlos).
+
+    Para que cada snapshot cueste según los procesos activos y no según el
+    tamaño de la tanda, no se serializan:
+        - los eventos: se guarda cuántos había y al retomar se copia ese
+          prefijo del registro de la última corrida
+        - los procesos terminados: ya no cambian, el checkpoint guarda una
+          referencia a ellos
+        - los procesos que todavía no llegaron: no tienen estado, se vuelven
+          a crear con los datos de la tanda
+    """
+
+    def __init__(self, crear_algoritmo, crear_proceso, procesos_datos, intervalo=64,
+                 max_checkpoints=64, sobrecarga_maxima=0.1):
+        """
+        Args:
+            crear_algoritmo: Función que recibe la lista de Proceso y retorna el
+                             planificador a ejecutar (con sus parámetros)
+            crear_proceso: Función que recibe los datos de un proceso
+                           (diccionario de la interfaz) y retorna un Proceso
+            procesos_datos: Lista de diccionarios con datos de procesos
+            intervalo: Ticks entre checkpoints
+            max_checkpoints: Cantidad máxima de checkpoints guardados
+            sobrecarga_maxima: Fracción máxima del tiempo de simulación que se
+                               dedica a tomar checkpoints
+        """
+        self.crear_algoritmo = crear_algoritmo
+        self.crear_proceso = crear_proceso
+        self.procesos_datos = [dict(datos) for datos in procesos_datos]
+        self.intervalo = max(1, intervalo)
+        self.max_checkpoints = max(2, max_checkpoints)
+        self.sobrecarga_maxima = sobrecarga_maxima
+
+        self.algoritmo = None
+        # (tiempo, cantidad de eventos, snapshot, {índice: proceso terminado}),
+        # ordenados por tiempo
+        self.checkpoints = []
+        # Tiempo desde el que se retomó la última ejecución (0 = desde el principio)
+        self.tiempo_reanudacion = 0
+        self.eventos_reutilizados = 0
+
+    def ejecutar(self):
+        """
+        Ejecuta la simulación completa desde t=0, tomando checkpoints.
+
+        Returns:
+            El planificador ejecutado
+        """
+        procesos = [self.crear_proceso(datos) for datos in self.procesos_datos]
+        self.algoritmo = self.crear_algoritmo(procesos)
+        self.checkpoints = []
+        self.tiempo_reanudacion = 0
+        self.eventos_reutilizados = 0
+
+        self._agregar_checkpoint()
+        self._continuar()
+        return self.algoritmo
+
+    def editar_proceso(self, indice, proceso_datos):
+        """
+        Reemplaza los datos de un proceso y vuelve a ejecutar la simulación
+        desde el último checkpoint en el que el cambio todavía no influye.
+
+        Args:
+            indice: Posición del proceso en la tanda
+            proceso_datos: Nuevos datos del proceso (diccionario de la interfaz)
+
+        Returns:
+            El planificador ejecutado
+        """
+        anterior = self.procesos_datos[indice]
+        self.procesos_datos[indice] = dict(proceso_datos)
+
+        if self.algoritmo is None:
+            return self.ejecutar()
+
+        # Antes de llegar el proceso no influye en la planificación
+        limite = min(int(anterior['tiempo_arribo']), int(proceso_datos['tiempo_arribo']))
+        validos = [checkpoint for checkpoint in self.checkpoints if checkpoint[0] <= limite]
+        if not validos:
+            return self.ejecutar()
+
+        # Los checkpoints posteriores corresponden a la tanda anterior
+        self.checkpoints = validos
+        self._retomar(*validos[-1])
+        self._continuar()
+        return self.algoritmo
+
+    def _retomar(self, tiempo, cantidad_eventos, instantanea, finalizados):
+        """Restaura un checkpoint con los procesos que aún no llegaron actualizados."""
+        registro = self.algoritmo.resultados.copia(cantidad_eventos)
+        algoritmo = Planificador.desde_snapshot(instantanea, registro)
+
+        # Completar los procesos que no se serializaron: los terminados desde
+        # el checkpoint y los que no llegaron con los datos actuales de la tanda
+        procesos = algoritmo.procesos
+        for i, proceso in enumerate(procesos):
+            if proceso is None:
+                proceso = finalizados.get(i)
+                if proceso is None:
+                    proceso = self.crear_proceso(self.procesos_datos[i])
+                    proceso.pid = i
+                procesos[i] = proceso
+        algoritmo.procesos_terminados = [procesos[i] for i in algoritmo.procesos_terminados]
+        algoritmo.preparar_llegadas()
+
+        self.algoritmo = algoritmo
+        self.tiempo_reanudacion = tiempo
+        self.eventos_reutilizados = cantidad_eventos
+
+    def _continuar(self):
+        """Ejecuta hasta el final tomando un checkpoint cada `intervalo` ticks."""
+        inicio = time.perf_counter()
+        while self.algoritmo.ejecutar_hasta(self.algoritmo.tiempo_actual + self.intervalo):
+            inicio_checkpoint = time.perf_counter()
+            self._agregar_checkpoint()
+            fin = time.perf_counter()
+
+            if fin - inicio_checkpoint > self.sobrecarga_maxima * (inicio_checkpoint - inicio):
+                self.intervalo *= 2
+            inicio = fin
+
+    def _agregar_checkpoint(self):
+        algoritmo = self.algoritmo
+        tiempo = algoritmo.tiempo_actual
+        procesos = algoritmo.procesos
+        llegadas = algoritmo.llegadas
+        terminados = algoritmo.procesos_terminados
+
+        finalizados = {}
+        activos = []
+        for i, proceso in enumerate(procesos):
+            if proceso.estado == "terminado":
+                finalizados[i] = proceso
+                activos.append(None)
+            elif proceso.estado == "nuevo" and proceso.tiempo_arrivo >= tiempo:
+                activos.append(None)
+            else:
+                activos.append(proceso)
+        indices = {id(proceso): i for i, proceso in enumerate(procesos)}
+
+        # Serializar solo los procesos activos (las listas completas se
+        # reconstruyen en _retomar) y devolver las originales
+        algoritmo.procesos = activos
+        algoritmo.llegadas = []
+        algoritmo.procesos_terminados = [indices[id(proceso)] for proceso in terminados]
+        try:
+            instantanea = algoritmo.snapshot(incluir_eventos=False)
+        finally:
+            algoritmo.procesos = procesos
+            algoritmo.llegadas = llegadas
+            algoritmo.procesos_terminados = terminados
+
+        self.checkpoints.append((tiempo, len(algoritmo.resultados), instantanea, finalizados))
+        if len(self.checkpoints) > self.max_checkpoints:
+            # Conservar uno de cada dos (siempre el de t=0) y espaciar los próximos
+            self.checkpoints = self.checkpoints[::2]
+            self.intervalo *= 2
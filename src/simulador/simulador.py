@@ -2,8 +2,12 @@
 Módulo de integración entre la lógica de algoritmos y la interfaz de usuario.
 """
 
+import copy
+import csv
 import os
 import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from datetime import datetime
 from .proceso import Proceso
 from .algoritmos.FCFS import FCFS
@@ -11,15 +15,70 @@ from .algoritmos.SPN import SPN
 from .algoritmos.SRTN import SRTN
 from .algoritmos.RR import RR
 from .algoritmos.PE import PE
-from .exportador_pdf import ExportadorPDF
+from .algoritmos.planificador import SimulacionCancelada
+from .algoritmos.registro_eventos import DescartarEventos
+from .cache_resultados import CacheResultados, clave_simulacion, estimar_tamano
+from .almacen_resultados import AlmacenResultados
+from .simulacion_incremental import SimulacionIncremental
+
+# Nombres de política aceptados (los de la interfaz y sus abreviaturas)
+POLITICAS = {
+    'FCFS': 'FCFS',
+    'SPN': 'SPN',
+    'SRTN': 'SRTN',
+    'RR': 'RR',
+    'Round Robin': 'RR',
+    'PE': 'PE',
+    'Prioridad Externa': 'PE',
+}
+
+# Cada cuántos segundos se consulta cancelado() mientras se espera al pool
+INTERVALO_CANCELACION = 0.1
 
 class Simulador:
     """Clase que integra los algoritmos de planificación con la interfaz."""
     
-    def __init__(self):
+    def __init__(self, generar_pdf=False, cache=True, almacen=None, instrumentar=False):
+        """
+        Args:
+            generar_pdf: Si es True, cada simulación exporta su reporte PDF (se
+                         puede cambiar en cada ejecutar_* con su argumento
+                         generar_pdf). Si es False, la simulación retorna sin
+                         exportarlo y el reporte se genera a pedido con
+                         exportar_pdf()
+            cache: True para reutilizar los resultados de simulaciones ya
+                   ejecutadas con la misma tanda, política y parámetros (cache
+                   LRU con los límites por defecto), un CacheResultados propio
+                   (por ejemplo, compartido entre simuladores) o False
+            almacen: Almacén en disco de resultados, que persiste entre
+                     sesiones: None para no usarlo, True para el directorio
+                     'resultados' dentro de la carpeta de salida, la ruta de
+                     un directorio o un AlmacenResultados
+            instrumentar: Si es True, cada simulación mide las llamadas y el
+                          tiempo por fase del bucle y los eventos por tipo, y
+                          los agrega a los resultados en 'instrumentacion' (no
+                          usa el cache, para medir siempre una corrida real)
+        """
         self.algoritmo_actual = None
+        # Clave de cache de la última simulación (None si no se cachea)
+        self.clave_actual = None
         self.procesos = []
         self.resultados = {}
+        self.generar_pdf = generar_pdf
+        self.instrumentar = instrumentar
+        if cache is True:
+            cache = CacheResultados()
+        elif cache is False:
+            cache = None
+        self.cache = cache
+        if almacen is True:
+            almacen = os.path.join(self._directorio_salida(), 'resultados')
+        if isinstance(almacen, str):
+            almacen = AlmacenResultados(almacen)
+        self.almacen = almacen
+        # Simulación con checkpoints para re-simular al editar un proceso
+        self.incremental = None
+        self.politica_incremental = None
     
     def crear_procesos_desde_datos(self, datos_json):
         """
@@ -47,7 +106,8 @@ class Simulador:
         
         return procesos
     
-    def ejecutar_fcfs(self, procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp):
+    def ejecutar_fcfs(self, procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp, tiempo_maximo=None, max_eventos=None,
+                    destino_eventos=None, generar_pdf=None, progreso=None, cancelado=None):
         """
         Ejecuta el algoritmo FCFS con los datos proporcionados.
         
@@ -56,29 +116,60 @@ class Simulador:
             tiempo_tip: Tiempo de ingreso de proceso
             tiempo_tcp: Tiempo de conmutación de proceso
             tiempo_tfp: Tiempo de finalización de proceso
+            tiempo_maximo: Tiempo máximo de simulación (None = sin límite)
+            max_eventos: Cantidad máxima de eventos a registrar (None = sin límite)
+            destino_eventos: Destino de los eventos (None = guardarlos todos). Ver
+                             algoritmos.registro_eventos
+            generar_pdf: Si es True, exporta el reporte PDF (None = el valor
+                         dado al crear el Simulador)
+            progreso: Función que recibe (tiempo actual, eventos, procesos
+                      terminados) durante la simulación (opcional)
+            cancelado: Función que retorna True para cancelar la simulación
+                       (opcional)
             
         Returns:
             Diccionario con resultados de la simulación
+            
+        Raises:
+            SimulacionCancelada: Si cancelado() retornó True antes de terminar
         """
+        if generar_pdf is None:
+            generar_pdf = self.generar_pdf
+
+        # Reutilizar el resultado si ya se simuló la misma configuración
+        clave, resultados = self._buscar_en_cache('FCFS', procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp,
+                                                  None, tiempo_maximo, max_eventos, destino_eventos,
+                                                  generar_pdf)
+        if resultados is not None:
+            return resultados
+        
         # Convertir datos a instancias de Proceso
         self.procesos = self.crear_procesos_desde_datos(procesos_datos)
         
         # Crear instancia del algoritmo FCFS
-        self.algoritmo_actual = FCFS(self.procesos, tiempo_tip, tiempo_tcp, tiempo_tfp)
+        self.algoritmo_actual = FCFS(self.procesos, tiempo_tip, tiempo_tcp, tiempo_tfp,
+                                     tiempo_maximo=tiempo_maximo, max_eventos=max_eventos,
+                                     destino_eventos=destino_eventos)
         
         # Ejecutar la simulación
-        self.algoritmo_actual.ejecutar()
+        if self.instrumentar:
+            self.algoritmo_actual.instrumentar()
+        self._ejecutar_algoritmo(progreso, cancelado)
         
         # Procesar resultados para la interfaz
         resultados = self._procesar_resultados_fcfs()
-        
-        # Agregar ruta del PDF a los resultados
-        if 'ruta_pdf' not in resultados:
-            resultados['ruta_pdf'] = None
+        if self.instrumentar:
+            resultados['instrumentacion'] = self.algoritmo_actual.instrumentacion.resumen()
+
+        # Exportar el reporte PDF solo si se pidió
+        if generar_pdf:
+            resultados['ruta_pdf'] = self.exportar_pdf()
+        self._guardar_en_cache(clave, resultados)
         
         return resultados
     
-    def ejecutar_spn(self, procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp):
+    def ejecutar_spn(self, procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp, tiempo_maximo=None, max_eventos=None,
+                    destino_eventos=None, generar_pdf=None, progreso=None, cancelado=None):
         """
         Ejecuta el algoritmo SPN con los datos proporcionados.
         
@@ -87,29 +178,60 @@ class Simulador:
             tiempo_tip: Tiempo de ingreso de proceso
             tiempo_tcp: Tiempo de conmutación de proceso
             tiempo_tfp: Tiempo de finalización de proceso
+            tiempo_maximo: Tiempo máximo de simulación (None = sin límite)
+            max_eventos: Cantidad máxima de eventos a registrar (None = sin límite)
+            destino_eventos: Destino de los eventos (None = guardarlos todos). Ver
+                             algoritmos.registro_eventos
+            generar_pdf: Si es True, exporta el reporte PDF (None = el valor
+                         dado al crear el Simulador)
+            progreso: Función que recibe (tiempo actual, eventos, procesos
+                      terminados) durante la simulación (opcional)
+            cancelado: Función que retorna True para cancelar la simulación
+                       (opcional)
             
         Returns:
             Diccionario con resultados de la simulación
+            
+        Raises:
+            SimulacionCancelada: Si cancelado() retornó True antes de terminar
         """
+        if generar_pdf is None:
+            generar_pdf = self.generar_pdf
+
+        # Reutilizar el resultado si ya se simuló la misma configuración
+        clave, resultados = self._buscar_en_cache('SPN', procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp,
+                                                  None, tiempo_maximo, max_eventos, destino_eventos,
+                                                  generar_pdf)
+        if resultados is not None:
+            return resultados
+        
         # Convertir datos a instancias de Proceso
         self.procesos = self.crear_procesos_desde_datos(procesos_datos)
         
         # Crear instancia del algoritmo SPN
-        self.algoritmo_actual = SPN(self.procesos, tiempo_tip, tiempo_tcp, tiempo_tfp)
+        self.algoritmo_actual = SPN(self.procesos, tiempo_tip, tiempo_tcp, tiempo_tfp,
+                                    tiempo_maximo=tiempo_maximo, max_eventos=max_eventos,
+                                    destino_eventos=destino_eventos)
         
         # Ejecutar la simulación
-        self.algoritmo_actual.ejecutar()
+        if self.instrumentar:
+            self.algoritmo_actual.instrumentar()
+        self._ejecutar_algoritmo(progreso, cancelado)
         
         # Procesar resultados para la interfaz
         resultados = self._procesar_resultados_spn()
-        
-        # Agregar ruta del PDF a los resultados
-        if 'ruta_pdf' not in resultados:
-            resultados['ruta_pdf'] = None
+        if self.instrumentar:
+            resultados['instrumentacion'] = self.algoritmo_actual.instrumentacion.resumen()
+
+        # Exportar el reporte PDF solo si se pidió
+        if generar_pdf:
+            resultados['ruta_pdf'] = self.exportar_pdf()
+        self._guardar_en_cache(clave, resultados)
         
         return resultados
     
-    def ejecutar_srtn(self, procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp):
+    def ejecutar_srtn(self, procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp, tiempo_maximo=None, max_eventos=None,
+                    destino_eventos=None, generar_pdf=None, progreso=None, cancelado=None):
         """
         Ejecuta el algoritmo SRTN con los datos proporcionados.
         
@@ -118,29 +240,60 @@ class Simulador:
             tiempo_tip: Tiempo de ingreso de proceso
             tiempo_tcp: Tiempo de conmutación de proceso
             tiempo_tfp: Tiempo de finalización de proceso
+            tiempo_maximo: Tiempo máximo de simulación (None = sin límite)
+            max_eventos: Cantidad máxima de eventos a registrar (None = sin límite)
+            destino_eventos: Destino de los eventos (None = guardarlos todos). Ver
+                             algoritmos.registro_eventos
+            generar_pdf: Si es True, exporta el reporte PDF (None = el valor
+                         dado al crear el Simulador)
+            progreso: Función que recibe (tiempo actual, eventos, procesos
+                      terminados) durante la simulación (opcional)
+            cancelado: Función que retorna True para cancelar la simulación
+                       (opcional)
             
         Returns:
             Diccionario con resultados de la simulación
+            
+        Raises:
+            SimulacionCancelada: Si cancelado() retornó True antes de terminar
         """
+        if generar_pdf is None:
+            generar_pdf = self.generar_pdf
+
+        # Reutilizar el resultado si ya se simuló la misma configuración
+        clave, resultados = self._buscar_en_cache('SRTN', procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp,
+                                                  None, tiempo_maximo, max_eventos, destino_eventos,
+                                                  generar_pdf)
+        if resultados is not None:
+            return resultados
+        
         # Convertir datos a instancias de Proceso
         self.procesos = self.crear_procesos_desde_datos(procesos_datos)
         
         # Crear instancia del algoritmo SRTN
-        self.algoritmo_actual = SRTN(self.procesos, tiempo_tip, tiempo_tcp, tiempo_tfp)
+        self.algoritmo_actual = SRTN(self.procesos, tiempo_tip, tiempo_tcp, tiempo_tfp,
+                                     tiempo_maximo=tiempo_maximo, max_eventos=max_eventos,
+                                     destino_eventos=destino_eventos)
         
         # Ejecutar la simulación
-        self.algoritmo_actual.ejecutar()
+        if self.instrumentar:
+            self.algoritmo_actual.instrumentar()
+        self._ejecutar_algoritmo(progreso, cancelado)
         
         # Procesar resultados para la interfaz
         resultados = self._procesar_resultados_srtn()
-        
-        # Agregar ruta del PDF a los resultados
-        if 'ruta_pdf' not in resultados:
-            resultados['ruta_pdf'] = None
+        if self.instrumentar:
+            resultados['instrumentacion'] = self.algoritmo_actual.instrumentacion.resumen()
+
+        # Exportar el reporte PDF solo si se pidió
+        if generar_pdf:
+            resultados['ruta_pdf'] = self.exportar_pdf()
+        self._guardar_en_cache(clave, resultados)
         
         return resultados
     
-    def ejecutar_rr(self, procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp, quantum):
+    def ejecutar_rr(self, procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp, quantum, tiempo_maximo=None, max_eventos=None,
+                    destino_eventos=None, generar_pdf=None, progreso=None, cancelado=None):
         """
         Ejecuta el algoritmo Round Robin con los datos proporcionados.
         
@@ -150,29 +303,60 @@ class Simulador:
             tiempo_tcp: Tiempo de conmutación de proceso
             tiempo_tfp: Tiempo de finalización de proceso
             quantum: Tiempo de quantum para Round Robin
+            tiempo_maximo: Tiempo máximo de simulación (None = sin límite)
+            max_eventos: Cantidad máxima de eventos a registrar (None = sin límite)
+            destino_eventos: Destino de los eventos (None = guardarlos todos). Ver
+                             algoritmos.registro_eventos
+            generar_pdf: Si es True, exporta el reporte PDF (None = el valor
+                         dado al crear el Simulador)
+            progreso: Función que recibe (tiempo actual, eventos, procesos
+                      terminados) durante la simulación (opcional)
+            cancelado: Función que retorna True para cancelar la simulación
+                       (opcional)
             
         Returns:
             Diccionario con resultados de la simulación
+            
+        Raises:
+            SimulacionCancelada: Si cancelado() retornó True antes de terminar
         """
+        if generar_pdf is None:
+            generar_pdf = self.generar_pdf
+
+        # Reutilizar el resultado si ya se simuló la misma configuración
+        clave, resultados = self._buscar_en_cache('RR', procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp,
+                                                  quantum, tiempo_maximo, max_eventos, destino_eventos,
+                                                  generar_pdf)
+        if resultados is not None:
+            return resultados
+        
         # Convertir datos a instancias de Proceso
         self.procesos = self.crear_procesos_desde_datos(procesos_datos)
         
         # Crear instancia del algoritmo Round Robin
-        self.algoritmo_actual = RR(self.procesos, tiempo_tip, tiempo_tcp, tiempo_tfp, quantum)
+        self.algoritmo_actual = RR(self.procesos, tiempo_tip, tiempo_tcp, tiempo_tfp, quantum,
+                                   tiempo_maximo=tiempo_maximo, max_eventos=max_eventos,
+                                   destino_eventos=destino_eventos)
         
         # Ejecutar la simulación
-        self.algoritmo_actual.ejecutar()
+        if self.instrumentar:
+            self.algoritmo_actual.instrumentar()
+        self._ejecutar_algoritmo(progreso, cancelado)
         
         # Procesar resultados para la interfaz
         resultados = self._procesar_resultados_rr()
-        
-        # Agregar ruta del PDF a los resultados
-        if 'ruta_pdf' not in resultados:
-            resultados['ruta_pdf'] = None
+        if self.instrumentar:
+            resultados['instrumentacion'] = self.algoritmo_actual.instrumentacion.resumen()
+
+        # Exportar el reporte PDF solo si se pidió
+        if generar_pdf:
+            resultados['ruta_pdf'] = self.exportar_pdf()
+        self._guardar_en_cache(clave, resultados)
         
         return resultados
     
-    def ejecutar_pe(self, procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp):
+    def ejecutar_pe(self, procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp, tiempo_maximo=None, max_eventos=None,
+                    destino_eventos=None, generar_pdf=None, progreso=None, cancelado=None):
         """
         Ejecuta el algoritmo de Prioridad Externa (PE) con los datos proporcionados.
         
@@ -181,28 +365,568 @@ class Simulador:
             tiempo_tip: Tiempo de ingreso de proceso
             tiempo_tcp: Tiempo de conmutación de proceso
             tiempo_tfp: Tiempo de finalización de proceso
+            tiempo_maximo: Tiempo máximo de simulación (None = sin límite)
+            max_eventos: Cantidad máxima de eventos a registrar (None = sin límite)
+            destino_eventos: Destino de los eventos (None = guardarlos todos). Ver
+                             algoritmos.registro_eventos
+            generar_pdf: Si es True, exporta el reporte PDF (None = el valor
+                         dado al crear el Simulador)
+            progreso: Función que recibe (tiempo actual, eventos, procesos
+                      terminados) durante la simulación (opcional)
+            cancelado: Función que retorna True para cancelar la simulación
+                       (opcional)
             
         Returns:
             Diccionario con resultados de la simulación
+            
+        Raises:
+            SimulacionCancelada: Si cancelado() retornó True antes de terminar
         """
+        if generar_pdf is None:
+            generar_pdf = self.generar_pdf
+
+        # Reutilizar el resultado si ya se simuló la misma configuración
+        clave, resultados = self._buscar_en_cache('PE', procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp,
+                                                  None, tiempo_maximo, max_eventos, destino_eventos,
+                                                  generar_pdf)
+        if resultados is not None:
+            return resultados
+        
         # Convertir datos a instancias de Proceso
         self.procesos = self.crear_procesos_desde_datos(procesos_datos)
         
         # Crear instancia del algoritmo Prioridad Externa
-        self.algoritmo_actual = PE(self.procesos, tiempo_tip, tiempo_tcp, tiempo_tfp)
+        self.algoritmo_actual = PE(self.procesos, tiempo_tip, tiempo_tcp, tiempo_tfp,
+                                   tiempo_maximo=tiempo_maximo, max_eventos=max_eventos,
+                                   destino_eventos=destino_eventos)
         
         # Ejecutar la simulación
-        self.algoritmo_actual.ejecutar()
+        if self.instrumentar:
+            self.algoritmo_actual.instrumentar()
+        self._ejecutar_algoritmo(progreso, cancelado)
         
         # Procesar resultados para la interfaz
         resultados = self._procesar_resultados_pe()
-        
-        # Agregar ruta del PDF a los resultados
-        if 'ruta_pdf' not in resultados:
-            resultados['ruta_pdf'] = None
+        if self.instrumentar:
+            resultados['instrumentacion'] = self.algoritmo_actual.instrumentacion.resumen()
+
+        # Exportar el reporte PDF solo si se pidió
+        if generar_pdf:
+            resultados['ruta_pdf'] = self.exportar_pdf()
+        self._guardar_en_cache(clave, resultados)
         
         return resultados
     
+    def _ejecutar_algoritmo(self, progreso, cancelado):
+        """
+        Ejecuta algoritmo_actual. Con progreso o cancelado lo hace por tramos
+        (ver Planificador.ejecutar_por_tramos); si se cancela, no queda como
+        última simulación a medias.
+        """
+        if progreso is None and cancelado is None:
+            self.algoritmo_actual.ejecutar()
+            return
+        try:
+            self.algoritmo_actual.ejecutar_por_tramos(progreso, cancelado)
+        except SimulacionCancelada:
+            self.algoritmo_actual = None
+            self.clave_actual = None
+            self.procesos = None
+            raise
+
+    def _buscar_en_cache(self, politica, procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp, quantum,
+                         tiempo_maximo, max_eventos, destino_eventos, generar_pdf):
+        """
+        Busca en el cache el resultado de una simulación. Si está, deja su
+        algoritmo como algoritmo_actual (para poder exportarlo después) y, si
+        se pide el PDF y no estaba exportado, lo exporta. El almacén en disco
+        no se consulta acá porque no guarda el algoritmo.
+
+        Returns:
+            Tupla (clave, resultados). La clave es None si la simulación no se
+            puede cachear (sin cache ni almacén, con un destino de eventos
+            propio, que tiene que recibir los eventos, o instrumentada);
+            resultados es None si no está
+        """
+        self.clave_actual = None
+        if (self.cache is None and self.almacen is None) or destino_eventos is not None or self.instrumentar:
+            return None, None
+        # Un iterador (por ejemplo de generador_tandas) solo se puede recorrer
+        # una vez: se usa para crear los procesos y no se cachea
+        if not isinstance(procesos_datos, (list, tuple)):
+            return None, None
+
+        try:
+            clave = clave_simulacion(procesos_datos, politica, {
+                'tiempo_tip': tiempo_tip,
+                'tiempo_tcp': tiempo_tcp,
+                'tiempo_tfp': tiempo_tfp,
+                'quantum': quantum,
+                'tiempo_maximo': tiempo_maximo,
+                'max_eventos': max_eventos
+            })
+        except (KeyError, TypeError, ValueError):
+            # Datos inválidos: la validación al crear los procesos da el error
+            return None, None
+        self.clave_actual = clave
+        entrada = self.cache.obtener(clave) if self.cache is not None else None
+        # Las entradas de ejecutar_lote no guardan el algoritmo: se vuelve a simular
+        if entrada is None or entrada[1] is None:
+            return clave, None
+
+        # Copia profunda (resultados y algoritmo juntos, comparten los eventos):
+        # quien use el resultado puede modificarlo sin tocar el cache
+        resultados, algoritmo = copy.deepcopy(entrada)
+        self.algoritmo_actual = algoritmo
+        self.procesos = algoritmo.procesos
+
+        if not generar_pdf:
+            resultados['ruta_pdf'] = None
+        elif not (resultados['ruta_pdf'] and os.path.exists(resultados['ruta_pdf'])):
+            # El reporte no se generó o se borró: exportarlo de nuevo
+            resultados['ruta_pdf'] = self.exportar_pdf()
+            tamano = estimar_tamano(resultados) + estimar_tamano(algoritmo.procesos)
+            self.cache.guardar(clave, copy.deepcopy((resultados, algoritmo)), tamano)
+        return clave, resultados
+
+    def _guardar_en_cache(self, clave, resultados):
+        """
+        Guarda en el cache el resultado (y el algoritmo) de la última
+        simulación, y en el almacén en disco si hay uno.
+        """
+        if clave is None:
+            return
+        algoritmo = self.algoritmo_actual
+        if self.cache is not None:
+            tamano = estimar_tamano(resultados) + estimar_tamano(algoritmo.procesos)
+            self.cache.guardar(clave, copy.deepcopy((resultados, algoritmo)), tamano)
+        self._guardar_en_almacen(clave, resultados, {
+            'politica': algoritmo.__class__.__name__,
+            'tiempo_tip': algoritmo.tiempo_tip,
+            'tiempo_tcp': algoritmo.tiempo_tcp,
+            'tiempo_tfp': algoritmo.tiempo_tfp,
+            'quantum': getattr(algoritmo, 'quantum', None)
+        })
+
+    def _guardar_en_almacen(self, clave, resultados, descripcion):
+        """Guarda un resultado en el almacén en disco, si hay uno."""
+        if self.almacen is None:
+            return
+        try:
+            self.almacen.guardar(clave, resultados, descripcion)
+        except OSError as e:
+            print(f"❌ Error al guardar el resultado en el almacén: {e}")
+
+    def _buscar_guardado(self, clave):
+        """
+        Busca el resultado de un trabajo de ejecutar_lote en el cache y luego
+        en el almacén en disco.
+
+        Returns:
+            Diccionario de resultados, o None si no está en ninguno
+        """
+        if self.cache is not None:
+            entrada = self.cache.obtener(clave)
+            if entrada is not None:
+                return entrada[0]
+        if self.almacen is not None:
+            resultados = self.almacen.obtener(clave)
+            if resultados is not None and self.cache is not None:
+                self.cache.guardar(clave, (resultados, None))
+            return resultados
+        return None
+
+    def ejecutar_politica(self, politica, procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp,
+                          quantum=None, **opciones):
+        """
+        Ejecuta la política indicada por nombre.
+
+        Args:
+            politica: Nombre de la política ('FCFS', 'SPN', 'SRTN', 'RR' o
+                      'Round Robin', 'PE' o 'Prioridad Externa')
+            procesos_datos: Lista de diccionarios con datos de procesos
+            tiempo_tip: Tiempo de ingreso de proceso
+            tiempo_tcp: Tiempo de conmutación de proceso
+            tiempo_tfp: Tiempo de finalización de proceso
+            quantum: Tiempo de quantum (solo para Round Robin)
+            **opciones: tiempo_maximo, max_eventos, destino_eventos, generar_pdf,
+                        progreso y cancelado
+
+        Returns:
+            Diccionario con resultados de la simulación
+        """
+        if politica not in POLITICAS:
+            raise ValueError(f"Política desconocida: {politica}")
+        politica = POLITICAS[politica]
+
+        if politica == 'FCFS':
+            return self.ejecutar_fcfs(procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp, **opciones)
+        elif politica == 'SPN':
+            return self.ejecutar_spn(procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp, **opciones)
+        elif politica == 'SRTN':
+            return self.ejecutar_srtn(procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp, **opciones)
+        elif politica == 'RR':
+            if quantum is None:
+                raise ValueError("Round Robin requiere un quantum")
+            return self.ejecutar_rr(procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp, quantum, **opciones)
+        else:
+            return self.ejecutar_pe(procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp, **opciones)
+
+    def ejecutar_incremental(self, politica, procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp,
+                             quantum=None, tiempo_maximo=None, max_eventos=None, intervalo_checkpoint=64):
+        """
+        Ejecuta la política indicada guardando checkpoints periódicos, para que
+        luego editar_proceso() pueda volver a simular solo desde el punto en el
+        que el cambio influye. No usa el cache de resultados.
+
+        Args:
+            politica: Nombre de la política (ver ejecutar_politica)
+            procesos_datos: Lista de diccionarios con datos de procesos
+            tiempo_tip: Tiempo de ingreso de proceso
+            tiempo_tcp: Tiempo de conmutación de proceso
+            tiempo_tfp: Tiempo de finalización de proceso
+            quantum: Tiempo de quantum (solo para Round Robin)
+            tiempo_maximo: Tiempo máximo de simulación (None = sin límite)
+            max_eventos: Cantidad máxima de eventos a registrar (None = sin límite)
+            intervalo_checkpoint: Ticks entre checkpoints (se duplica si la
+                                  corrida es larga, para acotar la memoria)
+
+        Returns:
+            Diccionario con resultados de la simulación
+        """
+        if politica not in POLITICAS:
+            raise ValueError(f"Política desconocida: {politica}")
+        politica = POLITICAS[politica]
+        if politica == 'RR' and quantum is None:
+            raise ValueError("Round Robin requiere un quantum")
+
+        clases = {'FCFS': FCFS, 'SPN': SPN, 'SRTN': SRTN, 'RR': RR, 'PE': PE}
+        opciones = {'tiempo_maximo': tiempo_maximo, 'max_eventos': max_eventos}
+
+        def crear_algoritmo(procesos):
+            if politica == 'RR':
+                return RR(procesos, tiempo_tip, tiempo_tcp, tiempo_tfp, quantum, **opciones)
+            return clases[politica](procesos, tiempo_tip, tiempo_tcp, tiempo_tfp, **opciones)
+
+        def crear_proceso(proceso_datos):
+            return self.crear_procesos_desde_datos([proceso_datos])[0]
+
+        self.politica_incremental = politica
+        self.incremental = SimulacionIncremental(crear_algoritmo, crear_proceso, procesos_datos,
+                                                 intervalo=intervalo_checkpoint)
+        self.incremental.ejecutar()
+        return self._resultados_incremental()
+
+    def editar_proceso(self, indice, proceso_datos):
+        """
+        Cambia los datos de un proceso de la última simulación incremental y
+        la vuelve a ejecutar desde el último checkpoint anterior a
+        min(arribo anterior, arribo nuevo), reutilizando los eventos previos.
+
+        Args:
+            indice: Posición del proceso en la tanda
+            proceso_datos: Nuevos datos del proceso (mismo formato que la tanda)
+
+        Returns:
+            Diccionario con resultados de la simulación, con 'incremental':
+            tiempo desde el que se retomó y eventos reutilizados
+        """
+        if self.incremental is None:
+            raise RuntimeError("No hay una simulación incremental: usar ejecutar_incremental primero")
+        self.incremental.editar_proceso(indice, proceso_datos)
+        return self._resultados_incremental()
+
+    def _resultados_incremental(self):
+        """Procesa los resultados de la simulación incremental actual."""
+        self.algoritmo_actual = self.incremental.algoritmo
+        self.clave_actual = None
+        self.procesos = self.algoritmo_actual.procesos
+
+        procesar = {
+            'FCFS': self._procesar_resultados_fcfs,
+            'SPN': self._procesar_resultados_spn,
+            'SRTN': self._procesar_resultados_srtn,
+            'RR': self._procesar_resultados_rr,
+            'PE': self._procesar_resultados_pe
+        }
+        resultados = procesar[self.politica_incremental]()
+        resultados['incremental'] = {
+            'tiempo_reanudacion': self.incremental.tiempo_reanudacion,
+            'eventos_reutilizados': self.incremental.eventos_reutilizados,
+            'checkpoints': len(self.incremental.checkpoints)
+        }
+        if self.generar_pdf:
+            resultados['ruta_pdf'] = self.exportar_pdf()
+        return resultados
+
+    def ejecutar_lote(self, trabajos, max_workers=None, incluir_eventos=False, cancelado=None):
+        """
+        Ejecuta muchas simulaciones repartidas en un pool de procesos. No se
+        genera ningún PDF.
+
+        Args:
+            trabajos: Lista de trabajos. Cada uno es una tupla
+                      (procesos_datos, politica, parametros) o un diccionario con
+                      las claves 'procesos', 'politica' y 'parametros'. Los
+                      parámetros son los argumentos de ejecutar_politica
+                      (tiempo_tip, tiempo_tcp, tiempo_tfp, quantum,
+                      tiempo_maximo, max_eventos)
+            max_workers: Cantidad de procesos del pool (None = uno por CPU,
+                         1 = ejecutar en este mismo proceso)
+            incluir_eventos: Si es False los eventos se descartan durante la
+                             simulación (menos memoria y menos datos a enviar
+                             entre procesos); 'eventos' y 'gantt' quedan vacíos
+            cancelado: Función que retorna True para cancelar el lote. En este
+                       mismo proceso se consulta durante cada simulación; con
+                       el pool, mientras se esperan los resultados: los bloques
+                       que no empezaron se descartan y no se espera a los que
+                       están corriendo
+
+        Returns:
+            Lista con un diccionario por trabajo, en el mismo orden en que se
+            recibieron: 'politica', 'parametros', 'resultados', 'tiempo_ejecucion'
+            (segundos), 'error' (None si terminó bien) y 'desde_cache' (True si
+            el resultado ya estaba calculado: en el cache del simulador, en su
+            almacén en disco o por un trabajo idéntico del mismo lote)
+
+        Raises:
+            SimulacionCancelada: Si cancelado() retornó True antes de terminar;
+                                 no se guarda ningún resultado del lote
+        """
+        trabajos = [_normalizar_trabajo(trabajo, incluir_eventos) for trabajo in trabajos]
+
+        # Resolver desde el cache o el almacén y ejecutar una sola vez los repetidos
+        claves = [self._clave_trabajo(trabajo) for trabajo in trabajos]
+        corridas = [None] * len(trabajos)
+        # clave (o índice, si no se puede cachear) -> índice del trabajo a ejecutar
+        pendientes = {}
+        for indice, (trabajo, clave) in enumerate(zip(trabajos, claves)):
+            if clave is None:
+                pendientes[indice] = indice
+                continue
+            resultados = self._buscar_guardado(clave)
+            if resultados is not None:
+                corridas[indice] = _corrida_desde_cache(trabajo, resultados)
+            elif clave not in pendientes:
+                pendientes[clave] = indice
+
+        a_ejecutar = [trabajos[indice] for indice in pendientes.values()]
+        if max_workers == 1 or len(a_ejecutar) <= 1:
+            ejecutadas = [_ejecutar_trabajo(trabajo, cancelado) for trabajo in a_ejecutar]
+        else:
+            ejecutadas = _ejecutar_en_pool(a_ejecutar, max_workers, cancelado)
+
+        for indice, corrida in zip(pendientes.values(), ejecutadas):
+            corridas[indice] = corrida
+            clave = claves[indice]
+            if clave is not None and corrida['error'] is None:
+                # Sin algoritmo: quedó en el proceso del pool
+                if self.cache is not None:
+                    self.cache.guardar(clave, (copy.deepcopy(corrida['resultados']), None))
+                self._guardar_en_almacen(clave, corrida['resultados'], {
+                    'politica': corrida['politica'],
+                    'parametros': corrida['parametros']
+                })
+
+        # Los repetidos dentro del lote toman el resultado del primero
+        for indice, clave in enumerate(claves):
+            if corridas[indice] is None:
+                original = corridas[pendientes[clave]]
+                if original['error'] is None:
+                    corridas[indice] = _corrida_desde_cache(trabajos[indice], original['resultados'])
+                else:
+                    corridas[indice] = dict(original, parametros=trabajos[indice]['parametros'])
+
+        return corridas
+
+    def _clave_trabajo(self, trabajo):
+        """
+        Retorna la clave de cache de un trabajo de ejecutar_lote, o None si no
+        se puede cachear (sin cache ni almacén, política desconocida, datos
+        inválidos o con un destino de eventos propio).
+        """
+        parametros = trabajo['parametros']
+        if self.cache is None and self.almacen is None:
+            return None
+        if trabajo['politica'] not in POLITICAS or 'destino_eventos' in parametros:
+            return None
+        try:
+            return clave_simulacion(trabajo['procesos'], POLITICAS[trabajo['politica']], parametros,
+                                    eventos=trabajo['incluir_eventos'])
+        except (KeyError, TypeError, ValueError):
+            # Datos inválidos: se ejecuta y la corrida registra el error
+            return None
+
+    def barrido_quantum(self, procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp, quantums,
+                        valores_tcp=None, max_workers=None, tiempo_maximo=None):
+        """
+        Ejecuta Round Robin sobre una misma tanda para un rango de quantums (y
+        opcionalmente de valores de TCP) en paralelo y arma una matriz de
+        métricas: una fila por valor de TCP y una columna por quantum.
+
+        Args:
+            procesos_datos: Lista de diccionarios con datos de procesos
+            tiempo_tip: Tiempo de ingreso de proceso
+            tiempo_tcp: Tiempo de conmutación de proceso (si no se da valores_tcp)
+            tiempo_tfp: Tiempo de finalización de proceso
+            quantums: Quantums a evaluar (por ejemplo range(1, 11))
+            valores_tcp: Valores de TCP a evaluar (None = solo tiempo_tcp)
+            max_workers: Cantidad de procesos del pool (ver ejecutar_lote)
+            tiempo_maximo: Tiempo máximo de cada simulación (None = sin límite)
+
+        Returns:
+            Diccionario con 'quantums', 'tcps' y una matriz [tcp][quantum] por
+            métrica: 'tiempo_medio_retorno', 'tiempo_medio_retorno_normalizado',
+            'porcentaje_cpu_so', 'cambios_contexto' y 'truncado'. Las celdas de
+            las corridas que fallaron quedan en None y su error en 'errores'.
+        """
+        quantums = list(quantums)
+        tcps = list(valores_tcp) if valores_tcp is not None else [tiempo_tcp]
+
+        trabajos = []
+        for tcp in tcps:
+            for quantum in quantums:
+                trabajos.append((procesos_datos, 'RR', {
+                    'tiempo_tip': tiempo_tip,
+                    'tiempo_tcp': tcp,
+                    'tiempo_tfp': tiempo_tfp,
+                    'quantum': quantum,
+                    'tiempo_maximo': tiempo_maximo
+                }))
+
+        corridas = self.ejecutar_lote(trabajos, max_workers=max_workers)
+
+        metricas = ['tiempo_medio_retorno', 'tiempo_medio_retorno_normalizado',
+                    'porcentaje_cpu_so', 'cambios_contexto']
+        matriz = {
+            'quantums': quantums,
+            'tcps': tcps,
+            'truncado': [[None] * len(quantums) for _ in tcps],
+            'errores': []
+        }
+        for metrica in metricas:
+            matriz[metrica] = [[None] * len(quantums) for _ in tcps]
+
+        # Los resultados vienen en el orden de los trabajos: fila por fila
+        for indice, corrida in enumerate(corridas):
+            fila, columna = divmod(indice, len(quantums))
+            if corrida['error'] is not None:
+                matriz['errores'].append({
+                    'tcp': tcps[fila],
+                    'quantum': quantums[columna],
+                    'error': corrida['error']
+                })
+                continue
+            for metrica in metricas:
+                matriz[metrica][fila][columna] = corrida['resultados']['metricas'][metrica]
+            matriz['truncado'][fila][columna] = corrida['resultados']['truncado']
+
+        return matriz
+
+    def comparar_politicas(self, procesos_datos, tiempo_tip, tiempo_tcp, tiempo_tfp, quantum,
+                           max_workers=None, tiempo_maximo=None, cancelado=None):
+        """
+        Ejecuta las cinco políticas sobre la misma tanda en paralelo y arma una
+        comparación de sus métricas.
+
+        Args:
+            procesos_datos: Lista de diccionarios con datos de procesos
+            tiempo_tip: Tiempo de ingreso de proceso
+            tiempo_tcp: Tiempo de conmutación de proceso
+            tiempo_tfp: Tiempo de finalización de proceso
+            quantum: Tiempo de quantum para Round Robin
+            max_workers: Cantidad de procesos del pool (ver ejecutar_lote)
+            tiempo_maximo: Tiempo máximo de cada simulación (None = sin límite)
+            cancelado: Función que retorna True para cancelar la comparación
+                       (ver ejecutar_lote)
+
+        Returns:
+            Diccionario con 'politicas' (en el orden ejecutado), 'resultados' y
+            'metricas' por política, 'ranking' (de menor a mayor tiempo medio
+            de retorno; las que fallaron o quedaron truncadas van al final),
+            'tiempos_ejecucion' y 'errores' por política
+
+        Raises:
+            SimulacionCancelada: Si cancelado() retornó True antes de terminar
+        """
+        # Una sola copia de la tanda, compartida por todas las corridas
+        procesos = copy.deepcopy(procesos_datos)
+        politicas = ['FCFS', 'SPN', 'SRTN', 'RR', 'PE']
+
+        parametros = {
+            'tiempo_tip': tiempo_tip,
+            'tiempo_tcp': tiempo_tcp,
+            'tiempo_tfp': tiempo_tfp,
+            'tiempo_maximo': tiempo_maximo
+        }
+        trabajos = []
+        for politica in politicas:
+            if politica == 'RR':
+                trabajos.append((procesos, politica, dict(parametros, quantum=quantum)))
+            else:
+                trabajos.append((procesos, politica, parametros))
+
+        corridas = self.ejecutar_lote(trabajos, max_workers=max_workers, cancelado=cancelado)
+
+        comparacion = {
+            'politicas': politicas,
+            'resultados': {},
+            'metricas': {},
+            'ranking': [],
+            'tiempos_ejecucion': {},
+            'errores': {}
+        }
+        for politica, corrida in zip(politicas, corridas):
+            comparacion['resultados'][politica] = corrida['resultados']
+            comparacion['tiempos_ejecucion'][politica] = corrida['tiempo_ejecucion']
+            if corrida['error'] is not None:
+                comparacion['errores'][politica] = corrida['error']
+            else:
+                comparacion['metricas'][politica] = corrida['resultados']['metricas']
+
+        def clave_ranking(politica):
+            metricas = comparacion['metricas'].get(politica)
+            if metricas is None:
+                return (2, 0, 0)
+            completa = 1 if comparacion['resultados'][politica]['truncado'] else 0
+            return (completa, metricas['tiempo_medio_retorno'], metricas['tiempo_medio_retorno_normalizado'])
+
+        comparacion['ranking'] = sorted(politicas, key=clave_ranking)
+        return comparacion
+
+    def exportar_comparacion(self, comparacion, ruta=None):
+        """
+        Exporta una comparación de políticas a un archivo CSV con una fila por
+        política, en el orden del ranking.
+
+        Args:
+            comparacion: Diccionario retornado por comparar_politicas
+            ruta: Ruta del archivo (None = data/output con timestamp)
+
+        Returns:
+            Ruta del archivo generado
+        """
+        if ruta is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            ruta = os.path.join(self._directorio_salida(), f"comparacion_politicas_{timestamp}.csv")
+
+        columnas = ['tiempo_total', 'tiempo_medio_retorno', 'tiempo_medio_retorno_normalizado',
+                    'cpu_desocupada', 'cpu_so', 'cpu_procesos', 'porcentaje_cpu_so',
+                    'cambios_contexto', 'procesos_terminados']
+
+        with open(ruta, 'w', newline='', encoding='utf-8') as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(['posicion', 'politica'] + columnas + ['truncado', 'error'])
+            for posicion, politica in enumerate(comparacion['ranking'], 1):
+                metricas = comparacion['metricas'].get(politica, {})
+                resultados = comparacion['resultados'].get(politica) or {}
+                escritor.writerow([posicion, politica] +
+                                  [metricas.get(columna, '') for columna in columnas] +
+                                  [resultados.get('truncado', ''), comparacion['errores'].get(politica, '')])
+
+        print(f"Comparación de políticas exportada a: {ruta}")
+        return ruta
+
     def _procesar_resultados_fcfs(self):
         """
         Procesa los resultados del algoritmo FCFS para mostrarlos en la interfaz.
@@ -245,9 +969,6 @@ class Simulador:
         
         # Procesar datos para el diagrama de Gantt
         datos_gantt = self._procesar_datos_gantt()
-        
-        # Exportar reporte PDF y capturar la ruta
-        ruta_pdf = self.exportar_pdf()
 
         return {
             'procesos': datos_procesos,
@@ -258,7 +979,9 @@ class Simulador:
             'cpu_procesos': f"{tiempo_cpu_procesos} ({tiempo_cpu_procesos/tiempo_total*100:.1f}%)" if tiempo_total > 0 else "0 (0%)",
             'gantt': datos_gantt,
             'eventos': self.algoritmo_actual.resultados,
-            'ruta_pdf': ruta_pdf
+            'ruta_pdf': None,
+            'truncado': self.algoritmo_actual.truncado,
+            'metricas': self._calcular_metricas(procesos_terminados, stats_cpu)
         }
     
     def _procesar_resultados_spn(self):
@@ -303,9 +1026,6 @@ class Simulador:
         
         # Procesar datos para el diagrama de Gantt
         datos_gantt = self._procesar_datos_gantt()
-        
-        # Exportar reporte PDF y capturar la ruta
-        ruta_pdf = self.exportar_pdf()
 
         return {
             'procesos': datos_procesos,
@@ -316,7 +1036,9 @@ class Simulador:
             'cpu_procesos': f"{tiempo_cpu_procesos} ({tiempo_cpu_procesos/tiempo_total*100:.1f}%)" if tiempo_total > 0 else "0 (0%)",
             'gantt': datos_gantt,
             'eventos': self.algoritmo_actual.resultados,
-            'ruta_pdf': ruta_pdf
+            'ruta_pdf': None,
+            'truncado': self.algoritmo_actual.truncado,
+            'metricas': self._calcular_metricas(procesos_terminados, stats_cpu)
         }
     
     def _procesar_resultados_srtn(self):
@@ -361,9 +1083,6 @@ class Simulador:
         
         # Procesar datos para el diagrama de Gantt
         datos_gantt = self._procesar_datos_gantt()
-        
-        # Exportar reporte PDF y capturar la ruta
-        ruta_pdf = self.exportar_pdf()
 
         return {
             'procesos': datos_procesos,
@@ -374,7 +1093,9 @@ class Simulador:
             'cpu_procesos': f"{tiempo_cpu_procesos} ({tiempo_cpu_procesos/tiempo_total*100:.1f}%)" if tiempo_total > 0 else "0 (0%)",
             'gantt': datos_gantt,
             'eventos': self.algoritmo_actual.resultados,
-            'ruta_pdf': ruta_pdf
+            'ruta_pdf': None,
+            'truncado': self.algoritmo_actual.truncado,
+            'metricas': self._calcular_metricas(procesos_terminados, stats_cpu)
         }
     
     def _procesar_resultados_rr(self):
@@ -419,9 +1140,6 @@ class Simulador:
         
         # Procesar datos para el diagrama de Gantt
         datos_gantt = self._procesar_datos_gantt()
-        
-        # Exportar reporte PDF y capturar la ruta
-        ruta_pdf = self.exportar_pdf()
 
         return {
             'procesos': datos_procesos,
@@ -432,7 +1150,9 @@ class Simulador:
             'cpu_procesos': f"{tiempo_cpu_procesos} ({tiempo_cpu_procesos/tiempo_total*100:.1f}%)" if tiempo_total > 0 else "0 (0%)",
             'gantt': datos_gantt,
             'eventos': self.algoritmo_actual.resultados,
-            'ruta_pdf': ruta_pdf
+            'ruta_pdf': None,
+            'truncado': self.algoritmo_actual.truncado,
+            'metricas': self._calcular_metricas(procesos_terminados, stats_cpu)
         }
     
     def _procesar_resultados_pe(self):
@@ -477,9 +1197,6 @@ class Simulador:
         
         # Procesar datos para el diagrama de Gantt
         datos_gantt = self._procesar_datos_gantt()
-        
-        # Exportar reporte PDF y capturar la ruta
-        ruta_pdf = self.exportar_pdf()
 
         return {
             'procesos': datos_procesos,
@@ -490,9 +1207,46 @@ class Simulador:
             'cpu_procesos': f"{tiempo_cpu_procesos} ({tiempo_cpu_procesos/tiempo_total*100:.1f}%)" if tiempo_total > 0 else "0 (0%)",
             'gantt': datos_gantt,
             'eventos': self.algoritmo_actual.resultados,
-            'ruta_pdf': ruta_pdf
+            'ruta_pdf': None,
+            'truncado': self.algoritmo_actual.truncado,
+            'metricas': self._calcular_metricas(procesos_terminados, stats_cpu)
         }
     
+    def _calcular_metricas(self, procesos_terminados, stats_cpu):
+        """
+        Calcula las métricas numéricas de la tanda (sin formatear), para
+        comparar corridas entre sí.
+
+        Args:
+            procesos_terminados: Procesos que terminaron su ejecución
+            stats_cpu: Estadísticas de CPU del algoritmo
+
+        Returns:
+            Diccionario con las métricas
+        """
+        cantidad = len(procesos_terminados)
+        tiempo_total = stats_cpu['t_total'] if cantidad else 0
+
+        if cantidad:
+            tiempo_medio_retorno = sum(p.tiempo_retorno for p in procesos_terminados) / cantidad
+            tiempo_medio_retorno_normalizado = sum(p.tiempo_retorno_normalizado
+                                                   for p in procesos_terminados) / cantidad
+        else:
+            tiempo_medio_retorno = 0
+            tiempo_medio_retorno_normalizado = 0
+
+        return {
+            'procesos_terminados': cantidad,
+            'tiempo_total': tiempo_total,
+            'tiempo_medio_retorno': tiempo_medio_retorno,
+            'tiempo_medio_retorno_normalizado': tiempo_medio_retorno_normalizado,
+            'cpu_desocupada': stats_cpu['cpu_idle'],
+            'cpu_so': stats_cpu['cpu_so'],
+            'cpu_procesos': stats_cpu['cpu_proc'],
+            'porcentaje_cpu_so': stats_cpu['cpu_so'] / tiempo_total * 100 if tiempo_total > 0 else 0,
+            'cambios_contexto': self.algoritmo_actual.cambios_contexto
+        }
+
     def _procesar_datos_gantt(self):
         """
         Procesa los datos para el diagrama de Gantt.
@@ -537,14 +1291,11 @@ class Simulador:
             'duraciones': duraciones
         }
     
-    def exportar_pdf(self):
+    def _directorio_salida(self):
         """
-        Exporta un reporte PDF con los resultados de la simulación.
+        Retorna el directorio donde se guardan los archivos exportados,
+        creándolo si no existe.
         """
-        if not hasattr(self, 'algoritmo_actual') or not self.algoritmo_actual:
-            return
-        
-        # Crear directorio de salida si no existe
         if hasattr(sys, '_MEIPASS'):
             # Ejecutable empaquetado - guardar en el directorio del ejecutable
             if hasattr(sys, 'frozen'):
@@ -559,11 +1310,20 @@ class Simulador:
             output_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'output')
         
         os.makedirs(output_dir, exist_ok=True)
-        
-        # Generar nombre de archivo con timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"reporte_simulacion_{timestamp}.pdf"
-        filepath = os.path.join(output_dir, filename)
+        return output_dir
+    
+    def preparar_datos_pdf(self):
+        """
+        Arma los datos del reporte PDF de la última simulación. Separado de
+        exportar_pdf para tomarlos antes de exportar en otro hilo: el reporte
+        no cambia aunque mientras tanto se ejecute otra simulación.
+
+        Returns:
+            Diccionario para ExportadorPDF.exportar_simulacion, o None si no
+            hay simulación
+        """
+        if not hasattr(self, 'algoritmo_actual') or not self.algoritmo_actual:
+            return None
         
         # Determinar el nombre del algoritmo
         algoritmo_nombre = self.algoritmo_actual.__class__.__name__
@@ -610,14 +1370,191 @@ class Simulador:
             datos_pdf['cpu_so'] = f"{tiempo_cpu_so} ({tiempo_cpu_so/datos_pdf['tiempo_total']*100:.1f}%)"
             datos_pdf['cpu_procesos'] = f"{tiempo_cpu_procesos} ({tiempo_cpu_procesos/datos_pdf['tiempo_total']*100:.1f}%)"
         
-        # Crear exportador PDF
+        return datos_pdf
+    
+    def ruta_pdf_guardada(self):
+        """
+        Retorna la ruta del PDF ya exportado de la última simulación, si está
+        en el cache y el archivo sigue existiendo: repetir una simulación
+        cacheada no necesita volver a generar el reporte.
+
+        Returns:
+            Ruta del PDF, o None si hay que exportarlo
+        """
+        if self.cache is None or self.clave_actual is None:
+            return None
+        entrada = self.cache.consultar(self.clave_actual)
+        if entrada is None:
+            return None
+        ruta_pdf = entrada[0].get('ruta_pdf')
+        if ruta_pdf and os.path.exists(ruta_pdf):
+            return ruta_pdf
+        return None
+
+    def registrar_pdf(self, clave, ruta_pdf):
+        """
+        Anota en el cache la ruta del PDF exportado para una simulación (por
+        ejemplo, al terminar una exportación en otro hilo), para que
+        ruta_pdf_guardada() la encuentre al repetirla.
+
+        Args:
+            clave: clave_actual de la simulación al preparar los datos del PDF
+            ruta_pdf: Ruta del PDF generado
+        """
+        if self.cache is None or clave is None or not ruta_pdf:
+            return
+        entrada = self.cache.consultar(clave)
+        if entrada is not None:
+            entrada[0]['ruta_pdf'] = ruta_pdf
+
+    def exportar_pdf(self, datos_pdf=None, progreso=None, cancelado=None):
+        """
+        Exporta un reporte PDF con los resultados de la última simulación. Se
+        puede llamar en cualquier momento después de ejecutar_*, para generar
+        el reporte a pedido en lugar de en cada simulación.
+
+        Args:
+            datos_pdf: Datos tomados antes con preparar_datos_pdf (None = los
+                       de la última simulación)
+            progreso: Función que recibe la fracción completada, de 0 a 1
+            cancelado: Función que retorna True para cancelar la exportación
+
+        Returns:
+            Ruta del PDF generado, o None si no hay simulación, falló o se
+            canceló
+        """
+        clave = None
+        if datos_pdf is None:
+            datos_pdf = self.preparar_datos_pdf()
+            if datos_pdf is None:
+                return None
+            clave = self.clave_actual
+        
+        output_dir = self._directorio_salida()
+        
+        # Generar nombre de archivo con timestamp
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        filename = f"reporte_simulacion_{timestamp}.pdf"
+        filepath = os.path.join(output_dir, filename)
+        
+        # Crear exportador PDF (reportlab se importa recién al exportar: la
+        # interfaz arranca y las simulaciones sin PDF corren sin cargarlo)
+        from .exportador_pdf import ExportadorPDF, ExportacionCancelada
         exportador = ExportadorPDF()
         
         # Exportar PDF
         try:
-            ruta_pdf = exportador.exportar_simulacion(datos_pdf, filepath)
+            ruta_pdf = exportador.exportar_simulacion(datos_pdf, filepath, progreso, cancelado)
             print(f"Lista de eventos exportada a: {ruta_pdf}")
+            self.registrar_pdf(clave, ruta_pdf)
             return ruta_pdf
+        except ExportacionCancelada:
+            print("Exportación del PDF cancelada")
+            return None
         except Exception as e:
             print(f"❌ Error al exportar PDF: {e}")
             return None
+
+
+def _normalizar_trabajo(trabajo, incluir_eventos):
+    """Convierte un trabajo de ejecutar_lote al diccionario que recibe el pool."""
+    if isinstance(trabajo, dict):
+        procesos_datos = trabajo['procesos']
+        politica = trabajo['politica']
+        parametros = trabajo.get('parametros', {})
+    else:
+        procesos_datos, politica, parametros = trabajo
+
+    return {
+        'procesos': procesos_datos,
+        'politica': politica,
+        'parametros': dict(parametros),
+        'incluir_eventos': incluir_eventos
+    }
+
+
+def _corrida_desde_cache(trabajo, resultados):
+    """
+    Arma la respuesta de ejecutar_lote para un trabajo resuelto sin simular,
+    con una copia profunda de los resultados (la original queda en el cache).
+    """
+    resultados = copy.deepcopy(resultados)
+    resultados['ruta_pdf'] = None
+    return {
+        'politica': trabajo['politica'],
+        'parametros': trabajo['parametros'],
+        'resultados': resultados,
+        'tiempo_ejecucion': 0.0,
+        'error': None,
+        'desde_cache': True
+    }
+
+
+def _ejecutar_en_pool(trabajos, max_workers, cancelado=None):
+    """
+    Ejecuta trabajos de ejecutar_lote en un pool de procesos y retorna sus
+    corridas en el mismo orden. Si cancelado() retorna True mientras se
+    espera, cancela los bloques pendientes, cierra el pool sin esperar a los
+    que están corriendo y lanza SimulacionCancelada.
+    """
+    # Repartir en bloques para no pagar un viaje entre procesos por trabajo
+    workers = max_workers or os.cpu_count() or 1
+    tamano_bloque = max(1, len(trabajos) // (workers * 4))
+    bloques = [trabajos[i:i + tamano_bloque] for i in range(0, len(trabajos), tamano_bloque)]
+
+    executor = ProcessPoolExecutor(max_workers=max_workers)
+    cancelada = False
+    try:
+        futuros = [executor.submit(_ejecutar_bloque, bloque) for bloque in bloques]
+        pendientes = set(futuros)
+        while pendientes:
+            if cancelado is not None and cancelado():
+                cancelada = True
+                for futuro in pendientes:
+                    futuro.cancel()
+                raise SimulacionCancelada()
+            _, pendientes = wait(pendientes, timeout=INTERVALO_CANCELACION if cancelado else None,
+                                 return_when=FIRST_COMPLETED)
+        return [corrida for futuro in futuros for corrida in futuro.result()]
+    finally:
+        executor.shutdown(wait=not cancelada, cancel_futures=cancelada)
+
+
+def _ejecutar_bloque(trabajos):
+    """Ejecuta un bloque de trabajos en un proceso del pool."""
+    return [_ejecutar_trabajo(trabajo) for trabajo in trabajos]
+
+
+def _ejecutar_trabajo(trabajo, cancelado=None):
+    """
+    Ejecuta un trabajo de ejecutar_lote. Es una función de módulo para poder
+    enviarla a los procesos del pool. La cancelación no se registra como
+    error del trabajo: corta todo el lote.
+    """
+    parametros = dict(trabajo['parametros'])
+    if not trabajo['incluir_eventos']:
+        parametros['destino_eventos'] = DescartarEventos()
+    if cancelado is not None:
+        parametros['cancelado'] = cancelado
+
+    inicio = time.perf_counter()
+    try:
+        resultados = Simulador(generar_pdf=False, cache=False).ejecutar_politica(
+            trabajo['politica'], trabajo['procesos'], **parametros)
+        if not trabajo['incluir_eventos']:
+            resultados['eventos'] = []
+        error = None
+    except SimulacionCancelada:
+        raise
+    except Exception as e:
+        resultados = None
+        error = f"{type(e).__name__}: {e}"
+
+    return {
+        'politica': trabajo['politica'],
+        'parametros': trabajo['parametros'],
+        'resultados': resultados,
+        'tiempo_ejecucion': time.perf_counter() - inicio,
+        'error': error,
+        'desde_cache': False
+    }
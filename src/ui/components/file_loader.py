@@ -7,6 +7,9 @@ import customtkinter as ctk
 import tkinter.filedialog as fd
 import json
 
+from ...simulador.proceso import normalizar_datos_proceso, validar_datos_proceso
+
+
 class CargadorArchivos(ctk.CTkFrame):
     """Componente para cargar archivos de procesos."""
     
@@ -147,14 +150,8 @@ class CargadorArchivos(ctk.CTkFrame):
                         raise Exception(f"Falta el campo '{campo}' en el proceso {i+1}")
                 
                 # Crear proceso con la estructura esperada por el resto de la aplicación
-                proceso = {
-                    'nombre': str(proceso_data['nombre']),
-                    'tiempo_arribo': int(proceso_data['tiempo_arribo']),
-                    'cantidad_rafagas_cpu': int(proceso_data['cantidad_rafagas_cpu']),
-                    'duracion_rafaga_cpu': int(proceso_data['duracion_rafaga_cpu']),
-                    'duracion_rafaga_es': int(proceso_data['duracion_rafaga_es']),
-                    'prioridad_externa': int(proceso_data['prioridad_externa'])
-                }
+                proceso = normalizar_datos_proceso(proceso_data)
+                validar_datos_proceso(proceso, i+1)
                 self.procesos_cargados.append(proceso)
             
             if not self.procesos_cargados:
@@ -13,6 +13,10 @@ class PestañaResultados(ctk.CTkFrame):
         
         self.factor_escala = factor_escala
         self.ruta_pdf_actual = None
+        self.callback_cancelar_pdf = None
+        self.callback_exportar_pdf = None
+        self.callback_cancelar_simulacion = None
+        self.total_procesos_simulacion = 0
         self._crear_widgets()
     
     def _crear_widgets(self):
@@ -47,6 +51,13 @@ class PestañaResultados(ctk.CTkFrame):
         )
         linea.grid(row=1, column=0, pady=(int(8 * self.factor_escala), 0), sticky="ew")
         
+        # Progreso de la simulación en curso (oculto hasta que empieza una)
+        (self.progreso_simulacion_frame, self.label_progreso_simulacion, self.barra_progreso_simulacion,
+         self.boton_cancelar_simulacion) = self._crear_barra_progreso(titulo_frame, "⚙️ Simulando...",
+                                                                     self._cancelar_simulacion)
+        self.progreso_simulacion_frame.grid(row=2, column=0, sticky="ew", pady=(int(12 * self.factor_escala), 0))
+        self.progreso_simulacion_frame.grid_remove()
+        
         # Frame scrollable para el contenido
         self.scrollable_frame = ctk.CTkScrollableFrame(
             main_frame,
@@ -246,6 +257,28 @@ class PestañaResultados(ctk.CTkFrame):
         )
         self.label_cpu_procesos.grid(row=0, column=0, pady=int(20 * self.factor_escala), padx=int(15 * self.factor_escala), sticky="ew")
         
+        # Botón para generar el reporte PDF a pedido (inicialmente oculto)
+        self.exportar_pdf_frame = ctk.CTkFrame(
+            self.scrollable_frame,
+            corner_radius=int(12 * self.factor_escala),
+            border_width=1
+        )
+        self.exportar_pdf_frame.grid(row=3, column=0, sticky="ew", pady=(0, int(20 * self.factor_escala)))
+        self.exportar_pdf_frame.grid_columnconfigure(0, weight=1)
+        
+        self.boton_exportar_pdf = ctk.CTkButton(
+            self.exportar_pdf_frame,
+            text="📄 Exportar PDF",
+            command=self._exportar_pdf,
+            font=ctk.CTkFont(size=int(14 * self.factor_escala), weight="bold"),
+            fg_color="#3b82f6",
+            hover_color="#2563eb",
+            height=int(35 * self.factor_escala),
+            width=int(120 * self.factor_escala)
+        )
+        self.boton_exportar_pdf.grid(row=0, column=0, pady=int(20 * self.factor_escala), padx=int(20 * self.factor_escala), sticky="ew")
+        self.exportar_pdf_frame.grid_remove()  # Ocultar inicialmente
+        
         # Contenedor separado para el botón de PDF
         self.pdf_frame = ctk.CTkFrame(
             self.scrollable_frame,
@@ -268,6 +301,57 @@ class PestañaResultados(ctk.CTkFrame):
         )
         self.boton_abrir_pdf.grid(row=0, column=0, pady=int(20 * self.factor_escala), padx=int(20 * self.factor_escala), sticky="ew")
         self.pdf_frame.grid_remove()  # Ocultar inicialmente
+        
+        # Contenedor del progreso mientras se genera el PDF (misma posición que el botón)
+        (self.progreso_pdf_frame, self.label_progreso_pdf, self.barra_progreso_pdf,
+         self.boton_cancelar_pdf) = self._crear_barra_progreso(self.scrollable_frame, "📄 Generando reporte PDF... 0%",
+                                                               self._cancelar_pdf)
+        self.progreso_pdf_frame.grid(row=3, column=0, sticky="ew", pady=(0, int(20 * self.factor_escala)))
+        self.progreso_pdf_frame.grid_remove()  # Ocultar inicialmente
+    
+    def _crear_barra_progreso(self, parent, texto, comando_cancelar):
+        """
+        Crea un contenedor con un texto, una barra de progreso y un botón
+        para cancelar.
+        
+        Returns:
+            Tupla (frame, label, barra, botón de cancelar)
+        """
+        frame = ctk.CTkFrame(
+            parent,
+            corner_radius=int(12 * self.factor_escala),
+            border_width=1
+        )
+        frame.grid_columnconfigure(0, weight=1)
+        
+        label = ctk.CTkLabel(
+            frame,
+            text=texto,
+            font=ctk.CTkFont(size=int(14 * self.factor_escala), weight="bold"),
+            anchor="w"
+        )
+        label.grid(row=0, column=0, pady=(int(15 * self.factor_escala), int(8 * self.factor_escala)), padx=int(20 * self.factor_escala), sticky="ew")
+        
+        barra = ctk.CTkProgressBar(
+            frame,
+            height=int(10 * self.factor_escala)
+        )
+        barra.set(0)
+        barra.grid(row=1, column=0, pady=(0, int(15 * self.factor_escala)), padx=(int(20 * self.factor_escala), int(10 * self.factor_escala)), sticky="ew")
+        
+        boton_cancelar = ctk.CTkButton(
+            frame,
+            text="Cancelar",
+            command=comando_cancelar,
+            font=ctk.CTkFont(size=int(13 * self.factor_escala), weight="bold"),
+            fg_color="#dc2626",
+            hover_color="#b91c1c",
+            height=int(30 * self.factor_escala),
+            width=int(100 * self.factor_escala)
+        )
+        boton_cancelar.grid(row=0, column=1, rowspan=2, pady=int(15 * self.factor_escala), padx=(0, int(20 * self.factor_escala)))
+        
+        return frame, label, barra, boton_cancelar
     
     def actualizar_resultados_procesos(self, datos_procesos):
         """Actualiza los resultados por proceso."""
@@ -335,6 +419,46 @@ class PestañaResultados(ctk.CTkFrame):
             )
             cell_label.grid(row=0, column=j, sticky="ew", padx=padx, pady=int(6 * self.factor_escala))
     
+    def mostrar_comparacion(self, comparacion):
+        """Muestra la comparación de las cinco políticas, ordenadas por ranking."""
+        # Limpiar datos anteriores
+        for widget in self.tabla_datos_frame.winfo_children():
+            widget.destroy()
+        
+        headers = ["Política", "T. Medio Retorno", "Tr.Norm. Medio", "CPU por SO"]
+        self._crear_fila_tabla(0, headers, "#404040", True)
+        
+        for i, politica in enumerate(comparacion['ranking']):
+            row_color = "#2b2b2b" if i % 2 == 0 else "#333333"
+            metricas = comparacion['metricas'].get(politica)
+            
+            if metricas is None:
+                datos_fila = [f"{i + 1}. {politica}", "Error", "--", "--"]
+            else:
+                nombre = f"{i + 1}. {politica}"
+                if comparacion['resultados'][politica]['truncado']:
+                    nombre += " (truncada)"
+                datos_fila = [
+                    nombre,
+                    f"{metricas['tiempo_medio_retorno']:.2f}",
+                    f"{metricas['tiempo_medio_retorno_normalizado']:.2f}",
+                    f"{metricas['porcentaje_cpu_so']:.1f}%"
+                ]
+            
+            self._crear_fila_tabla(i + 1, datos_fila, row_color, False)
+        
+        # Resultados de la tanda y de CPU de la mejor política
+        mejor = comparacion['ranking'][0]
+        resultados = comparacion['resultados'].get(mejor)
+        if resultados:
+            self.label_tr.configure(text=f"🏆 Mejor política: {mejor}")
+            self.label_tmr.configure(text=f"📈 Tiempo Medio de Retorno: {resultados['tiempo_medio_retorno']:.2f}")
+            self.actualizar_resultados_cpu(
+                resultados['cpu_desocupada'],
+                resultados['cpu_so'],
+                resultados['cpu_procesos']
+            )
+    
     def actualizar_resultados_tanda(self, tiempo_retorno, tiempo_medio_retorno):
         """Actualiza los resultados de la tanda."""
         self.label_tr.configure(text=f"⏱️ Tiempo de Retorno: {tiempo_retorno}")
@@ -361,8 +485,10 @@ class PestañaResultados(ctk.CTkFrame):
         self.label_cpu_so.configure(text="CPU por SO: --")
         self.label_cpu_procesos.configure(text="CPU por Procesos: --")
         
-        # Ocultar contenedor de PDF
+        # Ocultar contenedores de PDF
+        self.exportar_pdf_frame.grid_remove()
         self.pdf_frame.grid_remove()
+        self.progreso_pdf_frame.grid_remove()
         self.ruta_pdf_actual = None
     
     def mostrar_mensaje_inicial(self):
@@ -555,11 +681,104 @@ class PestañaResultados(ctk.CTkFrame):
                     except Exception:
                         pass
     
+    def mostrar_boton_exportar_pdf(self):
+        """Muestra el botón para generar el reporte PDF de los resultados."""
+        self.ruta_pdf_actual = None
+        self.pdf_frame.grid_remove()
+        self.progreso_pdf_frame.grid_remove()
+        self.exportar_pdf_frame.grid()
+    
     def mostrar_notificacion_pdf(self, ruta_pdf):
         """Muestra el botón para abrir el PDF."""
         self.ruta_pdf_actual = ruta_pdf
+        self.exportar_pdf_frame.grid_remove()
+        self.progreso_pdf_frame.grid_remove()
         self.pdf_frame.grid()  # Mostrar el contenedor del botón
     
+    def mostrar_progreso_pdf(self):
+        """Muestra el progreso de la generación del PDF, empezando en 0%."""
+        self.exportar_pdf_frame.grid_remove()
+        self.pdf_frame.grid_remove()
+        self.actualizar_progreso_pdf(0)
+        self.progreso_pdf_frame.grid()
+    
+    def actualizar_progreso_pdf(self, fraccion):
+        """Actualiza la barra de progreso del PDF (fracción de 0 a 1)."""
+        self.barra_progreso_pdf.set(fraccion)
+        self.label_progreso_pdf.configure(text=f"📄 Generando reporte PDF... {int(fraccion * 100)}%")
+    
+    def ocultar_progreso_pdf(self):
+        """Oculta el progreso del PDF (al cancelar o si falló la exportación)."""
+        self.progreso_pdf_frame.grid_remove()
+    
+    def mostrar_progreso_simulacion(self, total_procesos):
+        """Muestra el progreso de la simulación en curso."""
+        self.total_procesos_simulacion = total_procesos
+        self.barra_progreso_simulacion.set(0)
+        self.label_progreso_simulacion.configure(text="⚙️ Simulando...")
+        self.boton_cancelar_simulacion.configure(state="normal")
+        self.boton_cancelar_simulacion.grid()
+        self.progreso_simulacion_frame.grid()
+    
+    def actualizar_progreso_simulacion(self, tiempo, eventos, terminados):
+        """
+        Actualiza el progreso de la simulación: tiempo simulado, eventos
+        registrados y procesos terminados (la barra avanza con estos).
+        """
+        if self.total_procesos_simulacion:
+            self.barra_progreso_simulacion.set(terminados / self.total_procesos_simulacion)
+        self.label_progreso_simulacion.configure(
+            text=f"⚙️ Simulando... tiempo {tiempo} · {eventos} eventos · "
+                 f"{terminados}/{self.total_procesos_simulacion} procesos terminados"
+        )
+    
+    def mostrar_progreso_comparacion(self):
+        """
+        Muestra el progreso de la comparación de políticas. No hay avance
+        parcial, pero se puede cancelar.
+        """
+        self.total_procesos_simulacion = 0
+        self.barra_progreso_simulacion.set(0)
+        self.label_progreso_simulacion.configure(text="⚙️ Comparando las cinco políticas...")
+        self.boton_cancelar_simulacion.configure(state="normal")
+        self.boton_cancelar_simulacion.grid()
+        self.progreso_simulacion_frame.grid()
+    
+    def ocultar_progreso_simulacion(self):
+        """Oculta el progreso de la simulación."""
+        self.progreso_simulacion_frame.grid_remove()
+    
+    def establecer_callback_cancelar_simulacion(self, callback):
+        """Establece el callback del botón para cancelar la simulación."""
+        self.callback_cancelar_simulacion = callback
+    
+    def _cancelar_simulacion(self):
+        """Pide cancelar la simulación en curso."""
+        self.boton_cancelar_simulacion.configure(state="disabled")
+        self.label_progreso_simulacion.configure(text="⚙️ Cancelando la simulación...")
+        if self.callback_cancelar_simulacion:
+            self.callback_cancelar_simulacion()
+    
+    def establecer_callback_cancelar_pdf(self, callback):
+        """Establece el callback del botón para cancelar la generación del PDF."""
+        self.callback_cancelar_pdf = callback
+    
+    def _cancelar_pdf(self):
+        """Pide cancelar la generación del PDF en curso."""
+        if self.callback_cancelar_pdf:
+            self.callback_cancelar_pdf()
+        # El reporte se puede volver a pedir
+        self.mostrar_boton_exportar_pdf()
+    
+    def establecer_callback_exportar_pdf(self, callback):
+        """Establece el callback del botón para exportar el PDF."""
+        self.callback_exportar_pdf = callback
+    
+    def _exportar_pdf(self):
+        """Pide generar el reporte PDF de los resultados mostrados."""
+        if self.callback_exportar_pdf:
+            self.callback_exportar_pdf()
+    
     def actualizar_escalado(self, nuevo_factor_escala):
         """Actualiza el escalado del componente dinámicamente."""
         self.factor_escala = nuevo_factor_escala
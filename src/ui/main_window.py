@@ -1,3 +1,5 @@
+import threading
+
 import customtkinter as ctk
 import tkinter as tk
 
@@ -6,6 +8,9 @@ from .components.policy_selector import SelectorPoliticas
 from .components.parameter_input import EntradaParametros
 from .components.results_tab import PestañaResultados
 
+# Cada cuánto se consulta el progreso de la simulación y de la generación del PDF
+INTERVALO_PROGRESO_MS = 100
+
 class VentanaPrincipal(ctk.CTk):
     
     def __init__(self):
@@ -26,6 +31,12 @@ class VentanaPrincipal(ctk.CTk):
         # Variables de estado
         self.procesos_cargados = []
         self.sidebar_colapsado = False
+        # Se crea en la primera simulación y se reutiliza (conserva el cache de resultados)
+        self.simulador = None
+        # Simulación en curso (ver _ejecutar_simulacion_basica)
+        self.simulacion = None
+        # Generación del PDF en curso (ver _exportar_pdf_en_segundo_plano)
+        self.exportacion_pdf = None
         
         # Configurar grid principal - 3 columnas
         self.grid_columnconfigure(0, weight=0)  # Sidebar
@@ -278,6 +289,11 @@ class VentanaPrincipal(ctk.CTk):
         # Parameter input callbacks
         self.entrada_parametros.establecer_callback(self._cambio_parametro)
         
+        # Results tab callbacks
+        self.pestaña_resultados.establecer_callback_cancelar_simulacion(self._cancelar_simulacion)
+        self.pestaña_resultados.establecer_callback_cancelar_pdf(self._cancelar_exportacion_pdf)
+        self.pestaña_resultados.establecer_callback_exportar_pdf(self._exportar_pdf)
+        
         # Configurar estado inicial del quantum (FCFS por defecto)
         self._cambio_politica("FCFS")
         
@@ -291,8 +307,8 @@ class VentanaPrincipal(ctk.CTk):
     
     def _cambio_politica(self, politica):
         """Callback cuando cambia la política de planificación."""
-        # Habilitar/deshabilitar quantum según la política
-        if politica == "Round Robin":
+        # Habilitar/deshabilitar quantum según la política (la comparación incluye Round Robin)
+        if politica in ("Round Robin", "Comparar todas"):
             self.entrada_parametros.habilitar_quantum(True)
         else:
             self.entrada_parametros.habilitar_quantum(False)
@@ -305,6 +321,11 @@ class VentanaPrincipal(ctk.CTk):
     
     def _verificar_estado_simulacion(self):
         """Verifica si se pueden habilitar los controles de simulación."""
+        # No lanzar otra simulación mientras corre una
+        if self.simulacion is not None:
+            self.boton_simular_header.configure(state="disabled")
+            return
+        
         # Verificar que haya archivo cargado
         if not self.procesos_cargados:
             self.boton_simular_header.configure(state="disabled")
@@ -322,7 +343,7 @@ class VentanaPrincipal(ctk.CTk):
     
     def _simular(self):
         """Ejecuta la simulación."""
-        if not self.procesos_cargados:
+        if not self.procesos_cargados or self.simulacion is not None:
             return
         
         # Validar parámetros
@@ -334,83 +355,257 @@ class VentanaPrincipal(ctk.CTk):
         parametros = self.entrada_parametros.obtener_todos_parametros()
         politica = self.selector_politicas.obtener_politica_seleccionada()
         
-        # Limpiar resultados anteriores
+        # Limpiar resultados anteriores (y cancelar el PDF que se estuviera generando)
+        self._cancelar_exportacion_pdf()
         self.pestaña_resultados.limpiar_resultados()
         
         # Ejecutar simulación (por ahora solo muestra información)
         self._ejecutar_simulacion_basica(politica, parametros)
     
     def _ejecutar_simulacion_basica(self, politica, parametros):
-        """Ejecuta la simulación usando el algoritmo seleccionado."""
+        """
+        Ejecuta la simulación usando el algoritmo seleccionado, en otro hilo
+        para que la ventana siga respondiendo con tandas grandes. El hilo solo
+        escribe en el diccionario de la simulación (progreso, resultados);
+        la ventana lo consulta con after() y muestra los resultados al
+        terminar, porque Tkinter solo se puede usar desde el hilo principal.
+        """
         
         # Importar el simulador
         from ..simulador.simulador import Simulador
+        from ..simulador.algoritmos import SimulacionCancelada
+        
+        # Crear el simulador la primera vez; repetir una configuración usa su cache
+        if self.simulador is None:
+            self.simulador = Simulador()
+        simulador = self.simulador
+        procesos = self.procesos_cargados
+        
+        simulacion = {
+            'politica': politica,
+            'progreso': None,
+            'resultados': None,
+            'error': None,
+            'cancelar': threading.Event()
+        }
         
-        # Crear instancia del simulador
-        simulador = Simulador()
+        def registrar_progreso(tiempo, eventos, terminados):
+            simulacion['progreso'] = (tiempo, eventos, terminados)
+        
+        opciones = {'progreso': registrar_progreso, 'cancelado': simulacion['cancelar'].is_set}
+        
+        def simular():
+            try:
+                # Ejecutar simulación según la política seleccionada
+                if politica == "Comparar todas":
+                    # Las cinco corren en paralelo en el pool; al cancelar,
+                    # este hilo deja de esperarlas y descarta las pendientes
+                    resultados = simulador.comparar_politicas(
+                        procesos,
+                        parametros['tip'],
+                        parametros['tcp'],
+                        parametros['tfp'],
+                        parametros['quantum'],
+                        cancelado=simulacion['cancelar'].is_set
+                    )
+                elif politica == "FCFS":
+                    resultados = simulador.ejecutar_fcfs(
+                        procesos,
+                        parametros['tip'],
+                        parametros['tcp'],
+                        parametros['tfp'],
+                        **opciones
+                    )
+                elif politica == "SPN":
+                    resultados = simulador.ejecutar_spn(
+                        procesos,
+                        parametros['tip'],
+                        parametros['tcp'],
+                        parametros['tfp'],
+                        **opciones
+                    )
+                elif politica == "SRTN":
+                    resultados = simulador.ejecutar_srtn(
+                        procesos,
+                        parametros['tip'],
+                        parametros['tcp'],
+                        parametros['tfp'],
+                        **opciones
+                    )
+                elif politica == "Round Robin":
+                    resultados = simulador.ejecutar_rr(
+                        procesos,
+                        parametros['tip'],
+                        parametros['tcp'],
+                        parametros['tfp'],
+                        parametros['quantum'],
+                        **opciones
+                    )
+                elif politica == "Prioridad Externa":
+                    resultados = simulador.ejecutar_pe(
+                        procesos,
+                        parametros['tip'],
+                        parametros['tcp'],
+                        parametros['tfp'],
+                        **opciones
+                    )
+                else:
+                    # Para otros algoritmos no hay resultados (se muestra el mensaje inicial)
+                    resultados = None
+                simulacion['resultados'] = resultados
+            except SimulacionCancelada:
+                pass
+            except Exception as e:
+                simulacion['error'] = e
+        
+        simulacion['hilo'] = threading.Thread(target=simular, daemon=True)
+        self.simulacion = simulacion
+        self.boton_simular_header.configure(state="disabled")
+        if politica == "Comparar todas":
+            self.pestaña_resultados.mostrar_progreso_comparacion()
+        else:
+            self.pestaña_resultados.mostrar_progreso_simulacion(len(procesos))
+        simulacion['hilo'].start()
+        self.after(INTERVALO_PROGRESO_MS, self._revisar_simulacion, simulacion)
+    
+    def _revisar_simulacion(self, simulacion):
+        """Actualiza el progreso de la simulación y, al terminar, muestra los resultados."""
+        cancelada = simulacion['cancelar'].is_set()
+        if simulacion['hilo'].is_alive():
+            if simulacion['progreso'] is not None and not cancelada:
+                self.pestaña_resultados.actualizar_progreso_simulacion(*simulacion['progreso'])
+            self.after(INTERVALO_PROGRESO_MS, self._revisar_simulacion, simulacion)
+            return
         
-        # Ejecutar simulación según la política seleccionada
-        if politica == "FCFS":
-            resultados = simulador.ejecutar_fcfs(
-                self.procesos_cargados,
-                parametros['tip'],
-                parametros['tcp'],
-                parametros['tfp']
-            )
-        elif politica == "SPN":
-            resultados = simulador.ejecutar_spn(
-                self.procesos_cargados,
-                parametros['tip'],
-                parametros['tcp'],
-                parametros['tfp']
-            )
-        elif politica == "SRTN":
-            resultados = simulador.ejecutar_srtn(
-                self.procesos_cargados,
-                parametros['tip'],
-                parametros['tcp'],
-                parametros['tfp']
-            )
-        elif politica == "Round Robin":
-            resultados = simulador.ejecutar_rr(
-                self.procesos_cargados,
-                parametros['tip'],
-                parametros['tcp'],
-                parametros['tfp'],
-                parametros['quantum']
-            )
-        elif politica == "Prioridad Externa":
-            resultados = simulador.ejecutar_pe(
-                self.procesos_cargados,
-                parametros['tip'],
-                parametros['tcp'],
-                parametros['tfp']
-            )
+        # Recién ahora se puede lanzar otra: las dos usarían el mismo simulador
+        self.simulacion = None
+        self.pestaña_resultados.ocultar_progreso_simulacion()
+        self._verificar_estado_simulacion()
+        
+        if cancelada:
+            self.pestaña_resultados.mostrar_mensaje_inicial()
+            return
+        
+        if simulacion['error'] is not None:
+            print(f"❌ Error en la simulación: {simulacion['error']}")
+            self.pestaña_resultados.mostrar_mensaje_inicial()
+            return
+        
+        resultados = simulacion['resultados']
+        if simulacion['politica'] == "Comparar todas":
+            self._mostrar_comparacion(resultados)
+        elif resultados:
+            self._mostrar_resultados(resultados)
         else:
-            # Para otros algoritmos, mostrar mensaje de no implementado
             self.pestaña_resultados.mostrar_mensaje_inicial()
+    
+    def _cancelar_simulacion(self):
+        """Cancela la simulación en curso, si hay una."""
+        # El hilo se detiene al terminar el tramo que está simulando y
+        # _revisar_simulacion limpia la interfaz
+        if self.simulacion is not None:
+            self.simulacion['cancelar'].set()
+    
+    def _mostrar_resultados(self, resultados):
+        """Actualiza la interfaz con los resultados de una política."""
+        self.pestaña_resultados.actualizar_resultados_procesos(resultados['procesos'])
+        self.pestaña_resultados.actualizar_resultados_tanda(
+            resultados['tiempo_total'], 
+            resultados['tiempo_medio_retorno']
+        )
+        self.pestaña_resultados.actualizar_resultados_cpu(
+            resultados['cpu_desocupada'],
+            resultados['cpu_so'],
+            resultados['cpu_procesos']
+        )
+        
+        # El reporte PDF se genera solo si se pide con el botón; al repetir
+        # una simulación cacheada se reutiliza el que ya se exportó
+        ruta_pdf = self.simulador.ruta_pdf_guardada()
+        if ruta_pdf:
+            self.pestaña_resultados.mostrar_notificacion_pdf(ruta_pdf)
+        else:
+            self.pestaña_resultados.mostrar_boton_exportar_pdf()
+    
+    def _mostrar_comparacion(self, comparacion):
+        """Muestra la comparación de las cinco políticas."""
+        self.pestaña_resultados.mostrar_comparacion(comparacion)
+        
+        # Exportar la comparación (CSV en la carpeta de salida)
+        try:
+            self.simulador.exportar_comparacion(comparacion)
+        except OSError as e:
+            print(f"❌ Error al exportar la comparación: {e}")
+    
+    def _exportar_pdf(self):
+        """Genera el PDF de los resultados mostrados (botón "Exportar PDF")."""
+        if self.simulador is None or self.simulacion is not None or self.exportacion_pdf is not None:
+            return
+        self._exportar_pdf_en_segundo_plano(self.simulador)
+    
+    def _exportar_pdf_en_segundo_plano(self, simulador):
+        """
+        Genera el PDF de la última simulación en otro hilo, para poder seguir
+        viendo los resultados mientras se arma un reporte grande. El hilo solo
+        escribe en el diccionario de la exportación; la ventana lo consulta
+        con after(), porque Tkinter solo se puede usar desde el hilo principal.
+        """
+        # Los datos se toman acá: el hilo no lee el simulador mientras corre otra simulación
+        datos_pdf = simulador.preparar_datos_pdf()
+        if datos_pdf is None:
             return
         
-        # Actualizar la interfaz con los resultados reales
-        if resultados:
-            self.pestaña_resultados.actualizar_resultados_procesos(resultados['procesos'])
-            self.pestaña_resultados.actualizar_resultados_tanda(
-                resultados['tiempo_total'], 
-                resultados['tiempo_medio_retorno']
-            )
-            self.pestaña_resultados.actualizar_resultados_cpu(
-                resultados['cpu_desocupada'],
-                resultados['cpu_so'],
-                resultados['cpu_procesos']
-            )
-            
-            # Mostrar notificación del PDF si se generó correctamente
-            if resultados.get('ruta_pdf'):
-                self.pestaña_resultados.mostrar_notificacion_pdf(resultados['ruta_pdf'])
-            
-            
+        exportacion = {
+            'progreso': 0.0,
+            'ruta_pdf': None,
+            'cancelar': threading.Event(),
+            # Para anotar en el cache el PDF de esta simulación al terminar
+            'clave': simulador.clave_actual
+        }
+        
+        def registrar_progreso(fraccion):
+            exportacion['progreso'] = fraccion
+        
+        def exportar():
+            exportacion['ruta_pdf'] = simulador.exportar_pdf(datos_pdf, progreso=registrar_progreso,
+                                                             cancelado=exportacion['cancelar'].is_set)
+        
+        exportacion['hilo'] = threading.Thread(target=exportar, daemon=True)
+        self.exportacion_pdf = exportacion
+        self.pestaña_resultados.mostrar_progreso_pdf()
+        exportacion['hilo'].start()
+        self.after(INTERVALO_PROGRESO_MS, self._revisar_exportacion_pdf, exportacion)
+    
+    def _revisar_exportacion_pdf(self, exportacion):
+        """Actualiza el progreso del PDF y, al terminar, muestra el botón para abrirlo."""
+        # Una exportación cancelada ya no actualiza la interfaz
+        if exportacion is not self.exportacion_pdf:
+            return
+        
+        if exportacion['hilo'].is_alive():
+            self.pestaña_resultados.actualizar_progreso_pdf(exportacion['progreso'])
+            self.after(INTERVALO_PROGRESO_MS, self._revisar_exportacion_pdf, exportacion)
+            return
+        
+        self.exportacion_pdf = None
+        if exportacion['ruta_pdf']:
+            self.simulador.registrar_pdf(exportacion['clave'], exportacion['ruta_pdf'])
+            self.pestaña_resultados.mostrar_notificacion_pdf(exportacion['ruta_pdf'])
+        else:
+            # Falló: se puede volver a intentar
+            self.pestaña_resultados.mostrar_boton_exportar_pdf()
+    
+    def _cancelar_exportacion_pdf(self):
+        """Cancela la generación del PDF en curso, si hay una."""
+        if self.exportacion_pdf is None:
+            return
+        # El hilo termina solo al ver el pedido (sin escribir el archivo)
+        self.exportacion_pdf['cancelar'].set()
+        self.exportacion_pdf = None
+        self.pestaña_resultados.ocultar_progreso_pdf()
     
     def _limpiar_resultados(self):
         """Limpia todos los resultados."""
+        self._cancelar_exportacion_pdf()
         self.pestaña_resultados.limpiar_resultados()
     
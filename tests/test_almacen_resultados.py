@@ -0,0 +1,99 @@
+"""
+Pruebas del almacén en disco de resultados y de su uso desde el Simulador.
+"""
+
+import os
+
+from src.simulador.almacen_resultados import AlmacenResultados
+from src.simulador.simulador import Simulador
+
+from utilidades import cargar_caso
+
+PARAMETROS = {'tiempo_tip': 1, 'tiempo_tcp': 1, 'tiempo_tfp': 1}
+
+
+def simular(politica='FCFS'):
+    return Simulador(cache=False).ejecutar_politica(politica, cargar_caso('tanda_5p')['procesos'], **PARAMETROS,
+                                                    quantum=3)
+
+
+def test_guardar_y_obtener(tmp_path):
+    resultados = simular()
+    almacen = AlmacenResultados(str(tmp_path))
+
+    assert almacen.obtener('a' * 64) is None
+    assert almacen.guardar('a' * 64, resultados, {'politica': 'FCFS'})
+    leidos = almacen.obtener('a' * 64)
+
+    assert list(leidos['eventos']) == list(resultados['eventos'])
+    assert leidos['metricas'] == resultados['metricas']
+    assert leidos['procesos'] == resultados['procesos']
+    assert (almacen.aciertos, almacen.fallos) == (1, 1)
+
+
+def test_persiste_entre_instancias(tmp_path):
+    resultados = simular()
+    AlmacenResultados(str(tmp_path)).guardar('b' * 64, resultados)
+
+    almacen = AlmacenResultados(str(tmp_path))
+
+    assert 'b' * 64 in almacen
+    assert almacen.obtener('b' * 64)['metricas'] == resultados['metricas']
+
+
+def test_desaloja_el_usado_hace_mas_tiempo(tmp_path):
+    resultados = simular()
+    almacen = AlmacenResultados(str(tmp_path))
+    almacen.guardar('a' * 64, resultados)
+    # Lugar para dos resultados como este, no para tres
+    almacen.max_bytes = almacen.bytes * 2 + almacen.bytes // 2
+
+    almacen.guardar('b' * 64, resultados)
+    almacen.obtener('a' * 64)
+    almacen.guardar('c' * 64, resultados)
+
+    assert 'a' * 64 in almacen and 'c' * 64 in almacen and 'b' * 64 not in almacen
+    assert almacen.desalojos == 1
+    # El desalojo también queda registrado en el índice
+    assert 'b' * 64 not in AlmacenResultados(str(tmp_path))
+
+
+def test_archivo_danado_es_un_fallo(tmp_path):
+    almacen = AlmacenResultados(str(tmp_path))
+    almacen.guardar('d' * 64, simular())
+    with open(os.path.join(str(tmp_path), 'dd', 'd' * 64 + '.res.gz'), 'wb') as archivo:
+        archivo.write(b'no es gzip')
+
+    assert almacen.obtener('d' * 64) is None
+    assert 'd' * 64 not in almacen
+
+
+def test_indice_con_una_linea_cortada(tmp_path):
+    almacen = AlmacenResultados(str(tmp_path))
+    almacen.guardar('e' * 64, simular())
+    with open(almacen.ruta_indice, 'a', encoding='utf-8') as archivo:
+        archivo.write('{"op": "guar')
+
+    assert 'e' * 64 in AlmacenResultados(str(tmp_path))
+
+
+def test_otra_sesion_del_simulador_usa_el_almacen(tmp_path):
+    procesos_datos = cargar_caso('tanda_5p')['procesos']
+    trabajos = [(procesos_datos, politica, dict(PARAMETROS, quantum=3)) for politica in ('FCFS', 'RR', 'PE')]
+
+    primeras = Simulador(almacen=str(tmp_path)).ejecutar_lote(trabajos, max_workers=1)
+    simulador = Simulador(almacen=str(tmp_path))
+    segundas = simulador.ejecutar_lote(trabajos + [(procesos_datos, 'SPN', PARAMETROS)], max_workers=1)
+
+    assert [corrida['desde_cache'] for corrida in segundas] == [True, True, True, False]
+    for primera, segunda in zip(primeras, segundas):
+        assert segunda['resultados']['metricas'] == primera['resultados']['metricas']
+    assert simulador.almacen.estadisticas()['aciertos'] == 3
+    assert len(simulador.almacen) == 4
+
+
+def test_ejecutar_politica_guarda_en_el_almacen(tmp_path):
+    simulador = Simulador(almacen=str(tmp_path))
+    simulador.ejecutar_politica('SRTN', cargar_caso('tanda_5p')['procesos'], **PARAMETROS)
+
+    assert len(AlmacenResultados(str(tmp_path))) == 1
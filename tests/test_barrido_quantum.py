@@ -0,0 +1,67 @@
+"""
+Pruebas del barrido de quantum (y de TCP) de Round Robin.
+"""
+
+import pytest
+
+from src.simulador.simulador import Simulador
+
+from utilidades import cargar_caso
+
+QUANTUMS = [1, 2, 5]
+TCPS = [0, 1, 3]
+METRICAS = ('tiempo_medio_retorno', 'tiempo_medio_retorno_normalizado', 'porcentaje_cpu_so', 'cambios_contexto')
+
+
+@pytest.mark.parametrize('max_workers', (1, 2))
+def test_cada_celda_es_una_corrida_de_round_robin(max_workers):
+    procesos_datos = cargar_caso('tanda_5p')['procesos']
+
+    matriz = Simulador(cache=False).barrido_quantum(procesos_datos, 1, None, 1, QUANTUMS, valores_tcp=TCPS,
+                                                    max_workers=max_workers)
+
+    # Una fila por TCP y una columna por quantum, en el orden dado
+    assert matriz['quantums'] == QUANTUMS
+    assert matriz['tcps'] == TCPS
+    assert matriz['errores'] == []
+    for metrica in METRICAS + ('truncado',):
+        assert len(matriz[metrica]) == len(TCPS)
+        assert all(len(fila) == len(QUANTUMS) for fila in matriz[metrica])
+
+    for fila, tcp in enumerate(TCPS):
+        for columna, quantum in enumerate(QUANTUMS):
+            esperado = Simulador(cache=False).ejecutar_rr(procesos_datos, 1, tcp, 1, quantum)
+            for metrica in METRICAS:
+                assert matriz[metrica][fila][columna] == esperado['metricas'][metrica], (metrica, tcp, quantum)
+            assert matriz['truncado'][fila][columna] is False
+
+
+def test_cambios_de_contexto_en_todas_las_celdas():
+    matriz = Simulador(cache=False).barrido_quantum(cargar_caso('tanda_5p')['procesos'], 1, None, 1,
+                                                    QUANTUMS, valores_tcp=TCPS, max_workers=1)
+
+    for fila in matriz['cambios_contexto']:
+        assert all(isinstance(cambios, int) and cambios > 0 for cambios in fila)
+    # Con quantum más chico hay más expropiaciones y más cambios de contexto
+    assert matriz['cambios_contexto'][0][0] > matriz['cambios_contexto'][0][-1]
+
+
+def test_sin_valores_de_tcp_usa_el_tcp_dado():
+    procesos_datos = cargar_caso('cpu_ociosa')['procesos']
+
+    matriz = Simulador(cache=False).barrido_quantum(procesos_datos, 0, 2, 0, range(1, 4), max_workers=1)
+
+    assert matriz['tcps'] == [2]
+    assert matriz['quantums'] == [1, 2, 3]
+    esperado = Simulador(cache=False).ejecutar_rr(procesos_datos, 0, 2, 0, 3)
+    assert matriz['tiempo_medio_retorno'][0][2] == esperado['metricas']['tiempo_medio_retorno']
+
+
+def test_corridas_con_error_quedan_vacias():
+    # Sin quantum Round Robin falla
+    matriz = Simulador(cache=False).barrido_quantum(cargar_caso('tanda_5p')['procesos'], 1, 1, 1, [None, 3],
+                                                    max_workers=1)
+
+    assert [(error['tcp'], error['quantum']) for error in matriz['errores']] == [(1, None)]
+    assert matriz['tiempo_medio_retorno'][0][0] is None
+    assert matriz['cambios_contexto'][0][1] is not None
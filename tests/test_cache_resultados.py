@@ -0,0 +1,218 @@
+"""
+Pruebas del cache en memoria de resultados y de su uso desde el Simulador.
+"""
+
+import copy
+
+from src.simulador.algoritmos.registro_eventos import DescartarEventos
+from src.simulador.cache_resultados import CacheResultados, clave_simulacion
+from src.simulador.simulador import Simulador
+
+from utilidades import cargar_caso, eventos
+
+PARAMETROS = {'tiempo_tip': 1, 'tiempo_tcp': 1, 'tiempo_tfp': 1, 'quantum': 3}
+
+
+def test_aciertos_y_fallos():
+    cache = CacheResultados()
+
+    assert cache.obtener('a') is None
+    cache.guardar('a', 1, tamano=10)
+    assert cache.obtener('a') == 1
+
+    estadisticas = cache.estadisticas()
+    assert (estadisticas['aciertos'], estadisticas['fallos'], estadisticas['entradas']) == (1, 1, 1)
+    assert estadisticas['tasa_aciertos'] == 0.5
+
+
+def test_desaloja_la_usada_hace_mas_tiempo():
+    cache = CacheResultados(max_entradas=2)
+    cache.guardar('a', 1, tamano=1)
+    cache.guardar('b', 2, tamano=1)
+    cache.obtener('a')
+    cache.guardar('c', 3, tamano=1)
+
+    assert 'a' in cache and 'c' in cache and 'b' not in cache
+    assert cache.desalojos == 1
+
+
+def test_limite_de_bytes():
+    cache = CacheResultados(max_bytes=100)
+
+    assert not cache.guardar('grande', 1, tamano=101)
+    cache.guardar('a', 1, tamano=60)
+    cache.guardar('b', 2, tamano=60)
+
+    assert 'a' not in cache and 'b' in cache
+    assert cache.bytes == 60
+
+
+def test_clave_de_la_simulacion():
+    procesos_datos = cargar_caso('tanda_5p')['procesos']
+    clave = clave_simulacion(procesos_datos, 'FCFS', PARAMETROS)
+
+    # El orden de las claves de cada proceso y el quantum fuera de RR no importan
+    reordenados = [dict(reversed(list(proceso.items()))) for proceso in procesos_datos]
+    assert clave_simulacion(reordenados, 'FCFS', dict(PARAMETROS, quantum=7)) == clave
+    # La política y los parámetros sí
+    assert clave_simulacion(procesos_datos, 'SPN', PARAMETROS) != clave
+    assert clave_simulacion(procesos_datos, 'FCFS', dict(PARAMETROS, tiempo_tcp=2)) != clave
+    assert clave_simulacion(procesos_datos, 'RR', PARAMETROS) != clave_simulacion(
+        procesos_datos, 'RR', dict(PARAMETROS, quantum=7))
+
+
+def test_repetir_la_simulacion_usa_el_cache():
+    procesos_datos = cargar_caso('tanda_5p')['procesos']
+    simulador = Simulador()
+
+    primera = simulador.ejecutar_politica('RR', procesos_datos, **PARAMETROS)
+    algoritmo = simulador.algoritmo_actual
+    simulador.ejecutar_politica('FCFS', procesos_datos, **PARAMETROS)
+    repetida = simulador.ejecutar_politica('Round Robin', procesos_datos, **PARAMETROS)
+
+    assert simulador.cache.estadisticas()['aciertos'] == 1
+    assert simulador.cache.estadisticas()['fallos'] == 2
+    assert repetida == primera
+    # Queda como última simulación, para poder exportarla
+    assert eventos(simulador.algoritmo_actual) == eventos(algoritmo)
+
+
+def test_la_clave_usa_los_datos_normalizados():
+    procesos_datos = cargar_caso('tanda_5p')['procesos']
+    clave = clave_simulacion(procesos_datos, 'FCFS', PARAMETROS)
+
+    como_texto = [{campo: str(valor) for campo, valor in proceso.items()} for proceso in procesos_datos]
+    assert clave_simulacion(como_texto, 'FCFS', PARAMETROS) == clave
+    # Con arribos distintos el orden de la tanda no cambia el resultado
+    assert clave_simulacion(procesos_datos[::-1], 'FCFS', PARAMETROS) == clave
+
+
+def test_el_orden_importa_entre_los_que_llegan_juntos():
+    procesos_datos = cargar_caso('cpu_ociosa')['procesos']
+    clave = clave_simulacion(procesos_datos, 'FCFS', PARAMETROS)
+
+    # Los dos últimos llegan al mismo tiempo: el orden decide el desempate
+    intercambiados = procesos_datos[:2] + procesos_datos[:1:-1]
+    assert clave_simulacion(intercambiados, 'FCFS', PARAMETROS) != clave
+    assert clave_simulacion(procesos_datos[::-1], 'FCFS', PARAMETROS) == clave_simulacion(
+        procesos_datos[1::-1] + procesos_datos[:1:-1], 'FCFS', PARAMETROS)
+
+
+def test_tanda_equivalente_usa_el_cache():
+    procesos_datos = cargar_caso('tanda_5p')['procesos']
+    simulador = Simulador()
+
+    primera = simulador.ejecutar_politica('SRTN', procesos_datos, **PARAMETROS)
+    como_texto = [{campo: str(valor) for campo, valor in proceso.items()} for proceso in procesos_datos[::-1]]
+    repetida = simulador.ejecutar_politica('SRTN', como_texto, **PARAMETROS)
+
+    assert simulador.cache.estadisticas()['aciertos'] == 1
+    assert repetida == primera
+
+
+def test_modificar_el_resultado_no_toca_el_cache():
+    procesos_datos = cargar_caso('tanda_5p')['procesos']
+    simulador = Simulador()
+
+    primera = simulador.ejecutar_politica('RR', procesos_datos, **PARAMETROS)
+    esperada = copy.deepcopy(primera)
+    primera['procesos'][0]['tiempo_retorno'] = -1
+    primera['gantt'].clear()
+
+    repetida = simulador.ejecutar_politica('RR', procesos_datos, **PARAMETROS)
+    assert repetida == esperada
+    repetida['procesos'].clear()
+    assert simulador.ejecutar_politica('RR', procesos_datos, **PARAMETROS) == esperada
+
+
+def test_modificar_el_resultado_del_lote_no_toca_el_cache():
+    procesos_datos = cargar_caso('cpu_ociosa')['procesos']
+    simulador = Simulador()
+
+    primera, repetida = simulador.ejecutar_lote([(procesos_datos, 'PE', PARAMETROS)] * 2, max_workers=1)
+    esperados = copy.deepcopy(primera['resultados'])
+    primera['resultados']['procesos'].clear()
+
+    assert repetida['resultados'] == esperados
+    corrida, = simulador.ejecutar_lote([(procesos_datos, 'PE', PARAMETROS)], max_workers=1)
+    assert corrida['desde_cache']
+    assert corrida['resultados'] == esperados
+
+
+def test_otros_parametros_no_usan_el_cache():
+    procesos_datos = cargar_caso('tanda_5p')['procesos']
+    simulador = Simulador()
+
+    simulador.ejecutar_politica('RR', procesos_datos, **PARAMETROS)
+    simulador.ejecutar_politica('RR', procesos_datos, **dict(PARAMETROS, quantum=4))
+    simulador.ejecutar_politica('RR', procesos_datos, **PARAMETROS, tiempo_maximo=20)
+
+    assert simulador.cache.estadisticas()['aciertos'] == 0
+    assert len(simulador.cache) == 3
+
+
+def test_simulaciones_que_no_se_cachean():
+    procesos_datos = cargar_caso('tanda_5p')['procesos']
+    simulador = Simulador()
+
+    # Un destino de eventos propio tiene que recibir los eventos
+    for _ in range(2):
+        simulador.ejecutar_politica('FCFS', procesos_datos, 1, 1, 1, destino_eventos=DescartarEventos())
+    # Un iterador solo se puede recorrer una vez
+    simulador.ejecutar_politica('FCFS', iter(procesos_datos), 1, 1, 1)
+
+    assert len(simulador.cache) == 0
+    assert simulador.cache.estadisticas()['aciertos'] == 0
+
+
+def test_lote_guarda_en_el_cache_del_simulador():
+    procesos_datos = cargar_caso('cpu_ociosa')['procesos']
+    simulador = Simulador()
+
+    simulador.ejecutar_lote([(procesos_datos, 'SRTN', PARAMETROS)], max_workers=1)
+    corrida, = simulador.ejecutar_lote([(procesos_datos, 'SRTN', PARAMETROS)], max_workers=1)
+
+    assert corrida['desde_cache']
+    assert simulador.cache.estadisticas()['aciertos'] == 1
+
+
+def test_consultar_no_cuenta_ni_reordena():
+    cache = CacheResultados(max_entradas=2)
+    cache.guardar('a', 1, tamano=1)
+    cache.guardar('b', 2, tamano=1)
+
+    assert cache.consultar('a') == 1
+    assert cache.consultar('c') is None
+    cache.guardar('c', 3, tamano=1)
+
+    assert 'a' not in cache
+    assert (cache.aciertos, cache.fallos) == (0, 0)
+
+
+def test_repetir_la_simulacion_reutiliza_el_pdf_exportado(tmp_path):
+    procesos_datos = cargar_caso('tanda_5p')['procesos']
+    simulador = Simulador()
+    simulador.ejecutar_politica('SPN', procesos_datos, **PARAMETROS)
+    assert simulador.ruta_pdf_guardada() is None
+
+    # Como al terminar la exportación en segundo plano de la interfaz
+    ruta_pdf = tmp_path / 'reporte.pdf'
+    ruta_pdf.write_bytes(b'%PDF')
+    simulador.registrar_pdf(simulador.clave_actual, str(ruta_pdf))
+
+    simulador.ejecutar_politica('FCFS', procesos_datos, **PARAMETROS)
+    assert simulador.ruta_pdf_guardada() is None
+    simulador.ejecutar_politica('SPN', procesos_datos, **PARAMETROS)
+    assert simulador.ruta_pdf_guardada() == str(ruta_pdf)
+
+    # Si se borró el archivo hay que exportarlo de nuevo
+    ruta_pdf.unlink()
+    assert simulador.ruta_pdf_guardada() is None
+
+
+def test_sin_cache_no_hay_pdf_guardado(tmp_path):
+    simulador = Simulador(cache=False)
+    simulador.ejecutar_politica('SPN', cargar_caso('tanda_5p')['procesos'], **PARAMETROS)
+
+    assert simulador.clave_actual is None
+    assert simulador.ruta_pdf_guardada() is None
@@ -0,0 +1,116 @@
+"""
+Pruebas de la interfaz de línea de comandos y sus códigos de salida.
+"""
+
+import csv
+import json
+
+import pytest
+
+from src.simulador.cli import POLITICAS, cargar_tanda, main
+
+from utilidades import TANDA_TRABADA, cargar_caso
+
+
+@pytest.fixture
+def ruta_tanda(tmp_path):
+    ruta = tmp_path / 'tanda.json'
+    ruta.write_text(json.dumps(cargar_caso('tanda_5p')['procesos']), encoding='utf-8')
+    return str(ruta)
+
+
+def test_json_con_todas_las_politicas(ruta_tanda, capsys):
+    assert main([ruta_tanda, '--quantum', '3']) == 0
+
+    salida = json.loads(capsys.readouterr().out)
+    assert [corrida['politica'] for corrida in salida['resultados']] == list(POLITICAS)
+    assert salida['parametros']['procesos'] == 5
+    assert not any(corrida['truncado'] for corrida in salida['resultados'])
+
+
+def test_csv_en_archivo(ruta_tanda, tmp_path):
+    ruta_salida = tmp_path / 'metricas.csv'
+
+    assert main([ruta_tanda, '--politicas', 'FCFS', 'SPN', '--formato', 'csv', '--salida', str(ruta_salida)]) == 0
+
+    with open(ruta_salida, newline='', encoding='utf-8') as archivo:
+        filas = list(csv.DictReader(archivo))
+    assert [fila['politica'] for fila in filas] == ['FCFS', 'SPN']
+
+
+def test_ndjson(tmp_path, capsys):
+    procesos_datos = cargar_caso('cpu_ociosa')['procesos']
+    ruta = tmp_path / 'tanda.ndjson'
+    ruta.write_text(''.join(json.dumps(proceso) + '\n' for proceso in procesos_datos), encoding='utf-8')
+
+    assert main([str(ruta), '--politicas', 'SRTN']) == 0
+    assert json.loads(capsys.readouterr().out)['parametros']['procesos'] == len(procesos_datos)
+
+
+@pytest.mark.parametrize('contenido', (
+    '{"nombre": "P1"}',
+    '[{"nombre": "P1"}]',
+    '[]',
+    '[1, 2]',
+    '5',
+    'null',
+    'no es JSON',
+    json.dumps(TANDA_TRABADA),
+    json.dumps([dict(TANDA_TRABADA[0], tiempo_arribo=None)]),
+    json.dumps([dict(TANDA_TRABADA[0], duracion_rafaga_cpu='diez')]),
+    json.dumps([dict(TANDA_TRABADA[0], prioridad_externa=[1])]),
+))
+def test_tanda_invalida_sale_con_1(tmp_path, capsys, contenido):
+    ruta = tmp_path / 'tanda.json'
+    ruta.write_text(contenido, encoding='utf-8')
+
+    assert main([str(ruta), '--politicas', 'FCFS']) == 1
+    assert 'Error al leer la tanda' in capsys.readouterr().err
+
+
+def test_archivo_inexistente_sale_con_1(tmp_path, capsys):
+    assert main([str(tmp_path / 'no_existe.json')]) == 1
+    assert 'Error al leer la tanda' in capsys.readouterr().err
+
+
+@pytest.mark.parametrize('argumentos', (
+    ['--politicas', 'RR'],
+    ['--tip', '-1'],
+    ['--quantum', '0'],
+    ['--politicas', 'LIFO'],
+    ['--tiempo-maximo', '0'],
+    ['--tiempo-maximo', '-5'],
+    ['--tiempo-maximo', 'diez'],
+    ['--max-eventos', '0'],
+    ['--max-eventos', '2.5'],
+))
+def test_argumentos_invalidos_salen_con_2(ruta_tanda, argumentos):
+    with pytest.raises(SystemExit) as salida:
+        main([ruta_tanda] + argumentos)
+    assert salida.value.code == 2
+
+
+def test_errores_inesperados_no_se_ocultan(tmp_path, monkeypatch):
+    # Solo los errores de formato se convierten en ValueError
+    def leer_tanda_rota(ruta):
+        raise TypeError("error del programa")
+
+    monkeypatch.setattr('src.simulador.cli.leer_tanda', leer_tanda_rota)
+    with pytest.raises(TypeError, match="error del programa"):
+        cargar_tanda(str(tmp_path / 'tanda.json'))
+
+
+def test_valores_como_texto_se_normalizan(tmp_path):
+    ruta = tmp_path / 'tanda.json'
+    ruta.write_text(json.dumps([{campo: str(valor) for campo, valor in TANDA_TRABADA[0].items()}]),
+                    encoding='utf-8')
+
+    assert cargar_tanda(str(ruta)) == [TANDA_TRABADA[0]]
+
+
+def test_limites_positivos(ruta_tanda, capsys):
+    assert main([ruta_tanda, '--politicas', 'FCFS', '--tiempo-maximo', '5', '--max-eventos', '100']) == 0
+
+    salida = json.loads(capsys.readouterr().out)
+    assert (salida['parametros']['tiempo_maximo'], salida['parametros']['max_eventos']) == (5, 100)
+    assert salida['resultados'][0]['truncado']
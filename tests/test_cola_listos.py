@@ -0,0 +1,66 @@
+"""
+Pruebas de las colas de listos.
+"""
+
+import pytest
+
+from src.simulador.algoritmos import ColaFIFO, ColaListos, ColaPrioridad
+from src.simulador.proceso import Proceso
+
+
+def crear_procesos(*duraciones):
+    return [Proceso(f"P{i}", 0, 1, duracion, 0, 1) for i, duracion in enumerate(duraciones, 1)]
+
+
+def test_cola_incompleta_no_se_puede_crear():
+    class ColaIncompleta(ColaListos):
+        def insertar(self, proceso):
+            pass
+
+    with pytest.raises(TypeError):
+        ColaListos()
+    with pytest.raises(TypeError):
+        ColaIncompleta()
+
+
+def test_fifo_respeta_el_orden_de_llegada():
+    cola = ColaFIFO()
+    p1, p2, p3 = crear_procesos(5, 1, 3)
+    for proceso in (p1, p2, p3):
+        cola.insertar(proceso)
+
+    assert cola.primero() is p1
+    assert cola.extraer_primero_que(lambda proceso: proceso.duracion_rafagas_cpu < 4) is p2
+    assert [cola.extraer(), cola.extraer()] == [p1, p3]
+    assert len(cola) == 0
+
+
+@pytest.mark.parametrize('descendente', (False, True))
+def test_prioridad_ordena_por_clave_y_desempata_por_llegada(descendente):
+    cola = ColaPrioridad(lambda proceso: proceso.duracion_rafagas_cpu, descendente=descendente)
+    p1, p2, p3, p4 = crear_procesos(3, 1, 3, 5)
+    for proceso in (p1, p2, p3, p4):
+        cola.insertar(proceso)
+
+    esperado = [p4, p1, p3, p2] if descendente else [p2, p1, p3, p4]
+    assert cola.primero() is esperado[0]
+    assert [cola.extraer() for _ in range(4)] == esperado
+
+
+@pytest.mark.parametrize('crear_cola', (ColaFIFO, lambda: ColaPrioridad(lambda proceso: 0)))
+def test_tiempo_en_listo_por_marcas(crear_cola):
+    cola = crear_cola()
+    p1, p2 = crear_procesos(1, 1)
+    cola.insertar(p1)
+    cola.acumular_espera(3)
+    cola.insertar(p2)
+    cola.acumular_espera(2)
+
+    cola.liquidar_espera()
+    assert (p1.tiempo_en_listo, p2.tiempo_en_listo) == (5, 2)
+
+    # Lo ya liquidado no se vuelve a sumar al extraer
+    cola.acumular_espera(1)
+    cola.extraer()
+    cola.extraer()
+    assert (p1.tiempo_en_listo, p2.tiempo_en_listo) == (6, 3)
@@ -0,0 +1,57 @@
+"""
+Pruebas de la comparación de las cinco políticas.
+"""
+
+import pytest
+
+from src.simulador.algoritmos import SimulacionCancelada
+from src.simulador.simulador import Simulador
+
+from utilidades import cargar_caso
+
+POLITICAS = ['FCFS', 'SPN', 'SRTN', 'RR', 'PE']
+
+
+@pytest.mark.parametrize('max_workers', (1, 2))
+def test_metricas_iguales_a_cada_politica(max_workers):
+    procesos_datos = cargar_caso('tanda_5p')['procesos']
+
+    comparacion = Simulador(cache=False).comparar_politicas(procesos_datos, 1, 1, 1, 3, max_workers=max_workers)
+
+    assert comparacion['politicas'] == POLITICAS
+    assert comparacion['errores'] == {}
+    for politica in POLITICAS:
+        esperado = Simulador(cache=False).ejecutar_politica(politica, procesos_datos, 1, 1, 1, quantum=3)
+        assert comparacion['metricas'][politica] == esperado['metricas']
+        assert comparacion['resultados'][politica]['procesos'] == esperado['procesos']
+
+
+def test_ranking_por_tiempo_medio_de_retorno():
+    comparacion = Simulador(cache=False).comparar_politicas(cargar_caso('tanda_5p')['procesos'], 1, 1, 1, 3,
+                                                            max_workers=1)
+
+    assert sorted(comparacion['ranking']) == sorted(POLITICAS)
+    tiempos = [comparacion['metricas'][politica]['tiempo_medio_retorno'] for politica in comparacion['ranking']]
+    assert tiempos == sorted(tiempos)
+
+
+def test_errores_y_truncadas_van_al_final_del_ranking():
+    # Sin quantum Round Robin falla; con tiempo_maximo las demás quedan truncadas
+    comparacion = Simulador(cache=False).comparar_politicas(cargar_caso('tanda_5p')['procesos'], 1, 1, 1, None,
+                                                            max_workers=1, tiempo_maximo=10)
+
+    assert list(comparacion['errores']) == ['RR']
+    assert 'RR' not in comparacion['metricas']
+    assert comparacion['ranking'][-1] == 'RR'
+    assert all(comparacion['resultados'][politica]['truncado'] for politica in comparacion['ranking'][:-1])
+
+
+@pytest.mark.parametrize('max_workers', (1, 2))
+def test_cancelar_la_comparacion(max_workers):
+    simulador = Simulador()
+
+    with pytest.raises(SimulacionCancelada):
+        simulador.comparar_politicas(cargar_caso('tanda_5p')['procesos'], 1, 1, 1, 3, max_workers=max_workers,
+                                     cancelado=lambda: True)
+    # Nada de la comparación cancelada queda en el cache
+    assert len(simulador.cache) == 0
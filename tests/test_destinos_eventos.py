@@ -0,0 +1,102 @@
+"""
+Pruebas de los destinos de eventos: cada uno tiene que ver los mismos
+eventos que guarda el RegistroEventos por defecto, en el mismo orden.
+"""
+
+import io
+import json
+from collections import Counter
+
+import pytest
+
+from src.simulador.algoritmos.registro_eventos import (
+    DescartarEventos, EventosNDJSON, FuncionEventos, ResumenEventos
+)
+from src.simulador.simulador import Simulador
+
+from utilidades import POLITICAS, cargar_caso, crear_algoritmo_caso
+
+
+def registro_completo(caso, politica):
+    algoritmo = crear_algoritmo_caso(caso, politica)
+    algoritmo.ejecutar()
+    return list(algoritmo.resultados)
+
+
+def ejecutar_con(caso, politica, destino):
+    algoritmo = crear_algoritmo_caso(caso, politica, destino_eventos=destino)
+    algoritmo.ejecutar()
+    return algoritmo
+
+
+@pytest.mark.parametrize('politica', POLITICAS)
+def test_ndjson_tiene_los_mismos_eventos(politica, tmp_path):
+    caso = cargar_caso('tanda_5p')
+    ruta = tmp_path / 'eventos.ndjson'
+
+    with EventosNDJSON(str(ruta)) as destino:
+        ejecutar_con(caso, politica, destino)
+
+    with open(ruta, encoding='utf-8') as archivo:
+        leidos = [json.loads(linea) for linea in archivo]
+    assert leidos == registro_completo(caso, politica)
+    assert len(destino) == len(leidos)
+
+
+def test_ndjson_en_un_archivo_abierto_no_lo_cierra():
+    caso = cargar_caso('cpu_ociosa')
+    archivo = io.StringIO()
+
+    with EventosNDJSON(archivo) as destino:
+        ejecutar_con(caso, 'RR', destino)
+
+    assert not archivo.closed
+    leidos = [json.loads(linea) for linea in archivo.getvalue().splitlines()]
+    assert leidos == registro_completo(caso, 'RR')
+
+
+@pytest.mark.parametrize('politica', POLITICAS)
+def test_resumen_coincide_con_el_registro(politica):
+    caso = cargar_caso('tanda_5p')
+    completos = registro_completo(caso, politica)
+
+    destino = ResumenEventos()
+    ejecutar_con(caso, politica, destino)
+
+    assert destino.resumen() == {
+        'cantidad_eventos': len(completos),
+        'por_evento': dict(Counter(evento['evento'] for evento in completos)),
+        'por_proceso': dict(Counter(evento['proceso'] for evento in completos)),
+        'tiempo_inicial': completos[0]['tiempo'],
+        'tiempo_final': completos[-1]['tiempo']
+    }
+
+
+@pytest.mark.parametrize('politica', POLITICAS)
+def test_funcion_recibe_todos_los_eventos_en_orden(politica):
+    caso = cargar_caso('tanda_5p')
+    recibidos = []
+
+    # Una función se envuelve en un FuncionEventos
+    algoritmo = ejecutar_con(caso, politica, recibidos.append)
+
+    assert isinstance(algoritmo.resultados, FuncionEventos)
+    assert recibidos == registro_completo(caso, politica)
+    assert len(algoritmo.resultados) == len(recibidos)
+
+
+@pytest.mark.parametrize('politica', POLITICAS)
+def test_descartar_solo_cambia_la_lista_de_eventos(politica):
+    procesos_datos = cargar_caso('tanda_5p')['procesos']
+    simulador = Simulador(cache=False)
+
+    completos = simulador.ejecutar_politica(politica, procesos_datos, 1, 1, 1, quantum=3)
+    destino = DescartarEventos()
+    descartados = simulador.ejecutar_politica(politica, procesos_datos, 1, 1, 1, quantum=3,
+                                              destino_eventos=destino)
+
+    assert list(descartados['eventos']) == []
+    assert len(destino) == len(completos['eventos'])
+    completos.pop('eventos')
+    descartados.pop('eventos')
+    assert descartados == completos
@@ -0,0 +1,133 @@
+"""
+Pruebas de la ejecución de lotes de simulaciones.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from src.simulador import simulador as simulador_modulo
+from src.simulador.algoritmos import SimulacionCancelada
+from src.simulador.simulador import Simulador
+
+from utilidades import cargar_caso
+
+
+def trabajos_de_prueba():
+    tanda = cargar_caso('tanda_5p')['procesos']
+    ociosa = cargar_caso('cpu_ociosa')['procesos']
+    parametros = {'tiempo_tip': 1, 'tiempo_tcp': 1, 'tiempo_tfp': 1}
+    return [
+        (tanda, 'FCFS', parametros),
+        (ociosa, 'RR', dict(parametros, quantum=2)),
+        {'procesos': tanda, 'politica': 'SRTN', 'parametros': parametros},
+        (ociosa, 'PE', dict(parametros, tiempo_maximo=15)),
+        (tanda, 'SPN', parametros),
+    ]
+
+
+def comparables(corrida):
+    resultados = corrida['resultados']
+    return (corrida['politica'], corrida['error'], resultados['metricas'], resultados['procesos'],
+            resultados['truncado'])
+
+
+@pytest.mark.parametrize('max_workers', (1, 2))
+def test_resultados_en_el_orden_de_los_trabajos(max_workers):
+    trabajos = trabajos_de_prueba()
+
+    corridas = Simulador(cache=False).ejecutar_lote(trabajos, max_workers=max_workers)
+
+    assert [corrida['politica'] for corrida in corridas] == ['FCFS', 'RR', 'SRTN', 'PE', 'SPN']
+    for trabajo, corrida in zip(trabajos, corridas):
+        procesos_datos, politica, parametros = (trabajo if isinstance(trabajo, tuple) else
+                                                (trabajo['procesos'], trabajo['politica'], trabajo['parametros']))
+        esperado = Simulador(cache=False).ejecutar_politica(politica, procesos_datos, **parametros)
+        assert corrida['error'] is None
+        assert not corrida['desde_cache']
+        assert corrida['parametros'] == parametros
+        assert corrida['resultados']['metricas'] == esperado['metricas']
+        assert corrida['resultados']['procesos'] == esperado['procesos']
+        assert corrida['resultados']['truncado'] == esperado['truncado']
+    assert corridas[3]['resultados']['truncado']
+
+
+def test_pool_igual_que_en_el_mismo_proceso():
+    en_proceso = Simulador(cache=False).ejecutar_lote(trabajos_de_prueba(), max_workers=1)
+    en_pool = Simulador(cache=False).ejecutar_lote(trabajos_de_prueba(), max_workers=2)
+
+    assert [comparables(corrida) for corrida in en_pool] == [comparables(corrida) for corrida in en_proceso]
+
+
+@pytest.mark.parametrize('incluir_eventos', (True, False))
+def test_incluir_eventos(incluir_eventos):
+    caso = cargar_caso('tanda_5p')
+
+    corrida, = Simulador(cache=False).ejecutar_lote(
+        [(caso['procesos'], 'FCFS', {'tiempo_tip': 1, 'tiempo_tcp': 1, 'tiempo_tfp': 1})],
+        max_workers=1, incluir_eventos=incluir_eventos)
+
+    if incluir_eventos:
+        assert len(corrida['resultados']['eventos']) == len(caso['resultados']['FCFS']['eventos'])
+    else:
+        assert corrida['resultados']['eventos'] == []
+
+
+def test_un_trabajo_con_error_no_corta_el_lote():
+    trabajos = trabajos_de_prueba()
+    trabajos[1] = (trabajos[1][0], 'RR', {'tiempo_tip': 1, 'tiempo_tcp': 1, 'tiempo_tfp': 1})
+    trabajos.append((trabajos[0][0], 'LIFO', {'tiempo_tip': 1, 'tiempo_tcp': 1, 'tiempo_tfp': 1}))
+
+    corridas = Simulador(cache=False).ejecutar_lote(trabajos, max_workers=1)
+
+    assert corridas[1]['resultados'] is None
+    assert corridas[1]['error'] == 'ValueError: Round Robin requiere un quantum'
+    assert corridas[-1]['error'] == 'ValueError: Política desconocida: LIFO'
+    assert all(corrida['error'] is None for corrida in corridas[2:-1])
+
+
+def test_trabajos_repetidos_se_simulan_una_vez():
+    trabajos = trabajos_de_prueba()
+    trabajos.append(trabajos[0])
+
+    corridas = Simulador().ejecutar_lote(trabajos, max_workers=1)
+
+    assert not corridas[0]['desde_cache']
+    assert corridas[-1]['desde_cache']
+    assert comparables(corridas[-1]) == comparables(corridas[0])
+
+
+class PoolRegistrado(ProcessPoolExecutor):
+    """ProcessPoolExecutor que registra cuántos pools se crearon."""
+
+    creados = 0
+
+    def __init__(self, *args, **kwargs):
+        PoolRegistrado.creados += 1
+        super().__init__(*args, **kwargs)
+
+
+def test_con_cancelado_se_usa_el_pool(monkeypatch):
+    monkeypatch.setattr(simulador_modulo, 'ProcessPoolExecutor', PoolRegistrado)
+    PoolRegistrado.creados = 0
+    consultas = []
+
+    def cancelado():
+        consultas.append(None)
+        return False
+
+    corridas = Simulador(cache=False).ejecutar_lote(trabajos_de_prueba(), max_workers=2, cancelado=cancelado)
+
+    assert PoolRegistrado.creados == 1
+    assert consultas
+    assert [comparables(corrida) for corrida in corridas] == [
+        comparables(corrida) for corrida in Simulador(cache=False).ejecutar_lote(trabajos_de_prueba(), max_workers=1)]
+
+
+@pytest.mark.parametrize('max_workers', (1, 2))
+def test_cancelar_el_lote(max_workers):
+    simulador = Simulador()
+
+    with pytest.raises(SimulacionCancelada):
+        simulador.ejecutar_lote(trabajos_de_prueba(), max_workers=max_workers, cancelado=lambda: True)
+    assert len(simulador.cache) == 0
@@ -0,0 +1,77 @@
+"""
+Pruebas de la ejecución por tramos con progreso y cancelación.
+"""
+
+import pytest
+
+from src.simulador.algoritmos import SimulacionCancelada
+from src.simulador.simulador import Simulador
+
+from utilidades import POLITICAS, TANDA_TRABADA, cargar_caso, crear_algoritmo, crear_algoritmo_caso, eventos
+
+
+@pytest.mark.parametrize('politica', POLITICAS)
+def test_por_tramos_igual_que_ejecutar(politica):
+    caso = cargar_caso('tanda_5p')
+    algoritmo = crear_algoritmo_caso(caso, politica)
+    informes = []
+
+    algoritmo.ejecutar_por_tramos(progreso=lambda *informe: informes.append(informe))
+
+    assert not algoritmo.truncado
+    assert eventos(algoritmo) == caso['resultados'][politica]['eventos']
+    assert algoritmo.obtener_estadisticas_cpu() == caso['resultados'][politica]['estadisticas_cpu']
+    # El progreso avanza y el último informe es el final de la simulación
+    assert [informe[0] for informe in informes] == sorted(informe[0] for informe in informes)
+    assert informes[-1] == (algoritmo.tiempo_actual, len(algoritmo.resultados), len(algoritmo.procesos))
+
+
+@pytest.mark.parametrize('politica', POLITICAS)
+def test_por_tramos_termina_con_la_simulacion_trabada(politica):
+    completo = crear_algoritmo(politica, TANDA_TRABADA, 0, 0, 0)
+    completo.ejecutar()
+
+    algoritmo = crear_algoritmo(politica, TANDA_TRABADA, 0, 0, 0)
+    algoritmo.ejecutar_por_tramos(cancelado=lambda: False)
+
+    assert algoritmo.truncado
+    assert algoritmo.tiempo_actual == completo.tiempo_actual
+    assert eventos(algoritmo) == eventos(completo)
+
+
+def test_cancelar_detiene_la_simulacion():
+    algoritmo = crear_algoritmo_caso(cargar_caso('tanda_5p'), 'RR')
+    consultas = []
+
+    def cancelado():
+        consultas.append(algoritmo.tiempo_actual)
+        return len(consultas) > 2
+
+    with pytest.raises(SimulacionCancelada):
+        algoritmo.ejecutar_por_tramos(cancelado=cancelado)
+    assert algoritmo.hay_procesos_pendientes()
+
+
+def test_simulador_cancelado_no_deja_la_simulacion_a_medias():
+    procesos_datos = cargar_caso('tanda_5p')['procesos']
+    simulador = Simulador(cache=False)
+    simulador.ejecutar_politica('FCFS', procesos_datos, 1, 1, 1)
+
+    with pytest.raises(SimulacionCancelada):
+        simulador.ejecutar_politica('SRTN', procesos_datos, 1, 1, 1, cancelado=lambda: True)
+
+    assert simulador.algoritmo_actual is None
+    assert simulador.procesos is None
+
+
+def test_simulador_con_progreso_igual_que_sin_progreso():
+    procesos_datos = cargar_caso('tanda_5p')['procesos']
+    informes = []
+
+    con_progreso = Simulador(cache=False).ejecutar_politica(
+        'PE', procesos_datos, 1, 1, 1, progreso=lambda *informe: informes.append(informe))
+    sin_progreso = Simulador(cache=False).ejecutar_politica('PE', procesos_datos, 1, 1, 1)
+
+    assert informes
+    assert con_progreso['eventos'] == sin_progreso['eventos']
+    assert con_progreso['procesos'] == sin_progreso['procesos']
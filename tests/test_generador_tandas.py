@@ -0,0 +1,67 @@
+"""
+Pruebas del generador de tandas sintéticas.
+"""
+
+import pytest
+
+from src.simulador.generador_tandas import escribir_tanda, generar_procesos, generar_tanda, leer_tanda
+from src.simulador.proceso import validar_datos_proceso
+
+DISTRIBUCIONES = (
+    {},
+    {'llegadas': 'rafagas', 'duracion_cpu': 'lognormal', 'prioridades': {1: 3, 5: 1}},
+    {'llegadas': 'uniforme', 'duracion_cpu': 'uniforme', 'rafagas_cpu': (2, 4), 'prefijo': 'T'},
+)
+
+
+@pytest.mark.parametrize('distribuciones', DISTRIBUCIONES)
+def test_misma_semilla_misma_tanda(distribuciones):
+    assert list(generar_tanda(200, semilla=3, **distribuciones)) == list(generar_tanda(200, 3, **distribuciones))
+    assert list(generar_tanda(200, semilla=3, **distribuciones)) != list(generar_tanda(200, 4, **distribuciones))
+
+
+@pytest.mark.parametrize('distribuciones', DISTRIBUCIONES)
+def test_procesos_iguales_a_la_tanda(distribuciones):
+    tanda = list(generar_tanda(200, semilla=5, **distribuciones))
+    procesos = generar_procesos(200, semilla=5, **distribuciones)
+
+    assert [(p.nombre, p.tiempo_arrivo, p.cantidad_rafagas_cpu, p.duracion_rafagas_cpu,
+             p.duracion_rafagas_io, p.prioridad) for p in procesos] == [tuple(datos.values()) for datos in tanda]
+
+
+@pytest.mark.parametrize('distribuciones', DISTRIBUCIONES)
+def test_tandas_simulables(distribuciones):
+    # Ninguna ráfaga de E/S es 0, así que ningún proceso queda bloqueado para siempre
+    for numero, datos in enumerate(generar_tanda(500, semilla=1, **distribuciones), 1):
+        validar_datos_proceso(datos, numero)
+        assert datos['duracion_rafaga_es'] >= 1
+
+
+def test_argumento_desconocido():
+    with pytest.raises(TypeError):
+        generar_procesos(10, semilla=1, media=4)
+    with pytest.raises(ValueError):
+        generar_procesos(10, semilla=1, llegadas='normal')
+
+
+@pytest.mark.parametrize('rafagas_cpu', ((0, 3), (-1, 2), (4, 2)))
+def test_rango_de_rafagas_invalido(rafagas_cpu):
+    # Un proceso sin ráfagas de CPU no pasa validar_datos_proceso
+    with pytest.raises(ValueError):
+        generar_procesos(10, semilla=1, rafagas_cpu=rafagas_cpu)
+
+
+def test_rango_de_rafagas_de_un_valor():
+    tanda = list(generar_tanda(100, semilla=1, rafagas_cpu=(1, 1)))
+
+    assert {datos['cantidad_rafagas_cpu'] for datos in tanda} == {1}
+    for numero, datos in enumerate(tanda, 1):
+        validar_datos_proceso(datos, numero)
+
+
+@pytest.mark.parametrize('extension', ('json', 'ndjson'))
+def test_escribir_y_leer(tmp_path, extension):
+    ruta = str(tmp_path / f'tanda.{extension}')
+
+    assert escribir_tanda(ruta, generar_tanda(50, semilla=2)) == 50
+    assert list(leer_tanda(ruta)) == list(generar_tanda(50, semilla=2))
@@ -0,0 +1,104 @@
+"""
+Pruebas de la instrumentación del bucle: contadores por fase, cuenta de
+eventos por tipo con distintos destinos y que no cambia la simulación.
+"""
+
+from collections import Counter
+
+import pytest
+
+from src.simulador.algoritmos.instrumentacion import EventosContados, formatear_instrumentacion
+from src.simulador.algoritmos.registro_eventos import RegistroEventos, ResumenEventos
+
+from utilidades import POLITICAS, cargar_caso, crear_algoritmo_caso, eventos
+
+
+class SumideroConSlots:
+    """Destino que no acepta atributos nuevos: solo cuenta los eventos."""
+
+    __slots__ = ('cantidad',)
+
+    def __init__(self):
+        self.cantidad = 0
+
+    def append(self, evento):
+        self.cantidad += 1
+
+
+def tipos_esperados(caso, politica):
+    return dict(Counter(evento[2] for evento in caso['resultados'][politica]['eventos']))
+
+
+@pytest.mark.parametrize('politica', POLITICAS)
+def test_contadores_por_fase(politica):
+    caso = cargar_caso('tanda_5p')
+    algoritmo = crear_algoritmo_caso(caso, politica)
+    resumen = algoritmo.instrumentar().resumen()
+    assert all(datos['llamadas'] == 0 for datos in resumen['fases'].values())
+
+    algoritmo.ejecutar()
+    resumen = algoritmo.instrumentacion.resumen()
+
+    fases = resumen['fases']
+    assert {'bucle', 'control', 'llegadas', 'ejecucion', 'tiempo_listo'} <= set(fases)
+    assert fases['bucle']['llamadas'] > 0
+    # Cada proceso llega una vez, pero las llegadas se revisan en cada tick
+    assert fases['llegadas']['llamadas'] >= len(caso['procesos'])
+    assert resumen['tiempo_total'] == pytest.approx(sum(datos['tiempo'] for datos in fases.values()))
+    assert sum(datos['porcentaje'] for datos in fases.values()) == pytest.approx(100)
+    assert 'llegadas' in formatear_instrumentacion(resumen)
+
+
+@pytest.mark.parametrize('destino', (list, RegistroEventos, ResumenEventos, SumideroConSlots),
+                         ids=('lista', 'registro', 'resumen', 'slots'))
+@pytest.mark.parametrize('politica', POLITICAS)
+def test_cuenta_los_eventos_con_cualquier_destino(politica, destino):
+    caso = cargar_caso('tanda_5p')
+    algoritmo = crear_algoritmo_caso(caso, politica, destino_eventos=destino())
+    algoritmo.instrumentar()
+    algoritmo.ejecutar()
+
+    assert algoritmo.instrumentacion.resumen()['eventos'] == tipos_esperados(caso, politica)
+
+
+@pytest.mark.parametrize('politica', POLITICAS)
+def test_no_cambia_la_simulacion(politica):
+    caso = cargar_caso('cpu_ociosa')
+    algoritmo = crear_algoritmo_caso(caso, politica)
+    algoritmo.instrumentar()
+    algoritmo.ejecutar()
+
+    assert eventos(algoritmo) == caso['resultados'][politica]['eventos']
+    assert algoritmo.obtener_estadisticas_cpu() == caso['resultados'][politica]['estadisticas_cpu']
+
+
+def test_desinstalar_vuelve_al_destino_original():
+    caso = cargar_caso('tanda_5p')
+    destino = []
+    algoritmo = crear_algoritmo_caso(caso, 'RR', destino_eventos=destino)
+    instrumentacion = algoritmo.instrumentar()
+    assert isinstance(algoritmo.resultados, EventosContados)
+
+    algoritmo.ejecutar_hasta(10)
+    instrumentacion.desinstalar()
+
+    assert algoritmo.resultados is destino
+    assert 'avanzar' not in vars(algoritmo)
+    cantidad = sum(instrumentacion.eventos.values())
+    assert cantidad == len(destino)
+    # Desinstalada deja de contar
+    algoritmo.ejecutar()
+    assert sum(instrumentacion.eventos.values()) == cantidad
+
+
+def test_sigue_contando_despues_de_un_snapshot():
+    caso = cargar_caso('tanda_5p')
+    algoritmo = crear_algoritmo_caso(caso, 'SRTN')
+    algoritmo.instrumentar()
+    algoritmo.ejecutar_hasta(10)
+    algoritmo.restore(algoritmo.snapshot())
+    algoritmo.ejecutar()
+
+    assert isinstance(algoritmo.resultados, EventosContados)
+    assert isinstance(algoritmo.resultados.destino, RegistroEventos)
+    assert algoritmo.instrumentacion.resumen()['eventos'] == tipos_esperados(caso, 'SRTN')
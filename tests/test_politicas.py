@@ -0,0 +1,109 @@
+"""
+Pruebas de las cinco políticas contra salidas conocidas.
+
+Los archivos de tests/datos tienen, para cada tanda y política, la lista de
+eventos, obtener_estadisticas_cpu() y los tiempos de cada proceso generados
+con el motor original (que avanzaba tick por tick), así que comprueban que el
+avance por eventos produce exactamente los mismos resultados.
+"""
+
+import pytest
+
+from utilidades import POLITICAS, TANDA_TRABADA, cargar_caso, crear_algoritmo, crear_algoritmo_caso, eventos
+
+CASOS = ('tanda_5p', 'sin_demoras_del_so', 'cpu_ociosa')
+
+
+@pytest.mark.parametrize('politica', POLITICAS)
+@pytest.mark.parametrize('nombre_caso', CASOS)
+def test_resultados_iguales_al_motor_original(nombre_caso, politica):
+    caso = cargar_caso(nombre_caso)
+    esperado = caso['resultados'][politica]
+
+    algoritmo = crear_algoritmo_caso(caso, politica)
+    algoritmo.ejecutar()
+
+    assert not algoritmo.truncado
+    assert eventos(algoritmo) == esperado['eventos']
+    assert algoritmo.obtener_estadisticas_cpu() == esperado['estadisticas_cpu']
+    assert {p.nombre: {'tiempo_retorno': p.tiempo_retorno, 'tiempo_en_listo': p.tiempo_en_listo}
+            for p in algoritmo.procesos} == esperado['procesos']
+
+
+@pytest.mark.parametrize('politica', POLITICAS)
+def test_hay_procesos_bloqueados_por_io(politica):
+    # Las tandas de prueba cubren el paso por bloqueado (I/O) en todas las políticas
+    caso = cargar_caso('tanda_5p')
+    tipos = {evento[2] for evento in caso['resultados'][politica]['eventos']}
+    assert {'bloqueo', 'inicio_io', 'fin_io'} <= tipos
+
+
+@pytest.mark.parametrize('politica', POLITICAS)
+@pytest.mark.parametrize('tiempo_maximo', (1, 7, 20, 33))
+def test_tiempo_maximo_corta_la_simulacion(politica, tiempo_maximo):
+    caso = cargar_caso('tanda_5p')
+    completos = caso['resultados'][politica]['eventos']
+
+    algoritmo = crear_algoritmo_caso(caso, politica, tiempo_maximo=tiempo_maximo)
+    algoritmo.ejecutar()
+
+    assert algoritmo.truncado
+    assert algoritmo.tiempo_actual == tiempo_maximo
+    # Lo simulado hasta el corte es el comienzo de la simulación completa
+    registrados = eventos(algoritmo)
+    assert registrados == completos[:len(registrados)]
+
+
+@pytest.mark.parametrize('politica', POLITICAS)
+@pytest.mark.parametrize('max_eventos', (1, 5, 17))
+def test_max_eventos_corta_la_simulacion(politica, max_eventos):
+    caso = cargar_caso('cpu_ociosa')
+    completos = caso['resultados'][politica]['eventos']
+
+    algoritmo = crear_algoritmo_caso(caso, politica, max_eventos=max_eventos)
+    algoritmo.ejecutar()
+
+    assert algoritmo.truncado
+    registrados = eventos(algoritmo)
+    assert len(registrados) >= max_eventos
+    assert registrados == completos[:len(registrados)]
+
+
+@pytest.mark.parametrize('politica', POLITICAS)
+def test_horizonte_mayor_que_la_simulacion_no_la_trunca(politica):
+    caso = cargar_caso('tanda_5p')
+    algoritmo = crear_algoritmo_caso(caso, politica, tiempo_maximo=10000, max_eventos=10000)
+    algoritmo.ejecutar()
+
+    assert not algoritmo.truncado
+    assert eventos(algoritmo) == caso['resultados'][politica]['eventos']
+
+
+@pytest.mark.parametrize('politica', POLITICAS)
+def test_simulacion_trabada_se_trunca(politica):
+    algoritmo = crear_algoritmo(politica, TANDA_TRABADA, 0, 0, 0)
+    algoritmo.ejecutar()
+
+    assert algoritmo.truncado
+    assert algoritmo.hay_procesos_pendientes()
+
+
+def test_simulacion_trabada_se_trunca_al_trabarse():
+    algoritmo = crear_algoritmo('FCFS', TANDA_TRABADA, 0, 0, 0)
+    algoritmo.ejecutar()
+
+    assert algoritmo.tiempo_actual == 13
+
+
+@pytest.mark.parametrize('politica', POLITICAS)
+def test_contadores_por_proceso_indexados_por_pid(politica):
+    caso = cargar_caso('cpu_ociosa')
+    algoritmo = crear_algoritmo_caso(caso, politica, tiempo_maximo=17)
+    algoritmo.ejecutar()
+
+    assert [proceso.pid for proceso in algoritmo.procesos] == list(range(len(algoritmo.procesos)))
+    # Los que no llegaron o no terminaron no tienen valor
+    assert algoritmo.t_arribo_por_proceso == [0, 15, 16, 16]
+    assert algoritmo.t_fin_por_proceso[1:] == [None, None, None]
+    assert algoritmo.obtener_estadisticas_cpu()['t_arribo_por_proceso'] == {
+        proceso.nombre: arribo for proceso, arribo in zip(algoritmo.procesos, [0, 15, 16, 16])}
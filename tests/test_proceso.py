@@ -0,0 +1,41 @@
+"""
+Pruebas de la validación de los datos de un proceso al cargarlos.
+"""
+
+import pytest
+
+from src.simulador.proceso import validar_datos_proceso
+
+from utilidades import cargar_caso
+
+
+def proceso(**cambios):
+    datos = {'nombre': 'P1', 'tiempo_arribo': 0, 'cantidad_rafagas_cpu': 2, 'duracion_rafaga_cpu': 3,
+             'duracion_rafaga_es': 2, 'prioridad_externa': 1}
+    datos.update(cambios)
+    return datos
+
+
+@pytest.mark.parametrize('caso', ('tanda_5p', 'sin_demoras_del_so', 'cpu_ociosa'))
+def test_tandas_de_prueba_son_validas(caso):
+    for numero, proceso_datos in enumerate(cargar_caso(caso)['procesos'], 1):
+        validar_datos_proceso(proceso_datos, numero)
+
+
+def test_io_cero_con_una_sola_rafaga_es_valido():
+    # El I/O solo ocurre entre ráfagas: con una sola nunca se usa
+    validar_datos_proceso(proceso(cantidad_rafagas_cpu=1, duracion_rafaga_es=0), 1)
+
+
+@pytest.mark.parametrize('cambios', (
+    {'tiempo_arribo': -1},
+    {'cantidad_rafagas_cpu': 0},
+    {'duracion_rafaga_cpu': 0},
+    {'duracion_rafaga_cpu': -3},
+    {'duracion_rafaga_es': -1},
+    {'duracion_rafaga_es': -1, 'cantidad_rafagas_cpu': 1},
+    {'duracion_rafaga_es': 0},
+))
+def test_rechaza_tiempos_invalidos(cambios):
+    with pytest.raises(ValueError, match='proceso 4'):
+        validar_datos_proceso(proceso(**cambios), 4)
@@ -0,0 +1,79 @@
+"""
+Pruebas de la re-simulación incremental al editar un proceso.
+"""
+
+import pytest
+
+from src.simulador.simulador import Simulador
+
+from utilidades import cargar_caso
+
+
+def simular_completo(procesos_datos, politica, quantum=3):
+    return Simulador(cache=False).ejecutar_politica(politica, procesos_datos, 1, 1, 1, quantum=quantum)
+
+
+def comparables(resultados):
+    return (resultados['eventos'], resultados['procesos'], resultados['tiempo_total'], resultados['truncado'])
+
+
+@pytest.mark.parametrize('politica', ('FCFS', 'SPN', 'SRTN', 'RR', 'PE'))
+def test_ejecucion_inicial_igual_a_la_completa(politica):
+    procesos_datos = cargar_caso('tanda_5p')['procesos']
+    simulador = Simulador(cache=False)
+
+    resultados = simulador.ejecutar_incremental(politica, procesos_datos, 1, 1, 1, quantum=3,
+                                                intervalo_checkpoint=4)
+
+    assert comparables(resultados) == comparables(simular_completo(procesos_datos, politica))
+
+
+@pytest.mark.parametrize('politica', ('FCFS', 'SPN', 'SRTN', 'RR', 'PE'))
+def test_editar_proceso_igual_a_simular_de_nuevo(politica):
+    procesos_datos = cargar_caso('tanda_5p')['procesos']
+    simulador = Simulador(cache=False)
+    simulador.ejecutar_incremental(politica, procesos_datos, 1, 1, 1, quantum=3, intervalo_checkpoint=4)
+
+    # P5 llega en t=10: lo anterior se reutiliza
+    editado = dict(procesos_datos[4], tiempo_arribo=12, duracion_rafaga_cpu=4)
+    resultados = simulador.editar_proceso(4, editado)
+
+    nueva_tanda = procesos_datos[:4] + [editado]
+    assert comparables(resultados) == comparables(simular_completo(nueva_tanda, politica))
+    assert 0 < resultados['incremental']['tiempo_reanudacion'] <= 10
+    assert resultados['incremental']['eventos_reutilizados'] > 0
+
+
+def test_ediciones_sucesivas():
+    procesos_datos = cargar_caso('tanda_5p')['procesos']
+    simulador = Simulador(cache=False)
+    simulador.ejecutar_incremental('RR', procesos_datos, 1, 1, 1, quantum=3, intervalo_checkpoint=2)
+
+    tanda = list(procesos_datos)
+    for indice, cambios in ((3, {'tiempo_arribo': 8}), (1, {'cantidad_rafagas_cpu': 1}), (3, {'tiempo_arribo': 2})):
+        tanda[indice] = dict(tanda[indice], **cambios)
+        resultados = simulador.editar_proceso(indice, tanda[indice])
+        assert comparables(resultados) == comparables(simular_completo(tanda, 'RR'))
+
+
+def test_edicion_que_traba_la_simulacion_la_trunca():
+    procesos_datos = cargar_caso('tanda_5p')['procesos']
+    simulador = Simulador(cache=False)
+    simulador.ejecutar_incremental('FCFS', procesos_datos, 1, 1, 1, intervalo_checkpoint=4)
+
+    # Con I/O de duración 0 y más de una ráfaga, P4 no sale nunca del bloqueo
+    editado = dict(procesos_datos[3], duracion_rafaga_es=0)
+    resultados = simulador.editar_proceso(3, editado)
+
+    assert resultados['truncado'] is True
+    nueva_tanda = procesos_datos[:3] + [editado] + procesos_datos[4:]
+    assert comparables(resultados) == comparables(simular_completo(nueva_tanda, 'FCFS'))
+
+
+def test_ejecucion_inicial_trabada_se_trunca():
+    procesos_datos = [dict(proceso, duracion_rafaga_es=0) for proceso in cargar_caso('tanda_5p')['procesos']]
+    simulador = Simulador(cache=False)
+
+    resultados = simulador.ejecutar_incremental('SRTN', procesos_datos, 1, 1, 1, intervalo_checkpoint=4)
+
+    assert resultados['truncado'] is True
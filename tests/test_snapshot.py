@@ -0,0 +1,106 @@
+"""
+Pruebas de la ejecución por partes (ejecutar_hasta) y de snapshot/restore.
+"""
+
+import pytest
+
+from src.simulador.algoritmos import Planificador, RegistroEventos
+
+from utilidades import POLITICAS, TANDA_TRABADA, cargar_caso, crear_algoritmo, crear_algoritmo_caso, eventos
+
+
+def estado_final(algoritmo):
+    return (eventos(algoritmo), algoritmo.obtener_estadisticas_cpu(), algoritmo.truncado,
+            [(p.nombre, p.tiempo_retorno, p.tiempo_en_listo) for p in algoritmo.procesos])
+
+
+@pytest.mark.parametrize('politica', POLITICAS)
+def test_ejecutar_hasta_por_partes_igual_que_ejecutar(politica):
+    caso = cargar_caso('tanda_5p')
+    completo = crear_algoritmo_caso(caso, politica)
+    completo.ejecutar()
+
+    algoritmo = crear_algoritmo_caso(caso, politica)
+    tiempo = 0
+    while algoritmo.ejecutar_hasta(tiempo):
+        assert algoritmo.tiempo_actual == tiempo
+        tiempo += 7
+
+    assert estado_final(algoritmo) == estado_final(completo)
+
+
+@pytest.mark.parametrize('politica', POLITICAS)
+@pytest.mark.parametrize('incluir_eventos', (True, False))
+def test_restore_vuelve_al_estado_del_snapshot(politica, incluir_eventos):
+    caso = cargar_caso('tanda_5p')
+    completo = crear_algoritmo_caso(caso, politica)
+    completo.ejecutar()
+
+    algoritmo = crear_algoritmo_caso(caso, politica)
+    algoritmo.ejecutar_hasta(25)
+    instantanea = algoritmo.snapshot(incluir_eventos=incluir_eventos)
+
+    # Seguir hasta el final, volver al snapshot y terminar de nuevo
+    algoritmo.ejecutar()
+    algoritmo.restore(instantanea)
+    assert algoritmo.tiempo_actual == 25
+    algoritmo.ejecutar()
+
+    assert estado_final(algoritmo) == estado_final(completo)
+
+
+@pytest.mark.parametrize('politica', POLITICAS)
+def test_desde_snapshot_crea_una_copia_independiente(politica):
+    caso = cargar_caso('cpu_ociosa')
+    completo = crear_algoritmo_caso(caso, politica)
+    completo.ejecutar()
+
+    original = crear_algoritmo_caso(caso, politica)
+    original.ejecutar_hasta(20)
+    copia = Planificador.desde_snapshot(original.snapshot())
+    copia.ejecutar()
+
+    assert original.tiempo_actual == 20
+    assert estado_final(copia) == estado_final(completo)
+
+    original.ejecutar()
+    assert estado_final(original) == estado_final(completo)
+
+
+def test_desde_snapshot_sin_eventos_usa_el_registro_dado():
+    caso = cargar_caso('tanda_5p')
+    completo = crear_algoritmo_caso(caso, 'RR')
+    completo.ejecutar()
+
+    original = crear_algoritmo_caso(caso, 'RR')
+    original.ejecutar_hasta(30)
+    registro = RegistroEventos()
+    registro.extend(original.resultados)
+
+    copia = Planificador.desde_snapshot(original.snapshot(incluir_eventos=False), destino_eventos=registro)
+    copia.ejecutar()
+
+    assert estado_final(copia) == estado_final(completo)
+
+
+def test_restore_rechaza_un_snapshot_de_otra_politica():
+    caso = cargar_caso('tanda_5p')
+    instantanea = crear_algoritmo_caso(caso, 'FCFS').snapshot()
+
+    with pytest.raises(TypeError):
+        crear_algoritmo_caso(caso, 'SPN').restore(instantanea)
+
+
+@pytest.mark.parametrize('politica', POLITICAS)
+def test_ejecutar_hasta_detecta_la_simulacion_trabada(politica):
+    completo = crear_algoritmo(politica, TANDA_TRABADA, 0, 0, 0)
+    completo.ejecutar()
+
+    algoritmo = crear_algoritmo(politica, TANDA_TRABADA, 0, 0, 0)
+    pendientes = [algoritmo.ejecutar_hasta(tiempo) for tiempo in (5, 10, 20, 40, 80)]
+
+    # Deja de informar procesos pendientes al trabarse, en el mismo punto que ejecutar()
+    assert pendientes[-1] is False
+    assert algoritmo.truncado
+    assert algoritmo.tiempo_actual == completo.tiempo_actual
+    assert estado_final(algoritmo) == estado_final(completo)
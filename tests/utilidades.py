@@ -0,0 +1,49 @@
+"""
+Utilidades compartidas por las pruebas: tandas de tests/datos y creación de
+los planificadores.
+"""
+
+import json
+import os
+
+from src.simulador.algoritmos import FCFS, SPN, SRTN, RR, PE
+from src.simulador.proceso import Proceso
+
+DIRECTORIO_DATOS = os.path.join(os.path.dirname(__file__), 'datos')
+POLITICAS = {'FCFS': FCFS, 'SPN': SPN, 'SRTN': SRTN, 'RR': RR, 'PE': PE}
+
+
+def cargar_caso(nombre):
+    with open(os.path.join(DIRECTORIO_DATOS, f"{nombre}.json"), encoding='utf-8') as archivo:
+        return json.load(archivo)
+
+
+def crear_procesos(procesos_datos):
+    return [Proceso(p['nombre'], p['tiempo_arribo'], p['cantidad_rafagas_cpu'], p['duracion_rafaga_cpu'],
+                    p['duracion_rafaga_es'], p['prioridad_externa']) for p in procesos_datos]
+
+
+def crear_algoritmo(politica, procesos_datos, tip, tcp, tfp, quantum=3, **opciones):
+    procesos = crear_procesos(procesos_datos)
+    if politica == 'RR':
+        return RR(procesos, tip, tcp, tfp, quantum, **opciones)
+    return POLITICAS[politica](procesos, tip, tcp, tfp, **opciones)
+
+
+def crear_algoritmo_caso(caso, politica, **opciones):
+    return crear_algoritmo(politica, caso['procesos'], caso['tip'], caso['tcp'], caso['tfp'],
+                           caso['quantum'], **opciones)
+
+
+def eventos(algoritmo):
+    return [[e['tiempo'], e['proceso'], e['evento'], e['estado']] for e in algoritmo.resultados]
+
+
+# P1 tiene dos ráfagas con I/O de duración 0: al bloquearse después de la
+# primera, ningún evento futuro lo saca del bloqueo
+TANDA_TRABADA = [
+    {'nombre': 'P0', 'tiempo_arribo': 0, 'cantidad_rafagas_cpu': 1, 'duracion_rafaga_cpu': 10,
+     'duracion_rafaga_es': 1, 'prioridad_externa': 1},
+    {'nombre': 'P1', 'tiempo_arribo': 1, 'cantidad_rafagas_cpu': 2, 'duracion_rafaga_cpu': 3,
+     'duracion_rafaga_es': 0, 'prioridad_externa': 1},
+]